@@ -7,7 +7,8 @@ import json
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeoutError
+from types import MappingProxyType
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
 import logging
 import sys
 import os
@@ -18,13 +19,27 @@ from utils.retry import async_retry, RetryConfig, ErrorCounter
 from utils.user_agents import ua_rotator
 from utils.proxy import proxy_rotator
 from utils.performance import PerformanceMonitor
-from utils.stealth import StealthConfig, create_stealth_context
+from utils.stealth import StealthConfig, create_stealth_context, setup_route_blocking, BLOCKED_RESOURCE_TYPES
 from utils.page_utils import PageUtils
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def build_prefecture_lookup(prefecture_ids: Dict[str, Any]) -> MappingProxyType:
+    """
+    「東京」「東京都」「京都府」などの表記ゆれをまとめて引ける表を作成
+
+    rstrip("都府県")だと「京都府」が「京」になり引けないため、
+    接尾辞なしの都道府県名 → 値 の表に接尾辞付きの形を事前に登録する。
+    """
+    return MappingProxyType({
+        name + suffix: value
+        for name, value in prefecture_ids.items()
+        for suffix in ("", "都", "府", "県")
+    })
+
+
 class BaseScraper(ABC):
     """スクレイピング基底クラス"""
 
@@ -59,6 +74,19 @@ class BaseScraper(ABC):
         if self._realtime_callback:
             self._realtime_callback(count)
 
+    async def setup_context(self, context: BrowserContext):
+        """
+        コンテキスト単位で不要なリソースをブロック
+
+        context.routeで登録するため、以降にnew_pageしたページ全てに適用される。
+        ブロック対象はcreate_stealth_contextのページ単位のルートと共通（utils.stealth）。
+        ページ単位のルートはコンテキストのルートより優先されるため、
+        _setup_route_blockingを設定するページには不要。
+        1回の実行につき1度だけ呼び出す。
+        """
+        await setup_route_blocking(context)
+        logger.info(f"[{self.site_name}] リソースブロック設定: {sorted(BLOCKED_RESOURCE_TYPES)}")
+
     def _load_config(self, config_path: str) -> Dict:
         """設定ファイルを読み込み"""
         config_file = Path(config_path)
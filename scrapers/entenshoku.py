@@ -2,14 +2,156 @@
 エン転職専用スクレイパー
 2024年12月更新 - 実際のサイト構造に対応
 """
+import asyncio
 import re
-from typing import Dict, Any, List, Optional
-from playwright.async_api import Page, Browser
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
+from playwright.async_api import Page, Browser, TimeoutError as PlaywrightTimeoutError
 from .base_scraper import BaseScraper
 import logging
 
+# JSON-LDのパースはorjsonがあれば使う（未インストール時は標準json）
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 logger = logging.getLogger(__name__)
 
+_BASE_URL = "https://employment.en-japan.com"
+
+# 会社名と判定する法人格
+_COMPANY_SUFFIXES = ('株式会社', '有限会社', '合同会社', '社団法人', '財団法人', '医療法人')
+_RE_COMPANY_SUFFIX = re.compile('|'.join(_COMPANY_SUFFIXES))
+
+# カード行の分類（給与行・雇用形態）
+_RE_SALARY_TOKEN = re.compile('月給|年収|万円|時給')
+# 雇用形態（1行に複数ある場合はこの順で優先する）
+_EMPLOYMENT_TYPES = ('正社員', '契約社員', 'アルバイト', 'パート', '業務委託')
+_RE_EMPLOYMENT_TYPE = re.compile('|'.join(_EMPLOYMENT_TYPES))
+
+# 検索結果ページ
+_RE_DESC = re.compile(r"/desc_(?:eng_)?(\d+)")
+_RE_COUNT = re.compile(r"全[_\s]*(\d+)[_\s]*件")
+_RE_NO_RESULT = re.compile(r"(- - -|---)\s*件|求人情報がありませんでした")
+
+# PR記事（広告枠）の先頭行
+_RE_PR_HEADCOUNT = re.compile(r'^\d+名')
+_RE_PR_DAYS = re.compile(r'^あと\d+日')
+
+# スキップ対象の派遣系雇用形態
+_RE_DISPATCH = re.compile('派遣社員|紹介予定派遣|無期雇用派遣')
+
+# 求人カード（詳細リンク）の求人番号・href・テキストを1回のevaluateで取得
+# 求人番号をキーにしたMapで最初のリンクだけを残し、派遣・PR記事はブラウザ側で除外する
+# 判定パターンは上のPython正規表現をそのまま引数で渡す
+_CARD_SOURCES_JS = """([descPattern, dispatchPattern, prPatterns]) => {
+    const desc = new RegExp(descPattern);
+    const dispatch = new RegExp(dispatchPattern);
+    const pr = prPatterns.map(p => new RegExp(p));
+    const unique = new Map();
+    for (const a of document.querySelectorAll("a[href*='/desc_']")) {
+        const href = a.getAttribute('href') || '';
+        const m = href.match(desc);
+        if (m && !unique.has(m[1])) unique.set(m[1], a);
+    }
+    const cards = [];
+    for (const [jobNumber, a] of unique) {
+        const text = a.innerText;
+        const first = text.split('\\n').map(s => s.trim()).find(s => s);
+        if (dispatch.test(text) || (first && pr.some(p => p.test(first)))) continue;
+        cards.push([jobNumber, a.getAttribute('href'), text]);
+    }
+    return {cards, total: unique.size};
+}"""
+_CARD_SOURCES_ARGS = [
+    _RE_DESC.pattern,
+    _RE_DISPATCH.pattern,
+    [_RE_PR_HEADCOUNT.pattern, _RE_PR_DAYS.pattern],
+]
+
+# 詳細ページ
+_RE_LOCATION = re.compile(r"勤務地・交通\s*\n(.+?)(?=\n交通\n|\n配属部署|\n募集要項|\n会社概要|\n■[^\n]*\n[^\n]*都|\Z)", re.DOTALL)
+
+# 給与・雇用形態・仕事内容・応募資格・休日を1回の走査で拾う（グループ名 = detail_dataのキー）
+# 複数行にまたがる仕事内容・応募資格だけをスコープ付きDOTALLにする
+# 先読みで一致を幅0にし、仕事内容の途中にある給与・雇用形態・休日なども拾えるようにする
+# （項目ごとに検索した場合と同じ結果）
+_RE_DETAIL_SECTIONS = re.compile(
+    r"(?=(?P<salary>(?:月給|年収|時給)[：:\s]*[0-9,万円～\-\s]+)"
+    r"|雇用形態[：:\s]*(?P<employment_type>.+?)(?=\n|試用期間)"
+    r"|仕事内容[：:\s]*(?P<job_description>(?s:.+?))(?=\n応募資格|\n募集要項)"
+    r"|応募資格[：:\s]*(?P<qualifications>(?s:.+?))(?=\n募集|\n給与|\n勤務)"
+    r"|(?:休日|休暇)[：:\s]*(?P<holidays>.+?)(?=\n福利|$))"
+)
+# セクションごとの最大文字数
+_DETAIL_SECTION_LIMITS = {"job_description": 500, "qualifications": 300}
+_RE_PERIOD = re.compile(r"掲載期間[：:\s]*(\d{2}/\d{1,2}/\d{1,2})\s*[～~－-]")
+
+# 勤務地行の判定に使う都道府県（正式名称）
+_PREFECTURES = (
+    '北海道', '東京都', '大阪府', '京都府',
+    '青森県', '岩手県', '宮城県', '秋田県', '山形県', '福島県',
+    '茨城県', '栃木県', '群馬県', '埼玉県', '千葉県', '神奈川県',
+    '新潟県', '富山県', '石川県', '福井県', '山梨県', '長野県',
+    '岐阜県', '静岡県', '愛知県', '三重県', '滋賀県', '兵庫県',
+    '奈良県', '和歌山県', '鳥取県', '島根県', '岡山県', '広島県',
+    '山口県', '徳島県', '香川県', '愛媛県', '高知県', '福岡県',
+    '佐賀県', '長崎県', '熊本県', '大分県', '宮崎県', '鹿児島県', '沖縄県',
+)
+# 行頭一致をハッシュ参照で判定するため文字数別に分割（都道府県名は3〜4文字）
+_PREF_3 = frozenset(p for p in _PREFECTURES if len(p) == 3)
+_PREF_4 = frozenset(p for p in _PREFECTURES if len(p) == 4)
+
+# 詳細ページの抽出元（本文テキスト・JSON-LD・h1・ページタイトル）を1回で取得するJS
+_DETAIL_SOURCES_JS = """() => {
+    const h1 = document.querySelector('h1');
+    return {
+        body: document.body ? document.body.innerText : '',
+        json_ld: Array.from(document.querySelectorAll('script[type="application/ld+json"]')).map(s => s.textContent),
+        h1: h1 ? h1.innerText : null,
+        title: document.title,
+    };
+}"""
+
+# JobPostingのbaseSalary.unitText → 給与種別
+_SALARY_UNIT_NAMES = {"HOUR": "時給", "DAY": "日給", "MONTH": "月給", "YEAR": "年収"}
+
+# JobPostingのemploymentType → 雇用形態
+_EMPLOYMENT_TYPE_NAMES = {
+    "FULL_TIME": "正社員",
+    "PART_TIME": "アルバイト・パート",
+    "CONTRACTOR": "業務委託",
+    "TEMPORARY": "契約社員",
+}
+
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+
+# タイトル候補から除外する語（extract_job_card用 / _parse_card_data用）
+_RE_CARD_TITLE_BLACKLIST = re.compile('NEW|積極採用|プロ取材|件')
+_RE_TITLE_BLACKLIST = re.compile('NEW|積極採用|プロ取材|件|応募|正社員|職種未経験|業種未経験')
+
+
+def _has_company_suffix(text: str) -> bool:
+    """法人格を含むか（大半を占める前株・後株はstartswith/endswithで判定し、残りのみ正規表現）"""
+    return (
+        text.startswith(_COMPANY_SUFFIXES)
+        or text.endswith(_COMPANY_SUFFIXES)
+        or _RE_COMPANY_SUFFIX.search(text) is not None
+    )
+
+
+def _scan_detail_sections(body_text: str) -> Dict[str, str]:
+    """詳細ページ本文から給与・雇用形態・仕事内容・応募資格・休日を取得（各項目最初の一致を採用）"""
+    sections: Dict[str, str] = {}
+    for match in _RE_DETAIL_SECTIONS.finditer(body_text):
+        field = match.lastgroup
+        if field not in sections:
+            value = match.group(field).strip()
+            limit = _DETAIL_SECTION_LIMITS.get(field)
+            sections[field] = value[:limit] if limit else value
+    return sections
+
 
 class EntenshokuScraper(BaseScraper):
     """エン転職用スクレイパー"""
@@ -27,9 +169,30 @@ class EntenshokuScraper(BaseScraper):
         "福岡": "福岡県", "佐賀": "佐賀県", "長崎": "長崎県", "熊本": "熊本県", "大分": "大分県", "宮崎": "宮崎県", "鹿児島": "鹿児島県", "沖縄": "沖縄県"
     }
 
+    # scrape_with_detailsで同時に開く詳細ページ数
+    DETAIL_CONCURRENCY = 4
+
     def __init__(self):
         super().__init__(site_name="entenshoku")
         self._current_search_area: Optional[str] = None
+        # (keyword, area) → pagenum直前までの検索URL
+        self._search_url_bases: Dict[Tuple[str, str], str] = {}
+
+    @staticmethod
+    def _split_company_title(raw: str) -> Tuple[Optional[str], str]:
+        """
+        「会社名／職種タイトル」形式を分離
+
+        Returns:
+            (会社名 or None, タイトル)
+            先頭部分に法人格が含まれない場合は分離せず (None, raw) を返す
+        """
+        if "／" not in raw:
+            return None, raw
+        head, _, tail = raw.partition("／")
+        if _has_company_suffix(head):
+            return head.strip(), tail.strip()
+        return None, raw
 
     def generate_search_url(self, keyword: str, area: str, page: int = 1) -> str:
         """
@@ -44,20 +207,26 @@ class EntenshokuScraper(BaseScraper):
         # 現在検索中のエリアを保存
         self._current_search_area = area
 
-        # エリアコードを取得
-        area_codes = self.site_config.get("area_codes", {})
-        areaid = area_codes.get(area, 23)  # デフォルトは東京
+        # ページ番号以外は(keyword, area)で決まるため、組み立て済みのURLを再利用
+        base = self._search_url_bases.get((keyword, area))
+        if base is None:
+            # エリアコードを取得
+            area_codes = self.site_config.get("area_codes", {})
+            areaid = area_codes.get(area, 23)  # デフォルトは東京
 
-        # 職種コードを取得
-        job_categories = self.site_config.get("job_categories", {})
-        occupation = job_categories.get(keyword)
+            # 職種コードを取得
+            job_categories = self.site_config.get("job_categories", {})
+            occupation = job_categories.get(keyword)
 
-        if occupation:
-            # 職種コードがある場合
-            url = f"https://employment.en-japan.com/search/search_list/?areaid={areaid}&occupation={occupation}&refine=1&pagenum={page}"
-        else:
-            # 職種コードがない場合はエリアのみで検索
-            url = f"https://employment.en-japan.com/search/search_list/?areaid={areaid}&refine=1&pagenum={page}"
+            if occupation:
+                # 職種コードがある場合
+                base = f"{_BASE_URL}/search/search_list/?areaid={areaid}&occupation={occupation}&refine=1&pagenum="
+            else:
+                # 職種コードがない場合はエリアのみで検索
+                base = f"{_BASE_URL}/search/search_list/?areaid={areaid}&refine=1&pagenum="
+            self._search_url_bases[(keyword, area)] = base
+
+        url = base + str(page)
 
         logger.info(f"[エン転職] 検索URL生成: {url}")
         return url
@@ -80,41 +249,41 @@ class EntenshokuScraper(BaseScraper):
             # 詳細ページへのリンク
             href = await card_element.get_attribute("href")
             if href:
-                if href.startswith("/"):
-                    href = f"https://employment.en-japan.com{href}"
+                if href[:1] == "/":
+                    href = _BASE_URL + href
                 job_data["page_url"] = href
 
                 # 求人番号を抽出（例: /desc_1393025/ または /desc_eng_7365499/ → 1393025 or 7365499）
-                match = re.search(r"/desc_(?:eng_)?(\d+)", href)
+                match = _RE_DESC.search(href)
                 if match:
                     job_data["job_number"] = match.group(1)
 
             # カード内のテキストを取得
             card_text = await card_element.inner_text()
-            lines = [line.strip() for line in card_text.split('\n') if line.strip()]
+            # 途中で打ち切るためリスト化せず必要な行だけstripする
+            lines = (s for s in (line.strip() for line in card_text.split('\n')) if s)
+
+            # 1回の走査で給与行とタイトル候補（先頭5行の長い文字列で職種っぽいもの）を探す
+            title_candidate = ""
+            for idx, line in enumerate(lines):
+                if not job_data["salary"] and _RE_SALARY_TOKEN.search(line):
+                    job_data["salary"] = line
+                if not title_candidate and idx < 5 and len(line) > 5 and not _RE_CARD_TITLE_BLACKLIST.search(line):
+                    title_candidate = line
+                if job_data["salary"] and (title_candidate or idx >= 4):
+                    break
 
             # タイトル（通常は最初の方にある）- 会社名と職種を分離
-            raw_title = ""
+            raw_title = title_candidate
             title_elem = await card_element.query_selector("h2, h3, [class*='title'], [class*='Title']")
             if title_elem:
                 raw_title = (await title_elem.inner_text()).strip()
-            elif lines:
-                # タイトル候補を探す（長い文字列で職種っぽいもの）
-                for line in lines[:5]:
-                    if len(line) > 5 and not any(x in line for x in ['NEW', '積極採用', 'プロ取材', '件']):
-                        raw_title = line
-                        break
 
             # 「会社名／職種タイトル」形式を分離
-            if raw_title and "／" in raw_title:
-                parts = raw_title.split("／", 1)
-                if any(x in parts[0] for x in ['株式会社', '有限会社', '合同会社', '社団法人', '財団法人', '医療法人']):
-                    job_data["company_name"] = parts[0].strip()
-                    job_data["title"] = parts[1].strip() if len(parts) > 1 else raw_title
-                else:
-                    job_data["title"] = raw_title
-            elif raw_title:
-                job_data["title"] = raw_title
+            if raw_title:
+                company, job_data["title"] = self._split_company_title(raw_title)
+                if company:
+                    job_data["company_name"] = company
 
             # 会社名がまだ取得できていない場合
             if not job_data["company_name"]:
@@ -122,12 +291,6 @@ class EntenshokuScraper(BaseScraper):
                 if company_elem:
                     job_data["company_name"] = (await company_elem.inner_text()).strip()
 
-            # 給与（月給、年収などを含む行を探す）
-            for line in lines:
-                if any(x in line for x in ['月給', '年収', '万円', '時給']):
-                    job_data["salary"] = line
-                    break
-
             # 勤務地
             location_elem = await card_element.query_selector("[class*='location'], [class*='area']")
             if location_elem:
@@ -138,103 +301,51 @@ class EntenshokuScraper(BaseScraper):
 
         return job_data
 
-    async def _extract_card_data(self, card) -> Optional[Dict[str, Any]]:
+    def _parse_card_data(self, job_number: str, href: str, card_text: str) -> Optional[Dict[str, Any]]:
         """
-        求人カードからデータを抽出（search_jobs用）
+        求人カードの求人番号・href・テキストからデータを抽出（search_jobs用）
         エン転職は複雑なカード構造のため、基本情報のみ抽出し詳細は別途取得
-        派遣社員・紹介予定派遣はスキップ
+        派遣社員・紹介予定派遣・PR記事は_CARD_SOURCES_JSで除外済み
         """
         try:
-            data = {}
+            # 求人番号は_CARD_SOURCES_JSでhrefから抽出済み（desc_eng_も対応）
+            data = {"job_number": job_number}
 
-            # 詳細ページへのリンク
-            href = await card.get_attribute("href")
             if href:
                 # クエリパラメータを除去してクリーンなURLを生成
-                base_href = href.split('?')[0]
-                if base_href.startswith("/"):
-                    base_href = f"https://employment.en-japan.com{base_href}"
+                base_href = href.partition('?')[0]
+                if base_href[:1] == "/":
+                    base_href = _BASE_URL + base_href
                 data["page_url"] = base_href
 
-                # 求人番号を抽出（desc_eng_も対応）
-                match = re.search(r"/desc_(?:eng_)?(\d+)", href)
-                if match:
-                    data["job_number"] = match.group(1)
-
-            # カード内のテキストを取得
-            card_text = await card.inner_text()
-            lines = [line.strip() for line in card_text.split('\n') if line.strip()]
-
-            # 派遣社員・紹介予定派遣をスキップ
-            dispatch_keywords = ['派遣社員', '紹介予定派遣', '無期雇用派遣']
-            card_text_joined = ' '.join(lines)
-            for keyword in dispatch_keywords:
-                if keyword in card_text_joined:
-                    logger.debug(f"[エン転職] 派遣求人をスキップ: {data.get('job_number', 'unknown')} ({keyword})")
-                    return None
-
-            # PR記事（広告枠）をスキップ
-            # 「30名以上」「100名」「あと3日」などで始まるものはPR記事
-            if lines:
-                first_line = lines[0]
-                # 「XX名」「XX名以上」で始まるパターン
-                if re.match(r'^\d+名', first_line):
-                    logger.debug(f"[エン転職] PR記事をスキップ（人数表示）: {data.get('job_number', 'unknown')}")
-                    return None
-                # 「あとX日」で始まるパターン
-                if re.match(r'^あと\d+日', first_line):
-                    logger.debug(f"[エン転職] PR記事をスキップ（残り日数）: {data.get('job_number', 'unknown')}")
-                    return None
-
-            # 雇用形態を抽出
-            employment_types = ['正社員', '契約社員', 'アルバイト', 'パート', '業務委託']
-            for line in lines:
-                for emp_type in employment_types:
-                    if emp_type in line:
-                        data["employment_type"] = emp_type
-                        break
-                if data.get("employment_type"):
-                    break
+            lines = [s for s in (line.strip() for line in card_text.split('\n')) if s]
 
-            # タイトル（最初の意味のある長い文字列）
-            for line in lines[:5]:
-                if len(line) > 8 and not any(x in line for x in ['NEW', '積極採用', 'プロ取材', '件', '応募', '正社員', '職種未経験', '業種未経験']):
+            # 1回の走査で給与・雇用形態・タイトル（先頭5行の意味のある長い文字列）を抽出
+            raw_title = None
+            for idx, line in enumerate(lines):
+                if "salary" not in data and _RE_SALARY_TOKEN.search(line):
+                    data["salary"] = line
+                if "employment_type" not in data and _RE_EMPLOYMENT_TYPE.search(line):
+                    # 行内の出現位置ではなく_EMPLOYMENT_TYPESの優先順で選ぶ
+                    data["employment_type"] = next(t for t in _EMPLOYMENT_TYPES if t in line)
+                if raw_title is None and idx < 5 and len(line) > 8 and not _RE_TITLE_BLACKLIST.search(line):
                     raw_title = line
-                    # 「会社名／職種タイトル」形式を分離
-                    if "／" in raw_title:
-                        parts = raw_title.split("／", 1)
-                        # 最初の部分が会社名（株式会社、有限会社などを含む場合）
-                        if any(x in parts[0] for x in ['株式会社', '有限会社', '合同会社', '社団法人', '財団法人', '医療法人']):
-                            data["company_name"] = parts[0].strip()
-                            data["title"] = parts[1].strip() if len(parts) > 1 else raw_title
-                        else:
-                            data["title"] = raw_title
-                    else:
-                        data["title"] = raw_title
-                    break
+
+            if raw_title:
+                # 「会社名／職種タイトル」形式を分離
+                company, data["title"] = self._split_company_title(raw_title)
+                if company:
+                    data["company_name"] = company
 
             # タイトルが取れなければリンクテキスト全体を使用
             if not data.get("title") and lines:
                 # 全テキストから意味のある部分を抽出
                 full_text = " ".join(lines[:3])
                 if len(full_text) > 10:
-                    raw_title = full_text[:100]
                     # 「会社名／職種タイトル」形式を分離
-                    if "／" in raw_title:
-                        parts = raw_title.split("／", 1)
-                        if any(x in parts[0] for x in ['株式会社', '有限会社', '合同会社', '社団法人', '財団法人', '医療法人']):
-                            data["company_name"] = parts[0].strip()
-                            data["title"] = parts[1].strip() if len(parts) > 1 else raw_title
-                        else:
-                            data["title"] = raw_title
-                    else:
-                        data["title"] = raw_title
-
-            # 給与
-            for line in lines:
-                if any(x in line for x in ['月給', '年収', '万円', '時給']):
-                    data["salary"] = line
-                    break
+                    company, data["title"] = self._split_company_title(full_text[:100])
+                    if company:
+                        data["company_name"] = company
 
             if data.get("page_url") and data.get("job_number"):
                 return data
@@ -243,15 +354,15 @@ class EntenshokuScraper(BaseScraper):
                 return None
 
         except Exception as e:
-            logger.error(f"Error extracting card data: {e}")
+            logger.error(f"Error parsing card data: {e}")
             return None
 
     async def search_jobs(self, page: Page, keyword: str, area: str, max_pages: int = 5) -> List[Dict[str, Any]]:
         """
         求人検索を実行し、結果を返す
         """
-        all_jobs = []
-        seen_job_numbers = set()  # 重複排除用
+        # 求人番号 → 求人データ（挿入順を保持しつつ重複排除）
+        all_jobs: Dict[str, Dict[str, Any]] = {}
 
         for page_num in range(1, max_pages + 1):
             url = self.generate_search_url(keyword, area, page_num)
@@ -259,7 +370,11 @@ class EntenshokuScraper(BaseScraper):
 
             try:
                 response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                await page.wait_for_timeout(3000)
+                # 固定待機ではなく求人リンクの描画を待つ（0件ページでは描画されないためタイムアウトで続行）
+                try:
+                    await page.wait_for_selector("a[href*='/desc_']", timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
 
                 if response and response.status >= 400:
                     logger.warning(f"[エン転職] HTTPエラー {response.status}: {url}")
@@ -269,8 +384,8 @@ class EntenshokuScraper(BaseScraper):
                 page_text = await page.inner_text("body")
 
                 # 「全X件を表示」または「- - -件」のパターンを確認
-                result_count_match = re.search(r"全[_\s]*(\d+)[_\s]*件", page_text)
-                no_result_match = re.search(r"(- - -|---)\s*件|求人情報がありませんでした", page_text)
+                result_count_match = _RE_COUNT.search(page_text)
+                no_result_match = _RE_NO_RESULT.search(page_text)
 
                 if no_result_match and not result_count_match:
                     logger.info(f"[エン転職] 検索結果0件のため終了")
@@ -284,63 +399,106 @@ class EntenshokuScraper(BaseScraper):
                         logger.info(f"[エン転職] 検索結果0件のため終了")
                         break
 
-                # 求人カードを取得
-                # /desc_XXXXXX/ または /desc_XXXXXX/?... 形式のリンクを取得
-                card_selector = "a[href*='/desc_']"
-                all_links = await page.query_selector_all(card_selector)
-
-                # 求人番号でグループ化し、重複リンクを除外
-                job_cards_dict = {}
-                for link in all_links:
-                    href = await link.get_attribute("href")
-                    if href:
-                        match = re.search(r"/desc_(?:eng_)?(\d+)", href)
-                        if match:
-                            job_num = match.group(1)
-                            # まだ登録されていない求人番号のみ追加
-                            if job_num not in job_cards_dict:
-                                job_cards_dict[job_num] = link
-
-                job_cards = list(job_cards_dict.values())
-
-                if len(job_cards) == 0:
+                # 求人カード（/desc_XXXXXX/ 形式のリンク）を求人番号ごとに1件ずつ取得
+                # 派遣・PR記事の除外まで1回のevaluateで済ませ、以降はPythonのみで解析する
+                card_sources = await page.evaluate(_CARD_SOURCES_JS, _CARD_SOURCES_ARGS)
+
+                if card_sources["total"] == 0:
                     logger.info(f"[エン転職] ページ{page_num}で求人なし、終了")
                     break
 
-                # 発見された求人番号をログ出力
-                found_job_numbers = list(job_cards_dict.keys())
-                logger.debug(f"[エン転職] 発見した求人番号: {found_job_numbers}")
-                logger.info(f"[エン転職] ページ{page_num}で{len(job_cards)}件のリンクを発見")
+                logger.info(f"[エン転職] ページ{page_num}で{card_sources['total']}件のリンクを発見")
+                skipped = card_sources["total"] - len(card_sources["cards"])
+                if skipped:
+                    logger.debug(f"[エン転職] 派遣・PR記事を{skipped}件スキップ")
 
                 page_jobs = 0
-                for card in job_cards:
-                    try:
-                        job_data = await self._extract_card_data(card)
-                        if job_data and job_data.get("job_number"):
-                            # 重複チェック
-                            job_num = job_data["job_number"]
-                            if job_num not in seen_job_numbers:
-                                seen_job_numbers.add(job_num)
-                                job_data["site"] = "エン転職"
-                                all_jobs.append(job_data)
-                                page_jobs += 1
-                    except Exception as e:
-                        logger.error(f"Error extracting job card: {e}")
-                        continue
+                for job_number, href, card_text in card_sources["cards"]:
+                    job_data = self._parse_card_data(job_number, href, card_text)
+                    if job_data and job_data.get("job_number"):
+                        # 重複チェック
+                        job_num = job_data["job_number"]
+                        if job_num not in all_jobs:
+                            job_data["site"] = "エン転職"
+                            all_jobs[job_num] = job_data
+                            page_jobs += 1
 
                 logger.info(f"[エン転職] ページ{page_num}で{page_jobs}件の新規求人を追加（累計: {len(all_jobs)}件）")
 
                 # リアルタイム件数報告
                 self._report_count(len(all_jobs))
 
-                # 次ページへの待機
+                # 次ページへの待機（サイトへのアクセス間隔を保つため）
                 await page.wait_for_timeout(1500)
 
             except Exception as e:
                 logger.error(f"Error fetching page {page_num}: {e}")
                 break
 
-        return all_jobs
+        return list(all_jobs.values())
+
+    @staticmethod
+    def _format_base_salary(base_salary: Any) -> str:
+        """JobPostingのbaseSalaryを「月給250,000円～300,000円」形式に整形"""
+        if not isinstance(base_salary, dict):
+            return ""
+        value = base_salary.get("value")
+        if not isinstance(value, dict):
+            value = {"value": value}
+
+        def yen(amount) -> str:
+            try:
+                return f"{int(float(amount)):,}円"
+            except (TypeError, ValueError):
+                return ""
+
+        unit = _SALARY_UNIT_NAMES.get(str(value.get("unitText", "")).upper(), "")
+        if value.get("minValue") is not None:
+            low = yen(value["minValue"])
+            high = yen(value.get("maxValue")) if value.get("maxValue") is not None else ""
+            amount = f"{low}～{high}" if low else ""
+        else:
+            amount = yen(value.get("value"))
+        return f"{unit}{amount}" if amount else ""
+
+    @classmethod
+    def _apply_job_posting(cls, ld_data: Dict[str, Any], detail_data: Dict[str, Any]):
+        """JSON-LD(JobPosting)から詳細項目を取得"""
+        title = ld_data.get("title")
+        if isinstance(title, str) and title.strip():
+            detail_data["title"] = cls._split_company_title(title.strip())[1]
+
+        salary = cls._format_base_salary(ld_data.get("baseSalary"))
+        if salary:
+            detail_data["salary"] = salary
+
+        job_location = ld_data.get("jobLocation")
+        if isinstance(job_location, list):
+            job_location = job_location[0] if job_location else None
+        if isinstance(job_location, dict):
+            address = job_location.get("address")
+            if isinstance(address, dict):
+                location = f"{address.get('addressRegion', '')}{address.get('addressLocality', '')}".strip()
+                if location:
+                    detail_data["location"] = location[:200]
+
+        employment_type = ld_data.get("employmentType")
+        if isinstance(employment_type, list):
+            employment_type = employment_type[0] if employment_type else None
+        if isinstance(employment_type, str) and employment_type:
+            detail_data["employment_type"] = _EMPLOYMENT_TYPE_NAMES.get(employment_type, employment_type)
+
+        description = ld_data.get("description")
+        if isinstance(description, str) and description:
+            detail_data["job_description"] = _RE_HTML_TAG.sub("", description).strip()[:500]
+
+        qualifications = ld_data.get("qualifications") or ld_data.get("experienceRequirements")
+        if isinstance(qualifications, str) and qualifications:
+            detail_data["qualifications"] = _RE_HTML_TAG.sub("", qualifications).strip()[:300]
+
+        date_posted = ld_data.get("datePosted")
+        if isinstance(date_posted, str) and len(date_posted) >= 10:
+            detail_data["posted_date"] = date_posted[:10]
 
     async def extract_detail_info(self, page: Page, url: str) -> Dict[str, Any]:
         """詳細ページから追加情報を取得"""
@@ -348,20 +506,26 @@ class EntenshokuScraper(BaseScraper):
 
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(2000)
+            # タイトルまたはJSON-LDが揃った時点で抽出を開始（scriptは非表示のためattachedで判定）
+            try:
+                await page.wait_for_selector("h1, script[type='application/ld+json']", state="attached", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
 
-            # ページ全体のテキストを取得
-            body_text = await page.inner_text("body")
+            # ページ全体のテキスト・JSON-LD・h1・ページタイトルを1回のevaluateで取得
+            sources = await page.evaluate(_DETAIL_SOURCES_JS)
+            page_title = sources["title"]
 
-            # JSON-LDスキーマから会社名と会社住所を取得（最も確実）
-            import json
+            # JSON-LDスキーマから会社名・会社住所・求人項目を取得（最も確実）
+            # scriptの中身はtextContentで受け取っているのでレイアウト計算は発生しない
             try:
-                json_ld_scripts = await page.query_selector_all('script[type="application/ld+json"]')
-                logger.debug(f"[エン転職] JSON-LDスクリプト数: {len(json_ld_scripts)}")
-                for script in json_ld_scripts:
-                    script_content = await script.inner_text()
+                logger.debug(f"[エン転職] JSON-LDスクリプト数: {len(sources['json_ld'])}")
+                for script_content in sources["json_ld"]:
+                    # 会社情報を含まないブロック（BreadcrumbList等）はパースせずスキップ
+                    if 'hiringOrganization' not in script_content and '"Organization"' not in script_content:
+                        continue
                     try:
-                        ld_data = json.loads(script_content)
+                        ld_data = _json.loads(script_content)
                         # 配列の場合は最初の要素を使用
                         if isinstance(ld_data, list) and len(ld_data) > 0:
                             ld_data = ld_data[0]
@@ -384,12 +548,14 @@ class EntenshokuScraper(BaseScraper):
                                                 logger.debug(f"[エン転職] JSON-LDから会社住所取得: {street}")
                                         elif isinstance(addr, str):
                                             detail_data["company_address"] = addr
-                                    break
+                                if ld_data.get("@type") == "JobPosting":
+                                    self._apply_job_posting(ld_data, detail_data)
+                                break
                             elif "name" in ld_data and ld_data.get("@type") == "Organization":
                                 detail_data["company_name"] = ld_data["name"]
                                 logger.debug(f"[エン転職] JSON-LD Organizationから会社名取得: {ld_data['name']}")
                                 break
-                    except json.JSONDecodeError as e:
+                    except _json.JSONDecodeError as e:
                         logger.debug(f"[エン転職] JSON-LDパースエラー: {e}")
             except Exception as e:
                 logger.debug(f"[エン転職] JSON-LD取得エラー: {e}")
@@ -419,78 +585,55 @@ class EntenshokuScraper(BaseScraper):
                         pass
 
             # タイトル（h1タグ）- 会社名と職種を分離
-            title_elem = await page.query_selector("h1")
-            if title_elem:
-                raw_title = (await title_elem.inner_text()).strip()
+            if sources["h1"] is not None:
+                raw_title = sources["h1"].strip()
                 # 「会社名／職種タイトル」形式を分離
-                if "／" in raw_title:
-                    parts = raw_title.split("／", 1)
-                    # 最初の部分が会社名（株式会社、有限会社などを含む場合）
-                    if any(x in parts[0] for x in ['株式会社', '有限会社', '合同会社', '社団法人', '財団法人', '医療法人']):
-                        if not detail_data.get("company_name"):
-                            detail_data["company_name"] = parts[0].strip()
-                        detail_data["title"] = parts[1].strip() if len(parts) > 1 else raw_title
-                    else:
-                        detail_data["title"] = raw_title
-                else:
-                    detail_data["title"] = raw_title
+                company, detail_data["title"] = self._split_company_title(raw_title)
+                if company and not detail_data.get("company_name"):
+                    detail_data["company_name"] = company
 
             # 会社名がまだ取得できていない場合、h2タグから取得
             if not detail_data.get("company_name"):
                 company_elem = await page.query_selector("h2")
                 if company_elem:
                     company_text = (await company_elem.inner_text()).strip()
-                    if company_text and any(x in company_text for x in ['株式会社', '有限会社', '合同会社', '社団法人', '財団法人', '医療法人']):
+                    if company_text and _has_company_suffix(company_text):
                         detail_data["company_name"] = company_text
 
             # 会社名がまだ取得できていない場合、ページタイトルから取得
             # 「株式会社○○の転職・求人情報｜エン転職｜...」形式
             if not detail_data.get("company_name"):
-                try:
-                    page_title = await page.title()
-                    if page_title and "の転職・求人情報" in page_title:
-                        # 「会社名の転職・求人情報」から会社名を抽出
-                        company_from_title = page_title.split("の転職・求人情報")[0].strip()
-                        if company_from_title and len(company_from_title) > 2:
-                            detail_data["company_name"] = company_from_title
-                            logger.debug(f"ページタイトルから会社名を取得: {company_from_title}")
-                except Exception as e:
-                    logger.debug(f"ページタイトルからの会社名取得失敗: {e}")
-
-            # 給与の抽出
-            salary_match = re.search(r"(月給|年収|時給)[：:\s]*([0-9,万円～\-\s]+)", body_text)
-            if salary_match:
-                detail_data["salary"] = salary_match.group(0).strip()
+                if page_title and "の転職・求人情報" in page_title:
+                    # 「会社名の転職・求人情報」から会社名を抽出
+                    company_from_title = page_title.split("の転職・求人情報")[0].strip()
+                    if company_from_title and len(company_from_title) > 2:
+                        detail_data["company_name"] = company_from_title
+                        logger.debug(f"ページタイトルから会社名を取得: {company_from_title}")
+
+            # 本文テキストから取得できた項目はJSON-LDの値より優先する
+            # （休日・掲載期間は本文にしかなく、給与・勤務地も本文の表記を使う）
+            body_text = sources["body"]
+
+            # 給与・雇用形態・仕事内容・応募資格・休日（各項目最初の一致を採用）
+            detail_data.update(_scan_detail_sections(body_text))
 
             # 勤務地の抽出（「勤務地・交通」セクションから）
             # 「勤務地・交通」から次のセクション（交通、配属部署、等）までを抽出
-            location_match = re.search(r"勤務地・交通\s*\n(.+?)(?=\n交通\n|\n配属部署|\n募集要項|\n会社概要|\n■[^\n]*\n[^\n]*都|\Z)", body_text, re.DOTALL)
+            location_match = _RE_LOCATION.search(body_text)
             if location_match:
                 location_text = location_match.group(1).strip()
-                # 最初の住所情報を取得
-                lines = [l.strip() for l in location_text.split('\n') if l.strip()]
+                # 最初の住所情報を取得（確認するのは先頭10行のみ）
+                lines = list(islice((s for s in (line.strip() for line in location_text.split('\n')) if s), 10))
                 location_result = None
 
                 # 都道府県を含む具体的な住所行を探す
-                prefectures = ['北海道', '東京都', '大阪府', '京都府',
-                              '青森県', '岩手県', '宮城県', '秋田県', '山形県', '福島県',
-                              '茨城県', '栃木県', '群馬県', '埼玉県', '千葉県', '神奈川県',
-                              '新潟県', '富山県', '石川県', '福井県', '山梨県', '長野県',
-                              '岐阜県', '静岡県', '愛知県', '三重県', '滋賀県', '兵庫県',
-                              '奈良県', '和歌山県', '鳥取県', '島根県', '岡山県', '広島県',
-                              '山口県', '徳島県', '香川県', '愛媛県', '高知県', '福岡県',
-                              '佐賀県', '長崎県', '熊本県', '大分県', '宮崎県', '鹿児島県', '沖縄県']
-
-                for line in lines[:10]:  # 最初の10行まで確認
+                for line in lines:
                     # ■マーク付きの店舗名は住所として使わない
                     if line.startswith('■'):
                         continue
                     # 都道府県で始まる住所行
-                    for pref in prefectures:
-                        if line.startswith(pref):
-                            location_result = line
-                            break
-                    if location_result:
+                    if line[:3] in _PREF_3 or line[:4] in _PREF_4:
+                        location_result = line
                         break
 
                 # 具体的住所が見つからない場合は概要行を取得
@@ -503,28 +646,8 @@ class EntenshokuScraper(BaseScraper):
                 if location_result:
                     detail_data["location"] = location_result[:200]
 
-            # 雇用形態
-            employment_match = re.search(r"雇用形態[：:\s]*(.+?)(?=\n|試用期間)", body_text)
-            if employment_match:
-                detail_data["employment_type"] = employment_match.group(1).strip()
-
-            # 仕事内容
-            job_desc_match = re.search(r"仕事内容[：:\s]*(.+?)(?=\n応募資格|\n募集要項)", body_text, re.DOTALL)
-            if job_desc_match:
-                detail_data["job_description"] = job_desc_match.group(1).strip()[:500]
-
-            # 応募資格
-            qualification_match = re.search(r"応募資格[：:\s]*(.+?)(?=\n募集|\n給与|\n勤務)", body_text, re.DOTALL)
-            if qualification_match:
-                detail_data["qualifications"] = qualification_match.group(1).strip()[:300]
-
-            # 休日・休暇
-            holiday_match = re.search(r"(休日|休暇)[：:\s]*(.+?)(?=\n福利|$)", body_text)
-            if holiday_match:
-                detail_data["holidays"] = holiday_match.group(2).strip()
-
             # 掲載期間から掲載日を抽出（例: 24/11/28 ～ 25/1/8 → 24/11/28）
-            period_match = re.search(r"掲載期間[：:\s]*(\d{2}/\d{1,2}/\d{1,2})\s*[～~－-]", body_text)
+            period_match = _RE_PERIOD.search(body_text)
             if period_match:
                 posted_date_raw = period_match.group(1)
                 # YY/MM/DD を YYYY-MM-DD に変換
@@ -569,10 +692,46 @@ class EntenshokuScraper(BaseScraper):
 
         return False
 
+    async def _fetch_detail_with_retry(self, page: Page, job: Dict[str, Any], index: int, total: int,
+                                       max_retries: int = 3) -> Dict[str, Any]:
+        """
+        詳細情報を取得（会社名が取得できるまで最大max_retries回リトライ）
+        """
+        logger.info(f"[エン転職] 詳細取得 {index+1}/{total}: {job['page_url']}")
+
+        detail_data = {}
+        for retry in range(max_retries):
+            try:
+                detail_data = await self.extract_detail_info(page, job["page_url"])
+
+                # 会社名が取得できたかチェック
+                if detail_data.get("company_name"):
+                    if retry > 0:
+                        logger.info(f"[エン転職] リトライ{retry+1}回目で会社名取得成功: {detail_data['company_name']}")
+                    break
+                else:
+                    if retry < max_retries - 1:
+                        logger.warning(f"[エン転職] 会社名取得失敗、リトライ {retry+2}/{max_retries}: {job['page_url']}")
+                        await page.wait_for_timeout(2000)  # リトライ前に少し長めに待機
+                    else:
+                        logger.warning(f"[エン転職] 会社名取得失敗（リトライ上限）: {job['page_url']}")
+
+            except Exception as e:
+                if retry < max_retries - 1:
+                    logger.warning(f"[エン転職] 詳細取得エラー、リトライ {retry+2}/{max_retries}: {e}")
+                    await page.wait_for_timeout(2000)
+                else:
+                    logger.error(f"Error fetching detail for job {index+1} after {max_retries} retries: {e}")
+
+        return detail_data
+
     async def scrape_with_details(self, page: Page, keyword: str, area: str,
                                    max_pages: int = 5, fetch_details: bool = True) -> List[Dict[str, Any]]:
         """
         求人検索と詳細情報取得を実行
+
+        詳細取得は検索に使ったページのコンテキストから最大DETAIL_CONCURRENCY枚の
+        ページプールを作り、並行して行う
         """
         # まず検索結果を取得
         jobs = await self.search_jobs(page, keyword, area, max_pages)
@@ -580,51 +739,50 @@ class EntenshokuScraper(BaseScraper):
         if not fetch_details:
             return jobs
 
-        # 各求人の詳細情報を取得
-        filtered_jobs = []
-        skipped_count = 0
-        max_retries = 3  # 最大リトライ回数
-
-        for i, job in enumerate(jobs):
-            if job.get("page_url"):
-                logger.info(f"[エン転職] 詳細取得 {i+1}/{len(jobs)}: {job['page_url']}")
+        targets = [job for job in jobs if job.get("page_url")]
+        if not targets:
+            return []
 
-                # リトライロジック：会社名が取得できるまで最大3回リトライ
-                detail_data = {}
-                for retry in range(max_retries):
-                    try:
-                        detail_data = await self.extract_detail_info(page, job["page_url"])
+        # ページプールを作成（検索用ページも1枚として使用）
+        pool_size = min(self.DETAIL_CONCURRENCY, len(targets))
+        context = page.context
+        extra_pages: List[Page] = []
+        page_pool: asyncio.Queue = asyncio.Queue()
+        page_pool.put_nowait(page)
 
-                        # 会社名が取得できたかチェック
-                        if detail_data.get("company_name"):
-                            if retry > 0:
-                                logger.info(f"[エン転職] リトライ{retry+1}回目で会社名取得成功: {detail_data['company_name']}")
-                            break
-                        else:
-                            if retry < max_retries - 1:
-                                logger.warning(f"[エン転職] 会社名取得失敗、リトライ {retry+2}/{max_retries}: {job['page_url']}")
-                                await page.wait_for_timeout(2000)  # リトライ前に少し長めに待機
-                            else:
-                                logger.warning(f"[エン転職] 会社名取得失敗（リトライ上限）: {job['page_url']}")
-
-                    except Exception as e:
-                        if retry < max_retries - 1:
-                            logger.warning(f"[エン転職] 詳細取得エラー、リトライ {retry+2}/{max_retries}: {e}")
-                            await page.wait_for_timeout(2000)
-                        else:
-                            logger.error(f"Error fetching detail for job {i+1} after {max_retries} retries: {e}")
-
-                job.update(detail_data)
-
-                # 勤務地が検索エリアと一致するかチェック
-                location = job.get("location", "")
-                if self._location_matches_area(location, area):
-                    filtered_jobs.append(job)
-                else:
-                    skipped_count += 1
-                    logger.debug(f"[エン転職] 勤務地不一致でスキップ: {job.get('company_name', 'unknown')} - 勤務地: {location}, 検索エリア: {area}")
+        async def fetch_detail(index: int, job: Dict[str, Any]):
+            detail_page = await page_pool.get()
+            try:
+                job.update(await self._fetch_detail_with_retry(detail_page, job, index, len(targets)))
+                # ページごとのアクセス間隔を保つ
+                await detail_page.wait_for_timeout(1000)
+            finally:
+                page_pool.put_nowait(detail_page)
 
-                await page.wait_for_timeout(1000)
+        try:
+            # 開いた分だけfinallyで閉じられるよう、1枚ずつリストに追加する
+            for _ in range(pool_size - 1):
+                extra_page = await context.new_page()
+                extra_pages.append(extra_page)
+                if hasattr(context, '_block_resources') and context._block_resources:
+                    await context._setup_route_blocking(extra_page)
+                page_pool.put_nowait(extra_page)
+
+            await asyncio.gather(*[fetch_detail(i, job) for i, job in enumerate(targets)])
+        finally:
+            for extra_page in extra_pages:
+                await extra_page.close()
+
+        # 勤務地が検索エリアと一致するかチェック
+        filtered_jobs = []
+        skipped_count = 0
+        for job in targets:
+            location = job.get("location", "")
+            if self._location_matches_area(location, area):
+                filtered_jobs.append(job)
+            else:
+                skipped_count += 1
+                logger.debug(f"[エン転職] 勤務地不一致でスキップ: {job.get('company_name', 'unknown')} - 勤務地: {location}, 検索エリア: {area}")
 
         if skipped_count > 0:
             logger.info(f"[エン転職] 勤務地不一致でスキップした求人: {skipped_count}件")
@@ -8,9 +8,13 @@ https://www.hellowork.mhlw.go.jp/kensaku/GECA110010.do
 import asyncio
 import re
 import logging
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 from .base_scraper import BaseScraper
+from utils.rate_limit import TokenBucket
 
 
 # 都道府県コード (01-47)
@@ -427,31 +431,295 @@ KEYWORD_TO_CATEGORY: Dict[str, str] = {
     "洗い場": "099", "用務員": "099", "搬入": "095", "搬出": "095", "荷物": "095",
 }
 
+# マッピングは実行中に変更しないため読み取り専用にする
+PREFECTURE_CODES = MappingProxyType(PREFECTURE_CODES)
+JOB_CATEGORY_CODES = MappingProxyType(JOB_CATEGORY_CODES)
+KEYWORD_TO_CATEGORY = MappingProxyType(KEYWORD_TO_CATEGORY)
+
 # 逆引き用
 PREFECTURE_CODE_TO_NAME: Dict[str, str] = {v: k for k, v in PREFECTURE_CODES.items()}
 JOB_CATEGORY_CODE_TO_NAME: Dict[str, str] = {v: k for k, v in JOB_CATEGORY_CODES.items()}
 
 
+def _build_fragment_index(mapping: Dict[str, str]) -> Dict[str, str]:
+    """キーの部分文字列 → 値 の索引を作成
+
+    「検索語がキーの一部」の判定を1回の辞書参照にするためのもの。
+    同じ部分文字列を含むキーが複数ある場合は、先頭一致するキーを優先し
+    （「京都」→「東京都」ではなく「京都府」）、その中では定義順で先のキーを採用する。
+    """
+    index: Dict[str, str] = {}
+    for key, value in mapping.items():
+        for end in range(1, len(key) + 1):
+            index.setdefault(key[:end], value)
+    for key, value in mapping.items():
+        for start in range(1, len(key)):
+            for end in range(start + 1, len(key) + 1):
+                index.setdefault(key[start:end], value)
+    return index
+
+
+# 都道府県名に含まれる文字列 → 都道府県コード（「東京」→「13」など）
+_PREFECTURE_BY_FRAGMENT = _build_fragment_index(PREFECTURE_CODES)
+# エリア名に含まれる都道府県名を探す正規表現
+_RE_PREFECTURE_NAMES = re.compile("|".join(map(re.escape, PREFECTURE_CODES)))
+
+# 登録キーワードに含まれる文字列 → 職業分類コード（「介」→「介護事務」のコードなど）
+_CATEGORY_BY_FRAGMENT = _build_fragment_index(KEYWORD_TO_CATEGORY)
+
+# 検索キーワードに含まれる登録キーワードを1回の走査で列挙する正規表現
+# 先読みで各開始位置の一致を重ならないよう拾い、長いキーワードを先に並べて位置ごとに最長一致にする
+_RE_CATEGORY_KEYWORDS = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(KEYWORD_TO_CATEGORY, key=len, reverse=True))) + "))"
+)
+
+# エラーページ・検索結果0件ページの判定文言
+_ERROR_INDICATORS = (
+    "システムの混雑",
+    "続行不可能なエラー",
+    "エラーが発生しました",
+    "システムエラー",
+    "時間をおいて再度",
+)
+_NO_RESULTS_PATTERNS = (
+    "該当する求人情報はありません",
+    "該当する求人がありません",
+    "条件に合う求人がありません",
+    "検索結果がありません",
+    "求人情報が見つかりません",
+    "0件の求人",
+    "0 件",
+)
+
+# 本文に含まれる最初の判定文言を返す（本文テキストはブラウザ外に出さない）
+_FIND_PHRASE_JS = """(phrases) => {
+    const text = document.body ? document.body.innerText : '';
+    return phrases.find(p => text.includes(p)) || null;
+}"""
+
+# 検索結果の行ごとに使う正規表現
+_RE_KJNO = re.compile(r'kJNo=([0-9A-Za-z\-]+)')
+_RE_JOB_NUMBER_DISPLAY = re.compile(r'求人番号[:\s]*(\d{5}-\d{8})')
+
+# kyujin_body内のラベル → (格納先キー, 最大文字数)。ラベルに含まれる語で上から順に判定する
+_TABLE_LABEL_FIELDS = (
+    ("事業所名", "company", 200),
+    ("就業場所", "location", 200),
+    ("賃金", "salary", 100),
+    ("雇用形態", "employment_type", 50),
+    ("就業時間", "working_hours", 100),
+    ("休日", "holidays", 100),
+    ("年齢", "age_limit", 50),
+    ("仕事の内容", "job_description", 500),
+)
+
+# table.kyujin の職種名（kyujin_headの職種セル、なければ見出し行のテキストから推定）
+_JOB_TABLE_TITLE_JS = """(t) => {
+    const head = t.querySelector('tr.kyujin_head');
+    if (!head) return '';
+    const cell = head.querySelector('td.m13, td.fs1');
+    if (cell) return cell.innerText.trim().slice(0, 100);
+    const line = head.innerText.split('\\n').map(s => s.trim())
+        .find(s => s.length > 2 && !s.includes('職種') && !s.includes('求人番号'));
+    return line ? line.slice(0, 100) : '';
+}"""
+
+# 検索結果の全 table.kyujin を1回のevaluateで読み取る
+# （テーブル・セルごとのPlaywright呼び出しをまとめる。戻り値の形は _read_job_table と同じ）
+_JOB_TABLES_JS = """(jobNumberPattern) => {
+    const jobNumberRe = new RegExp(jobNumberPattern);
+    const titleOf = """ + _JOB_TABLE_TITLE_JS + """;
+    return Array.from(document.querySelectorAll('table.kyujin')).map(t => {
+        const link = t.querySelector('a[href*="kJNo"]');
+        const title = titleOf(t);
+        const rows = [];
+        const body = t.querySelector('tr.kyujin_body');
+        if (body) {
+            for (const row of body.querySelectorAll('tr.border_new')) {
+                const label = row.querySelector('td.fb');
+                const value = row.querySelectorAll('td')[1];
+                if (label && value) rows.push([label.innerText.trim(), value.innerText.trim()]);
+            }
+        }
+        const numberMatch = t.innerText.match(jobNumberRe);
+        return {
+            href: link ? link.getAttribute('href') : null,
+            title,
+            rows,
+            job_number_display: numberMatch ? numberMatch[1] : '',
+        };
+    });
+}"""
+
+# table.kyujin がない場合の詳細リンクを1回で読み取る: [href, 親行のテキスト, 親行のセルテキスト]
+# （リンクがセル内にない場合、セルテキストは空配列）
+_DETAIL_LINKS_JS = """(links) => links.map(a => {
+    const row = a.closest('tr');
+    const cells = row && a.closest('td')
+        ? Array.from(row.querySelectorAll('td'), td => td.innerText.trim())
+        : [];
+    return [a.getAttribute('href'), row ? row.innerText : '', cells];
+})"""
+
+# 詳細リンクの親行のセルを項目に振り分ける判定
+_RE_CELL_CORPORATE = re.compile(r'株式会社|有限会社|合同会社')
+_RE_CELL_LOCATION = re.compile(r'[県都府道]')
+_RE_CELL_SALARY = re.compile(r'[円万]')
+
+# 詳細ページ本文（body_text）から値を拾う正規表現
+_RE_DETAIL_JOB_NUMBER = re.compile(r'求人番号[:\s]*(\d+-\d+)')
+_RE_DETAIL_COMPANY = re.compile(r'事業所名[:\s]*([^\n]+)')
+_RE_DETAIL_JOB_TITLE = re.compile(r'職種[:\s]*([^\n]+)')
+_RE_DETAIL_DESCRIPTION = re.compile(r'仕事内容[:\s]*([\s\S]*?)(?=雇用形態|$)')
+# 賃金: 「a + b + c」（固定残業代あり）→「a + b」の順に試す
+_RE_DETAIL_SALARY_FORMULAS = (
+    re.compile(r'[aａ]\s*[+＋]\s*[bｂ]\s*[+＋]\s*[cｃ][）\)]*[\s\n]*([^\n]+)', re.IGNORECASE),
+    re.compile(r'[aａ]\s*[+＋]\s*[bｂ][）\)]*[\s\n]*([^\n]+)', re.IGNORECASE),
+)
+_RE_DETAIL_SALARY_RANGE = re.compile(r'(\d{2,3},?\d{3}円?[〜～\-～]\d{2,3},?\d{3}円?)')
+_RE_DETAIL_LOCATION = re.compile(r'就業場所[:\s]*([^\n]+(?:\n[^\n▼■]+)*)')
+_RE_DETAIL_PHONES = (
+    re.compile(r'電話番号[:\s]*([0-9０-９\-－ー（）\(\)]+)'),
+    re.compile(r'TEL[:\s]*([0-9０-９\-－ー（）\(\)]+)'),
+)
+_RE_DETAIL_ADDRESSES = (
+    re.compile(r'所在地[:\s]*([^\n]+)'),
+    re.compile(r'事業所所在地[:\s]*([^\n]+)'),
+)
+_RE_DETAIL_POSTED_DATES = (
+    re.compile(r'受付年月日[:\s]*(\d{4}[年/]\d{1,2}[月/]\d{1,2}日?)'),
+    re.compile(r'受付日[:\s]*(\d{4}[年/]\d{1,2}[月/]\d{1,2}日?)'),
+    re.compile(r'公開日[:\s]*(\d{4}[年/]\d{1,2}[月/]\d{1,2}日?)'),
+)
+_RE_DETAIL_WORKING_TIME = re.compile(r'(\d{1,2}時\d{2}分[〜～\-]\d{1,2}時\d{2}分)')
+_RE_DETAIL_ANNUAL_HOLIDAYS = re.compile(r'年間休日[:\s]*(\d+日?)')
+_RE_DETAIL_AGE = re.compile(r'年齢[:\s]*(\d+歳[^\n]*)')
+# 詳細ページの本文テキスト: 求人番号を含むmain要素があればその中だけ、なければbody全体
+# （ヘッダー・フッター等のテキストを転送・正規表現の走査対象から外す）
+_DETAIL_TEXT_JS = """() => {
+    const main = document.querySelector('main');
+    if (main && main.innerText.includes('求人番号')) return main.innerText;
+    return document.body ? document.body.innerText : '';
+}"""
+
+# extract_sectionで取得するセクションのラベル
+_DETAIL_SECTION_LABELS = (
+    "事業所名", "職種", "仕事内容", "雇用形態", "賃金", "就業場所",
+    "就業時間", "休日", "学歴", "必要な免許", "必要な経験",
+)
+# ラベル要素の次の兄弟要素のテキストを全ラベル分1回のDOM走査で取得する
+# 直下のテキストがラベルと一致する要素を優先し、なければラベルを含む要素を使う（いずれも文書順で最初のもの）
+_SECTION_SIBLINGS_JS = """(labels) => {
+    const exact = {};
+    const partial = {};
+    for (const el of document.body.querySelectorAll('*')) {
+        const sibling = el.nextElementSibling;
+        if (!sibling) continue;
+        const own = Array.from(el.childNodes)
+            .filter(n => n.nodeType === Node.TEXT_NODE).map(n => n.nodeValue).join('');
+        if (!own) continue;
+        const trimmed = own.trim();
+        for (const label of labels) {
+            if (!(label in exact) && trimmed === label) exact[label] = sibling.innerText.trim();
+            if (!(label in partial) && own.includes(label)) partial[label] = sibling.innerText.trim();
+        }
+    }
+    return Object.assign(partial, exact);
+}"""
+# 「ラベル」から次の空行・見出し記号までを全ラベル分1回の走査で拾う正規表現
+# 先読みで一致を幅0にし、あるセクションの途中にある別のラベルも拾えるようにする
+_RE_DETAIL_SECTIONS = re.compile(
+    "(?=(" + "|".join(map(re.escape, _DETAIL_SECTION_LABELS)) + r")[:\s]*([\s\S]*?)(?=\n\n|\n[▼■●]|$))"
+)
+# 電話番号の全角数字 → 半角数字
+_ZENKAKU_DIGITS = str.maketrans('０１２３４５６７８９', '0123456789')
+
+# _clean_textで除去するjobtag関連の不要文字列
+_RE_CLEANUP_PATTERNS = (
+    re.compile(r'jobtag\s*について.*$', re.IGNORECASE),
+    re.compile(r'jobtag\s*について', re.IGNORECASE),
+    re.compile(r'\s*jobtag.*$', re.IGNORECASE),
+)
+
+
+# 同じエリア名・キーワードは検索ごとに繰り返し渡されるため、判定結果をキャッシュする
+# （マッピングと索引はモジュール読み込み時に確定し、実行中は変わらない前提）
+@lru_cache(maxsize=2048)
+def _lookup_prefecture_code(area: str) -> Optional[str]:
+    """エリア名から都道府県コードを取得"""
+    if area in PREFECTURE_CODES:
+        return PREFECTURE_CODES[area]
+    # 都道府県名を含むエリア名（「東京都新宿区」など）
+    match = _RE_PREFECTURE_NAMES.search(area)
+    if match:
+        return PREFECTURE_CODES[match.group(0)]
+    # 都道府県名の一部（「東京」「神奈川」など）
+    return _PREFECTURE_BY_FRAGMENT.get(area)
+
+
+@lru_cache(maxsize=2048)
+def _lookup_job_category_code(keyword: str) -> Optional[str]:
+    """キーワードから職業分類コードを取得"""
+    # まず完全一致を試す
+    if keyword in KEYWORD_TO_CATEGORY:
+        return KEYWORD_TO_CATEGORY[keyword]
+    # キーワードに含まれる登録キーワードのうち最長のもの（「施工管理技士」→「施工管理」）
+    longest = max((m.group(1) for m in _RE_CATEGORY_KEYWORDS.finditer(keyword)), key=len, default=None)
+    if longest:
+        return KEYWORD_TO_CATEGORY[longest]
+    # キーワードが登録キーワードの一部の場合
+    return _CATEGORY_BY_FRAGMENT.get(keyword)
+
+
+def _scan_detail_sections(body_text: str) -> Dict[str, str]:
+    """詳細ページ本文を1回走査し、ラベル → セクション本文（最大500文字）の辞書を作成
+
+    ラベルごとに最初の出現位置を採用する（ラベルごとに本文を検索した場合と同じ結果）。
+    """
+    sections: Dict[str, str] = {}
+    for match in _RE_DETAIL_SECTIONS.finditer(body_text):
+        label = match.group(1)
+        if label not in sections:
+            sections[label] = match.group(2).strip()[:500]
+            if len(sections) == len(_DETAIL_SECTION_LABELS):
+                break
+    return sections
+
+
+def classify_many(queries: List[str]) -> List[str]:
+    """検索キーワードをまとめて職業分類コードに変換
+
+    CSVの検索語一覧など大量のキーワードを一括で分類するためのもの。
+    判定は _lookup_job_category_code と同じで、該当なしは空文字を返す。
+    重複するキーワードはキャッシュで1回分の判定になる。
+    """
+    return [_lookup_job_category_code(query) or "" for query in queries]
+
+
 class HelloworkScraper(BaseScraper):
     """ハローワーク求人スクレイパー"""
 
+    # インスタンスごとに変わらない値はクラス属性にする
+    # （リアルタイム件数コールバックはBaseScraperで初期化・報告する）
+    BASE_URL = "https://www.hellowork.mhlw.go.jp"
+    SEARCH_URL = f"{BASE_URL}/kensaku/GECA110010.do?action=initDisp&screenId=GECA110010"
+    source_name = "hellowork"
+    logger = logging.getLogger(__name__)
+    # 詳細取得ページを使い回す上限回数（超えたら呼び出し側でページを作り直す）
+    DETAIL_PAGE_MAX_USES = 50
+    # scrape_with_detailsで同時に開く詳細ページ数（サーバー負荷を考慮して控えめにする）
+    DETAIL_CONCURRENCY = 3
+    # 詳細ページへのアクセス頻度の上限（件/秒、全ページ合計）
+    DETAIL_RATE = 2.0
+    # 取得済み詳細を保持する件数（異なる検索条件で同じ求人が出た場合に再取得しない）
+    DETAIL_CACHE_SIZE = 2048
+
     def __init__(self, config: dict = None):
         super().__init__("hellowork")
-        self.source_name = "hellowork"
-        self.base_url = "https://www.hellowork.mhlw.go.jp"
-        self.search_url = f"{self.base_url}/kensaku/GECA110010.do?action=initDisp&screenId=GECA110010"
-        self.logger = logging.getLogger(__name__)
-        # リアルタイム件数コールバック
-        self._realtime_callback = None
-
-    def set_realtime_callback(self, callback):
-        """リアルタイム件数コールバックを設定"""
-        self._realtime_callback = callback
-
-    def _report_count(self, count: int):
-        """件数を報告"""
-        if self._realtime_callback:
-            self._realtime_callback(count)
+        # 詳細ページの並列取得で共有するアクセス頻度の制御
+        self.detail_rate_limiter = TokenBucket(rate=self.DETAIL_RATE)
+        # 詳細URL → 取得済み詳細（古いものから破棄）
+        self._detail_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
     def _clean_text(self, text: str) -> str:
         """不要な文字列を除去してテキストをクリーニング"""
@@ -459,30 +727,17 @@ class HelloworkScraper(BaseScraper):
             return ""
         cleaned = text
         # jobtag関連の不要文字列を除去
-        cleanup_patterns = [
-            r'jobtag\s*について.*$',
-            r'jobtag\s*について',
-            r'\s*jobtag.*$',
-        ]
-        for pattern in cleanup_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        for pattern in _RE_CLEANUP_PATTERNS:
+            cleaned = pattern.sub('', cleaned)
         return cleaned.strip()
 
     async def _check_for_error_page(self, page: Page) -> bool:
         """エラーページかどうかをチェック"""
         try:
-            page_text = await page.inner_text('body')
-            error_indicators = [
-                "システムの混雑",
-                "続行不可能なエラー",
-                "エラーが発生しました",
-                "システムエラー",
-                "時間をおいて再度",
-            ]
-            for indicator in error_indicators:
-                if indicator in page_text:
-                    self.logger.warning(f"ハローワークエラーページ検出: {indicator}")
-                    return True
+            found = await page.evaluate(_FIND_PHRASE_JS, list(_ERROR_INDICATORS))
+            if found:
+                self.logger.warning(f"ハローワークエラーページ検出: {found}")
+                return True
             return False
         except Exception:
             return False
@@ -492,43 +747,18 @@ class HelloworkScraper(BaseScraper):
         早期にリターンしてセレクタタイムアウトを避ける
         """
         try:
-            page_text = await page.inner_text('body')
-            no_results_patterns = [
-                "該当する求人情報はありません",
-                "該当する求人がありません",
-                "条件に合う求人がありません",
-                "検索結果がありません",
-                "求人情報が見つかりません",
-                "0件の求人",
-                "0 件",
-            ]
-            for pattern in no_results_patterns:
-                if pattern in page_text:
-                    return True
-            return False
+            return await page.evaluate(_FIND_PHRASE_JS, list(_NO_RESULTS_PATTERNS)) is not None
         except Exception as e:
             self.logger.debug(f"[ハローワーク] 0件チェックエラー（続行）: {e}")
             return False
 
     def _get_prefecture_code(self, area: str) -> Optional[str]:
         """エリア名から都道府県コードを取得"""
-        if area in PREFECTURE_CODES:
-            return PREFECTURE_CODES[area]
-        for name, code in PREFECTURE_CODES.items():
-            if name in area or area in name:
-                return code
-        return None
+        return _lookup_prefecture_code(area)
 
     def _get_job_category_code(self, keyword: str) -> Optional[str]:
         """キーワードから職業分類コードを取得"""
-        # まず完全一致を試す
-        if keyword in KEYWORD_TO_CATEGORY:
-            return KEYWORD_TO_CATEGORY[keyword]
-        # 部分一致を試す
-        for kw, code in KEYWORD_TO_CATEGORY.items():
-            if kw in keyword or keyword in kw:
-                return code
-        return None
+        return _lookup_job_category_code(keyword)
 
     async def search(self, page: Page, keyword: str, area: str, max_pages: int = 5) -> List[Dict[str, Any]]:
         """ハローワークで求人を検索
@@ -558,8 +788,13 @@ class HelloworkScraper(BaseScraper):
 
         try:
             self.logger.info(f"ハローワーク検索開始: {keyword} in {area}")
-            await page.goto(self.search_url, wait_until="networkidle", timeout=60000)
-            await asyncio.sleep(3)
+            await page.goto(self.SEARCH_URL, wait_until="domcontentloaded", timeout=60000)
+            # 固定待機ではなく検索フォーム（都道府県選択欄）の描画を待つ
+            # エラーページでは描画されないため、タイムアウトしても下のエラーチェックへ進む
+            try:
+                await page.wait_for_selector('#ID_tDFK1CmbBox', timeout=30000)
+            except PlaywrightTimeout:
+                self.logger.debug("検索フォームの描画待機タイムアウト")
 
             # エラーページチェック
             if await self._check_for_error_page(page):
@@ -567,8 +802,8 @@ class HelloworkScraper(BaseScraper):
                 return all_jobs
 
             await self._fill_search_form(page, keyword, prefecture_code, job_category_code)
+            # 検索結果の読み込み完了までは _submit_search 内で待機している
             await self._submit_search(page)
-            await asyncio.sleep(3)
 
             # 検索後もエラーページチェック
             if await self._check_for_error_page(page):
@@ -606,8 +841,6 @@ class HelloworkScraper(BaseScraper):
                     if not has_next:
                         self.logger.info("次のページがありません（最終ページ）")
                         break
-                    # ページ遷移後の待機
-                    await asyncio.sleep(3)
 
         except PlaywrightTimeout as e:
             self.logger.error(f"タイムアウト: {e}")
@@ -695,20 +928,16 @@ class HelloworkScraper(BaseScraper):
         try:
             # 検索ボタン（ID_searchBtn）
             search_button = page.locator('#ID_searchBtn')
-            if await search_button.count() > 0:
-                await search_button.click()
-                self.logger.info("検索ボタンクリック成功")
-            else:
+            if await search_button.count() == 0:
                 # 代替セレクタ
-                alt_button = page.locator('input[type="submit"][value="検索"]')
-                if await alt_button.count() > 0:
-                    await alt_button.first.click()
-                    self.logger.info("検索ボタン（代替）クリック成功")
-                else:
+                search_button = page.locator('input[type="submit"][value="検索"]').first
+                if await search_button.count() == 0:
                     self.logger.warning("検索ボタンが見つかりません")
                     return
 
-            await page.wait_for_load_state("networkidle", timeout=60000)
+            # 検索結果はサーバー側で描画されるため、networkidleではなく遷移先のDOM構築完了まで待つ
+            async with page.expect_navigation(wait_until="domcontentloaded", timeout=60000):
+                await search_button.click()
             self.logger.info("検索結果ページ読み込み完了")
 
             # 表示件数を50件に設定
@@ -760,15 +989,14 @@ class HelloworkScraper(BaseScraper):
 
         try:
             # table.kyujin を使って求人カードを取得
-            job_tables = page.locator('table.kyujin')
-            table_count = await job_tables.count()
+            tables = await self._collect_job_tables(page)
+            table_count = len(tables)
             self.logger.info(f"求人テーブル数: {table_count}")
 
             if table_count > 0:
-                for i in range(table_count):
+                for i, table in enumerate(tables):
                     try:
-                        job_table = job_tables.nth(i)
-                        job = await self._extract_job_from_table(job_table, i)
+                        job = self._build_job_from_table(table, i)
 
                         if job and job.get('job_id'):
                             job_id = job['job_id']
@@ -784,18 +1012,18 @@ class HelloworkScraper(BaseScraper):
             else:
                 # フォールバック: 直接詳細リンクを探す
                 self.logger.info("table.kyujinが見つかりません。詳細リンクを直接検索します。")
-                detail_links = page.locator('a[href*="dispDetailBtn"][href*="kJNo"]')
-                link_count = await detail_links.count()
+                links = await page.eval_on_selector_all(
+                    'a[href*="dispDetailBtn"][href*="kJNo"]', _DETAIL_LINKS_JS
+                )
+                link_count = len(links)
                 self.logger.info(f"詳細リンク数: {link_count}")
 
-                for i in range(link_count):
+                for i, (href, row_text, cell_texts) in enumerate(links):
                     try:
-                        link = detail_links.nth(i)
-                        href = await link.get_attribute('href')
                         if not href or 'kJNo' not in href:
                             continue
 
-                        job = await self._extract_job_from_detail_btn(link, href, page)
+                        job = self._build_job_from_detail_link(href, row_text, cell_texts)
                         if job and job.get('job_id'):
                             job_id = job['job_id']
                             if job_id in seen_job_ids:
@@ -820,68 +1048,52 @@ class HelloworkScraper(BaseScraper):
             self.logger.error(f"求人リスト抽出エラー: {e}")
         return jobs
 
-    async def _extract_job_from_table(self, job_table, index: int) -> Optional[Dict[str, Any]]:
-        """table.kyujin から求人情報を抽出
+    async def _collect_job_tables(self, page: Page) -> List[Optional[Dict[str, Any]]]:
+        """検索結果の table.kyujin をすべて読み取る
+
+        通常は _JOB_TABLES_JS の1回のevaluateで取得し、失敗した場合のみ
+        テーブルごとにPlaywrightで読み取る。
+        """
+        try:
+            return await page.evaluate(_JOB_TABLES_JS, _RE_JOB_NUMBER_DISPLAY.pattern)
+        except Exception as e:
+            self.logger.debug(f"求人テーブル一括取得エラー（個別取得に切り替え）: {e}")
+
+        job_tables = page.locator('table.kyujin')
+        table_count = await job_tables.count()
+        return [await self._read_job_table(job_tables.nth(i), i) for i in range(table_count)]
+
+    async def _read_job_table(self, job_table, index: int) -> Optional[Dict[str, Any]]:
+        """table.kyujin をPlaywrightで読み取る（_JOB_TABLES_JSのフォールバック）
 
         HTML構造:
         - tr.kyujin_head: 職種名など
         - tr.kyujin_body: 会社名、勤務地、賃金などがテーブル形式で配置
           - 各行: td.fb.in_width_9em (ラベル) + td (値)
         - tr.kyujin_foot: 詳細ボタン (a#ID_dispDetailBtn)
+
+        Returns:
+            {"href", "title", "rows": [(ラベル, 値), ...], "job_number_display"}
         """
         try:
-            # 詳細リンクからjob_idを取得
+            # 詳細リンク
+            href = None
             detail_link = job_table.locator('a[href*="kJNo"]')
-            if await detail_link.count() == 0:
-                self.logger.debug(f"テーブル {index}: 詳細リンクなし")
-                return None
-
-            href = await detail_link.first.get_attribute('href')
-            if not href:
-                return None
-
-            # kJNo を抽出
-            match = re.search(r'kJNo=([0-9A-Za-z\-]+)', href)
-            if not match:
-                self.logger.debug(f"テーブル {index}: kJNoが見つかりません")
-                return None
-
-            job_id = match.group(1)
+            if await detail_link.count() > 0:
+                href = await detail_link.first.get_attribute('href')
 
-            # 職種名（kyujin_headから）
+            # 職種名（kyujin_headから）: セルの有無の判定とテキスト取得を1回のevaluateで行う
             title = ""
-            head_row = job_table.locator('tr.kyujin_head')
-            if await head_row.count() > 0:
-                try:
-                    # 職種は「職種」ラベルの次のtdにある
-                    title_cell = head_row.locator('td.m13, td.fs1').first
-                    if await title_cell.count() > 0:
-                        title = (await title_cell.inner_text()).strip()[:100]
-                    else:
-                        # フォールバック: テキストから抽出
-                        head_text = await head_row.inner_text()
-                        lines = [l.strip() for l in head_text.split('\n') if l.strip()]
-                        for line in lines:
-                            if len(line) > 2 and '職種' not in line and '求人番号' not in line:
-                                title = line[:100]
-                                break
-                except Exception as e:
-                    self.logger.debug(f"職種取得エラー: {e}")
-
-            # kyujin_body内のテーブルから情報を抽出
-            company = ""
-            location = ""
-            salary = ""
-            employment_type = ""
-            working_hours = ""
-            holidays = ""
-            age_limit = ""
-            job_description = ""
+            try:
+                title = await job_table.evaluate(_JOB_TABLE_TITLE_JS)
+            except Exception as e:
+                self.logger.debug(f"職種取得エラー: {e}")
 
+            # kyujin_body内のテーブルの各行（ラベル, 値）
+            rows = []
             body_row = job_table.locator('tr.kyujin_body')
             if await body_row.count() > 0:
                 try:
-                    # 内部テーブルの各行を解析
                     inner_rows = body_row.locator('tr.border_new')
                     row_count = await inner_rows.count()
 
@@ -895,27 +1107,10 @@ class HelloworkScraper(BaseScraper):
                             if await label_cell.count() == 0 or await value_cell.count() == 0:
                                 continue
 
-                            label = (await label_cell.inner_text()).strip()
-                            value = (await value_cell.inner_text()).strip()
-
-                            # ラベルに応じて値を格納
-                            if '事業所名' in label:
-                                company = value[:200]
-                            elif '就業場所' in label:
-                                location = value[:200]
-                            elif '賃金' in label:
-                                salary = value[:100]
-                            elif '雇用形態' in label:
-                                employment_type = value[:50]
-                            elif '就業時間' in label:
-                                working_hours = value[:100]
-                            elif '休日' in label:
-                                holidays = value[:100]
-                            elif '年齢' in label:
-                                age_limit = value[:50]
-                            elif '仕事の内容' in label:
-                                job_description = value[:500]
-
+                            rows.append((
+                                (await label_cell.inner_text()).strip(),
+                                (await value_cell.inner_text()).strip(),
+                            ))
                         except Exception as e:
                             self.logger.debug(f"行 {i} の解析エラー: {e}")
                             continue
@@ -927,32 +1122,65 @@ class HelloworkScraper(BaseScraper):
             job_number_display = ""
             try:
                 table_text = await job_table.inner_text()
-                no_match = re.search(r'求人番号[:\s]*(\d{5}-\d{8})', table_text)
+                no_match = _RE_JOB_NUMBER_DISPLAY.search(table_text)
                 if no_match:
                     job_number_display = no_match.group(1)
             except:
                 pass
 
             return {
-                "job_id": job_id,
+                "href": href,
+                "title": title,
+                "rows": rows,
                 "job_number_display": job_number_display,
-                "title": self._clean_text(title),
-                "company": self._clean_text(company),
-                "location": self._clean_text(location),
-                "salary": self._clean_text(salary),
-                "employment_type": self._clean_text(employment_type),
-                "working_hours": self._clean_text(working_hours),
-                "holidays": self._clean_text(holidays),
-                "age_limit": self._clean_text(age_limit),
-                "job_description": self._clean_text(job_description),
-                "url": self._build_detail_url(job_id),
-                "source": self.source_name,
             }
 
         except Exception as e:
-            self.logger.debug(f"テーブル {index} 抽出エラー: {e}")
+            self.logger.debug(f"テーブル {index} 読み取りエラー: {e}")
             return None
 
+    def _build_job_from_table(self, table: Optional[Dict[str, Any]], index: int) -> Optional[Dict[str, Any]]:
+        """table.kyujin の読み取り結果から求人情報を作成"""
+        if not table:
+            return None
+
+        href = table.get("href")
+        if not href:
+            self.logger.debug(f"テーブル {index}: 詳細リンクなし")
+            return None
+
+        # kJNo を抽出
+        match = _RE_KJNO.search(href)
+        if not match:
+            self.logger.debug(f"テーブル {index}: kJNoが見つかりません")
+            return None
+
+        job_id = match.group(1)
+
+        # ラベルに応じて値を格納（同じ項目が複数あれば後の行で上書き）
+        fields = {field: "" for _, field, _ in _TABLE_LABEL_FIELDS}
+        for label, value in table["rows"]:
+            for needle, field, limit in _TABLE_LABEL_FIELDS:
+                if needle in label:
+                    fields[field] = value[:limit]
+                    break
+
+        return {
+            "job_id": job_id,
+            "job_number_display": table["job_number_display"],
+            "title": self._clean_text(table["title"]),
+            "company": self._clean_text(fields["company"]),
+            "location": self._clean_text(fields["location"]),
+            "salary": self._clean_text(fields["salary"]),
+            "employment_type": self._clean_text(fields["employment_type"]),
+            "working_hours": self._clean_text(fields["working_hours"]),
+            "holidays": self._clean_text(fields["holidays"]),
+            "age_limit": self._clean_text(fields["age_limit"]),
+            "job_description": self._clean_text(fields["job_description"]),
+            "url": self._build_detail_url(job_id),
+            "source": self.source_name,
+        }
+
     def _build_detail_url(self, job_id: str) -> str:
         """job_id (kJNo) から詳細ページURLを構築
 
@@ -963,16 +1191,16 @@ class HelloworkScraper(BaseScraper):
             詳細ページURL
             例: https://www.hellowork.mhlw.go.jp/kensaku/GECA110010.do?screenId=GECA110010&action=dispDetailBtn&kJNo=0804021563451&kJKbn=1
         """
-        return f"{self.base_url}/kensaku/GECA110010.do?screenId=GECA110010&action=dispDetailBtn&kJNo={job_id}&kJKbn=1"
+        return f"{self.BASE_URL}/kensaku/GECA110010.do?screenId=GECA110010&action=dispDetailBtn&kJNo={job_id}&kJKbn=1"
 
-    async def _extract_job_from_detail_btn(self, link, href: str, page: Page) -> Optional[Dict[str, Any]]:
-        """詳細ボタンから求人情報を抽出"""
+    def _build_job_from_detail_link(self, href: str, row_text: str, cell_texts: List[str]) -> Optional[Dict[str, Any]]:
+        """詳細ボタンのリンクと親行のテキストから求人情報を組み立てる（_DETAIL_LINKS_JSの結果）"""
         try:
             # URLから求人番号を抽出（kJNo パラメータ）
             # 例: kJNo=0804021563451
             # kJNoは13桁の数字（都道府県コード2桁 + 職業分類コード2桁 + 求人番号9桁）
             job_id = None
-            match = re.search(r'kJNo=([0-9A-Za-z\-]+)', href)
+            match = _RE_KJNO.search(href)
             if match:
                 job_id = match.group(1)
 
@@ -990,42 +1218,21 @@ class HelloworkScraper(BaseScraper):
             salary = ""
 
             try:
-                parent_row = link.locator('xpath=ancestor::tr[1]')
-                if await parent_row.count() > 0:
-                    row_text = await parent_row.inner_text()
-                    lines = [l.strip() for l in row_text.split('\n') if l.strip()]
-                    if lines:
-                        for line in lines:
-                            if not title and len(line) > 2 and '詳細' not in line:
-                                title = line[:100]
-                                break
-
-                parent_cell = link.locator('xpath=ancestor::td[1]')
-                if await parent_cell.count() > 0:
-                    parent_row = link.locator('xpath=ancestor::tr[1]')
-                    if await parent_row.count() > 0:
-                        cells = parent_row.locator('td')
-                        cell_count = await cells.count()
-
-                        cell_texts = []
-                        for i in range(cell_count):
-                            try:
-                                cell_text = (await cells.nth(i).inner_text()).strip()
-                                cell_texts.append(cell_text)
-                            except:
-                                cell_texts.append("")
-
-                        for i, text in enumerate(cell_texts):
-                            if '詳細を表示' in text:
-                                continue
-                            if not company and ('株式会社' in text or '有限会社' in text or '合同会社' in text):
-                                company = text[:100]
-                            elif not title and len(text) > 3:
-                                title = text[:100]
-                            elif not location and ('県' in text or '都' in text or '府' in text or '道' in text):
-                                location = text[:100]
-                            elif not salary and ('円' in text or '万' in text):
-                                salary = text[:50]
+                # 職種: 親行のテキストで最初の3文字以上の行（「詳細」ボタンの行を除く）
+                lines = (l.strip() for l in row_text.split('\n'))
+                title = next((line[:100] for line in lines if len(line) > 2 and '詳細' not in line), "")
+
+                for text in cell_texts:
+                    if '詳細を表示' in text:
+                        continue
+                    if not company and _RE_CELL_CORPORATE.search(text):
+                        company = text[:100]
+                    elif not title and len(text) > 3:
+                        title = text[:100]
+                    elif not location and _RE_CELL_LOCATION.search(text):
+                        location = text[:100]
+                    elif not salary and _RE_CELL_SALARY.search(text):
+                        salary = text[:50]
 
             except Exception as e:
                 self.logger.debug(f"親要素からの情報取得エラー: {e}")
@@ -1068,12 +1275,10 @@ class HelloworkScraper(BaseScraper):
                     current_page_value = await current_disabled.get_attribute("value") or ""
                     self.logger.debug(f"現在のページ: {current_page_value}")
 
-                # クリックしてページ遷移を待つ
-                await next_button.click()
-
-                # ページ遷移を確実に待つ
-                await page.wait_for_load_state("domcontentloaded", timeout=30000)
-                await asyncio.sleep(2)  # 追加の待機
+                # クリックしてページ遷移を待つ（遷移前のページで待機が終わらないようexpect_navigationを使う）
+                # 求人リストの描画はsearch側のwait_for_selectorで待つ
+                async with page.expect_navigation(wait_until="domcontentloaded", timeout=30000):
+                    await next_button.click()
 
                 # ページが変わったことを確認
                 new_disabled = page.locator('ul.page_navi input[disabled]').first
@@ -1093,9 +1298,8 @@ class HelloworkScraper(BaseScraper):
                     self.logger.info("次へボタンが無効化されています（最終ページ）")
                     return False
 
-                await fallback_button.click()
-                await page.wait_for_load_state("domcontentloaded", timeout=30000)
-                await asyncio.sleep(2)
+                async with page.expect_navigation(wait_until="domcontentloaded", timeout=30000):
+                    await fallback_button.click()
                 self.logger.info("次のページへ移動成功（フォールバック）")
                 return True
 
@@ -1117,8 +1321,12 @@ class HelloworkScraper(BaseScraper):
 
         Returns:
             詳細情報の辞書
+
+        同じ求人はセッション中1回だけ取得し、2回目以降は取得済みの内容を返す。
+        ページへのアクセスはdetail_rate_limiterで全ページ合計の頻度を制御する。
         """
         detail = {}
+        job_url = None
         try:
             # URLかjob_idかを判定
             if job_url_or_id.startswith('http'):
@@ -1127,13 +1335,34 @@ class HelloworkScraper(BaseScraper):
                 # job_idからURLを構築
                 job_url = self._build_detail_url(job_url_or_id)
 
-            await page.goto(job_url, wait_until="networkidle", timeout=60000)
-            await asyncio.sleep(3)
+            cached = self._detail_cache.get(job_url)
+            if cached is not None:
+                self._detail_cache.move_to_end(job_url)
+                self.logger.debug(f"詳細取得済み（キャッシュ）: {job_url_or_id}")
+                return dict(cached)
+
+            await self.detail_rate_limiter.acquire()
+            # 画像・フォントはページ単位のルートでブロックしているため、networkidleではなくDOM構築完了まで待つ
+            await page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
+            # 固定待機ではなく詳細の項目（事業所名）の描画を待つ
+            # 見つからないページでも本文からの抽出は試みるため、短めのタイムアウトで続行する
+            try:
+                await page.wait_for_selector('text=事業所名', timeout=3000)
+            except PlaywrightTimeout:
+                self.logger.debug(f"詳細項目の描画待機タイムアウト: {job_url}")
 
-            body_text = await page.inner_text('body')
+            body_text = await page.evaluate(_DETAIL_TEXT_JS)
+            # ラベルの次の要素のテキスト（全ラベル分を1回のevaluateで取得）
+            try:
+                sibling_sections = await page.evaluate(_SECTION_SIBLINGS_JS, list(_DETAIL_SECTION_LABELS))
+            except Exception as e:
+                self.logger.debug(f"セクション一括取得エラー: {e}")
+                sibling_sections = {}
+            # DOMから取れなかった場合に使う本文のセクション（全ラベル分を1回の走査で作成）
+            body_sections = _scan_detail_sections(body_text)
 
             # 求人番号
-            job_no_match = re.search(r'求人番号[:\s]*(\d+-\d+)', body_text)
+            job_no_match = _RE_DETAIL_JOB_NUMBER.search(body_text)
             if job_no_match:
                 detail["job_number"] = job_no_match.group(1)
 
@@ -1160,51 +1389,34 @@ class HelloworkScraper(BaseScraper):
                 return ""
 
             # セクションごとに情報を抽出（従来のフォールバック）
-            async def extract_section(label: str) -> str:
-                try:
-                    selectors = [
-                        f'text="{label}" >> xpath=following-sibling::*[1]',
-                        f'//*[contains(text(), "{label}")]/following-sibling::*[1]',
-                    ]
-                    for selector in selectors:
-                        try:
-                            elem = page.locator(selector)
-                            if await elem.count() > 0:
-                                return (await elem.first.inner_text()).strip()
-                        except:
-                            continue
-
-                    pattern = rf'{re.escape(label)}[:\s]*([\s\S]*?)(?=\n\n|\n[▼■●]|$)'
-                    match = re.search(pattern, body_text)
-                    if match:
-                        return match.group(1).strip()[:500]
-                except Exception as e:
-                    self.logger.debug(f"セクション抽出エラー ({label}): {e}")
-                return ""
+            def extract_section(label: str) -> str:
+                if label in sibling_sections:
+                    return sibling_sections[label]
+                return body_sections.get(label, "")
 
             # 事業所名
-            detail["company_name"] = await extract_section("事業所名")
+            detail["company_name"] = extract_section("事業所名")
             if not detail["company_name"]:
-                match = re.search(r'事業所名[:\s]*([^\n]+)', body_text)
+                match = _RE_DETAIL_COMPANY.search(body_text)
                 if match:
                     detail["company_name"] = match.group(1).strip()
 
             # 職種
-            detail["job_title"] = await extract_section("職種")
+            detail["job_title"] = extract_section("職種")
             if not detail["job_title"]:
-                match = re.search(r'職種[:\s]*([^\n]+)', body_text)
+                match = _RE_DETAIL_JOB_TITLE.search(body_text)
                 if match:
                     detail["job_title"] = match.group(1).strip()
 
             # 仕事内容
-            detail["job_description"] = await extract_section("仕事内容")
+            detail["job_description"] = extract_section("仕事内容")
             if not detail["job_description"]:
-                match = re.search(r'仕事内容[:\s]*([\s\S]*?)(?=雇用形態|$)', body_text)
+                match = _RE_DETAIL_DESCRIPTION.search(body_text)
                 if match:
                     detail["job_description"] = match.group(1).strip()[:1000]
 
             # 雇用形態
-            detail["employment_type"] = await extract_section("雇用形態")
+            detail["employment_type"] = extract_section("雇用形態")
             if not detail["employment_type"]:
                 if "正社員" in body_text:
                     detail["employment_type"] = "正社員"
@@ -1216,33 +1428,29 @@ class HelloworkScraper(BaseScraper):
             # ===== 賃金（a + b または a + b + c）=====
             # まず「a + b + c」を試す（固定残業代あり）
             salary = ""
-            salary_patterns = [
-                r'[aａ]\s*[+＋]\s*[bｂ]\s*[+＋]\s*[cｃ][）\)]*[\s\n]*([^\n]+)',  # a + b + c
-                r'[aａ]\s*[+＋]\s*[bｂ][）\)]*[\s\n]*([^\n]+)',  # a + b
-            ]
-            for pattern in salary_patterns:
-                match = re.search(pattern, body_text, re.IGNORECASE)
+            for pattern in _RE_DETAIL_SALARY_FORMULAS:
+                match = pattern.search(body_text)
                 if match:
                     salary = match.group(1).strip()
                     break
 
             # フォールバック：従来の正規表現
             if not salary:
-                salary_match = re.search(r'(\d{2,3},?\d{3}円?[〜～\-～]\d{2,3},?\d{3}円?)', body_text)
+                salary_match = _RE_DETAIL_SALARY_RANGE.search(body_text)
                 if salary_match:
                     salary = salary_match.group(1)
 
             if not salary:
-                salary = await extract_section("賃金")
+                salary = extract_section("賃金")
 
             detail["salary"] = salary
 
             # ===== 就業場所（住所）=====
             location = await extract_table_cell("就業場所")
             if not location:
-                location = await extract_section("就業場所")
+                location = extract_section("就業場所")
             if not location:
-                match = re.search(r'就業場所[:\s]*([^\n]+(?:\n[^\n▼■]+)*)', body_text)
+                match = _RE_DETAIL_LOCATION.search(body_text)
                 if match:
                     location = match.group(1).strip()[:300]
             detail["work_location"] = location
@@ -1251,16 +1459,12 @@ class HelloworkScraper(BaseScraper):
             # ===== 電話番号（担当者テーブルから）=====
             phone = ""
             # 担当者セクションの電話番号を探す
-            phone_patterns = [
-                r'電話番号[:\s]*([0-9０-９\-－ー（）\(\)]+)',
-                r'TEL[:\s]*([0-9０-９\-－ー（）\(\)]+)',
-            ]
-            for pattern in phone_patterns:
-                match = re.search(pattern, body_text)
+            for pattern in _RE_DETAIL_PHONES:
+                match = pattern.search(body_text)
                 if match:
                     phone = match.group(1).strip()
                     # 全角数字を半角に変換
-                    phone = phone.translate(str.maketrans('０１２３４５６７８９', '0123456789'))
+                    phone = phone.translate(_ZENKAKU_DIGITS)
                     break
 
             if not phone:
@@ -1274,12 +1478,8 @@ class HelloworkScraper(BaseScraper):
             company_address = await extract_table_cell("所在地")
             if not company_address:
                 # フォールバック：正規表現
-                address_patterns = [
-                    r'所在地[:\s]*([^\n]+)',
-                    r'事業所所在地[:\s]*([^\n]+)',
-                ]
-                for pattern in address_patterns:
-                    match = re.search(pattern, body_text)
+                for pattern in _RE_DETAIL_ADDRESSES:
+                    match = pattern.search(body_text)
                     if match:
                         company_address = match.group(1).strip()
                         break
@@ -1287,13 +1487,8 @@ class HelloworkScraper(BaseScraper):
 
             # ===== 掲載日（受付年月日）=====
             posted_date = ""
-            date_patterns = [
-                r'受付年月日[:\s]*(\d{4}[年/]\d{1,2}[月/]\d{1,2}日?)',
-                r'受付日[:\s]*(\d{4}[年/]\d{1,2}[月/]\d{1,2}日?)',
-                r'公開日[:\s]*(\d{4}[年/]\d{1,2}[月/]\d{1,2}日?)',
-            ]
-            for pattern in date_patterns:
-                match = re.search(pattern, body_text)
+            for pattern in _RE_DETAIL_POSTED_DATES:
+                match = pattern.search(body_text)
                 if match:
                     posted_date = match.group(1).strip()
                     break
@@ -1304,21 +1499,21 @@ class HelloworkScraper(BaseScraper):
             detail["posted_date"] = posted_date
 
             # 就業時間
-            detail["working_hours"] = await extract_section("就業時間")
+            detail["working_hours"] = extract_section("就業時間")
             if not detail["working_hours"]:
-                time_match = re.search(r'(\d{1,2}時\d{2}分[〜～\-]\d{1,2}時\d{2}分)', body_text)
+                time_match = _RE_DETAIL_WORKING_TIME.search(body_text)
                 if time_match:
                     detail["working_hours"] = time_match.group(1)
 
             # 休日
-            detail["holidays"] = await extract_section("休日")
+            detail["holidays"] = extract_section("休日")
             if not detail["holidays"]:
-                holiday_match = re.search(r'年間休日[:\s]*(\d+日?)', body_text)
+                holiday_match = _RE_DETAIL_ANNUAL_HOLIDAYS.search(body_text)
                 if holiday_match:
                     detail["holidays"] = f"年間休日 {holiday_match.group(1)}"
 
             # 学歴
-            detail["education"] = await extract_section("学歴")
+            detail["education"] = extract_section("学歴")
             if not detail["education"]:
                 if "大学以上" in body_text:
                     detail["education"] = "大学以上"
@@ -1328,16 +1523,16 @@ class HelloworkScraper(BaseScraper):
                     detail["education"] = "不問"
 
             # 必要な資格・免許
-            detail["required_license"] = await extract_section("必要な免許")
+            detail["required_license"] = extract_section("必要な免許")
             if not detail["required_license"]:
                 if "普通自動車" in body_text:
                     detail["required_license"] = "普通自動車運転免許"
 
             # 必要な経験
-            detail["required_experience"] = await extract_section("必要な経験")
+            detail["required_experience"] = extract_section("必要な経験")
 
             # 年齢
-            age_match = re.search(r'年齢[:\s]*(\d+歳[^\n]*)', body_text)
+            age_match = _RE_DETAIL_AGE.search(body_text)
             if age_match:
                 detail["age_limit"] = age_match.group(1)
 
@@ -1352,6 +1547,12 @@ class HelloworkScraper(BaseScraper):
             self.logger.error(f"詳細取得タイムアウト: {e}")
         except Exception as e:
             self.logger.error(f"詳細取得エラー: {e}")
+
+        # 会社名が取れた場合のみ保持する（失敗・不完全な結果は次回取り直す）
+        if job_url and detail.get("company_name"):
+            self._detail_cache[job_url] = dict(detail)
+            if len(self._detail_cache) > self.DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
         return detail
 
     async def scrape_with_details(
@@ -1377,6 +1578,8 @@ class HelloworkScraper(BaseScraper):
             重複チェックは _extract_job_list 内で同一ページ内のみ行う。
             異なる検索条件で同じ求人が出現するのは正常なので、
             セッション全体での重複チェックは行わない。
+            詳細取得は検索に使ったページのコンテキストから最大DETAIL_CONCURRENCY枚の
+            ページプールを作り、並行して行う。
         """
         if existing_job_ids is None:
             existing_job_ids = set()
@@ -1407,21 +1610,45 @@ class HelloworkScraper(BaseScraper):
 
         self.logger.info(f"詳細取得対象: {len(jobs_to_fetch)}件（検索結果: {len(jobs)}件）")
 
-        if fetch_details and jobs_to_fetch:
-            self.logger.info(f"{len(jobs_to_fetch)}件の詳細を取得中...")
-            for i, job in enumerate(jobs_to_fetch):
-                job_id = job.get("job_id")
-                if job_id:
-                    try:
-                        # job_idから直接詳細URLを構築してアクセス
-                        detail = await self.extract_detail_info(page, job_id)
-                        job.update(detail)
-                        # URLも正規化されたものに更新
-                        job["url"] = self._build_detail_url(job_id)
-                        self.logger.debug(f"詳細取得 ({i+1}/{len(jobs_to_fetch)}): {job_id}")
-                    except Exception as e:
-                        self.logger.debug(f"詳細取得失敗: {job_id}: {e}")
-                    await asyncio.sleep(1)
+        targets = [job for job in jobs_to_fetch if job.get("job_id")]
+        if fetch_details and targets:
+            self.logger.info(f"{len(targets)}件の詳細を取得中...")
+
+            # ページプールを作成（検索用ページも1枚として使用）
+            pool_size = min(self.DETAIL_CONCURRENCY, len(targets))
+            context = page.context
+            extra_pages: List[Page] = []
+            page_pool: asyncio.Queue = asyncio.Queue()
+            page_pool.put_nowait(page)
+
+            async def fetch_detail(index: int, job: Dict[str, Any]):
+                job_id = job["job_id"]
+                detail_page = await page_pool.get()
+                try:
+                    # job_idから直接詳細URLを構築してアクセス
+                    detail = await self.extract_detail_info(detail_page, job_id)
+                    job.update(detail)
+                    # URLも正規化されたものに更新
+                    job["url"] = self._build_detail_url(job_id)
+                    self.logger.debug(f"詳細取得 ({index+1}/{len(targets)}): {job_id}")
+                except Exception as e:
+                    self.logger.debug(f"詳細取得失敗: {job_id}: {e}")
+                finally:
+                    page_pool.put_nowait(detail_page)
+
+            try:
+                # 開いた分だけfinallyで閉じられるよう、1枚ずつリストに追加する
+                for _ in range(pool_size - 1):
+                    extra_page = await context.new_page()
+                    extra_pages.append(extra_page)
+                    if hasattr(context, '_block_resources') and context._block_resources:
+                        await context._setup_route_blocking(extra_page)
+                    page_pool.put_nowait(extra_page)
+
+                await asyncio.gather(*[fetch_detail(i, job) for i, job in enumerate(targets)])
+            finally:
+                for extra_page in extra_pages:
+                    await extra_page.close()
 
         if jobs_to_fetch:
             jobs_to_fetch[0]["_meta"] = {
@@ -5,9 +5,10 @@ Indeed Japan専用スクレイパー
 import asyncio
 import random
 import re
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import quote
-from playwright.async_api import Page, Browser, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
 from .base_scraper import BaseScraper
 from utils.user_agents import ua_rotator
 from utils.proxy import proxy_rotator
@@ -16,12 +17,77 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# カードのテキストから給与、詳細URLから求人ID（jk）を拾う正規表現
+_RE_SALARY = re.compile(r'(月給|年収|時給)[\s\d,.万円~～\-−]+')
+_RE_JOB_KEY = re.compile(r'jk=([a-f0-9]+)')
+# 勤務地らしい行の判定（都道府県名の一部を含むか）
+_RE_LOCATION_HINT = re.compile(r'東京|大阪|北海道|京都|[県府都]')
+
+# 求人カードを1回のevaluateでまとめて読み取る: [タイトル, 会社名, カード全体のテキスト, 詳細URL]
+# （要素がない項目はnull。カード・要素ごとのPlaywright呼び出しをまとめる）
+_CARDS_JS = """(selector) => Array.from(document.querySelectorAll(selector), card => {
+    const title = card.querySelector('.jobTitle');
+    const company = card.querySelector("[data-testid='company-name']");
+    const link = card.querySelector('a.jcs-JobTitle') || card.querySelector('h2 a');
+    return [
+        title ? title.innerText.trim() : null,
+        company ? company.innerText.trim() : null,
+        card.innerText,
+        link ? link.getAttribute('href') : null,
+    ];
+})"""
+
+# 検索結果0件ページの判定文言
+_NO_RESULTS_PATTERNS = (
+    "求人が見つかりませんでした",
+    "に一致する求人はありません",
+    "検索条件に一致する求人がありません",
+    "該当する求人がありません",
+    "No results found",
+    "0件の求人",
+)
+
+# 本文に判定文言のいずれかが含まれるか
+_HAS_PHRASE_JS = """(phrases) => {
+    const text = document.body ? document.body.innerText : '';
+    return phrases.some(p => text.includes(p));
+}"""
+
+# 求人カードが描画されたか、0件ページと判定できるまで待つ条件
+_CARDS_OR_NO_RESULTS_JS = """([selector, phrases]) => {
+    if (document.querySelector(selector)) return true;
+    const text = document.body ? document.body.innerText : '';
+    return phrases.some(p => text.includes(p));
+}"""
+
+# 検索結果ページに埋め込まれた求人カードのJSON（window.mosaic.providerData）
+# カードのDOMを1件ずつ読む代わりに、1回のevaluateで全件を取得する
+_PROVIDER_RESULTS_JS = """() => {
+    const provider = window.mosaic && window.mosaic.providerData
+        && window.mosaic.providerData['mosaic-provider-jobcards'];
+    const model = provider && provider.metaData && provider.metaData.mosaicProviderJobCardsModel;
+    return (model && model.results) || null;
+}"""
+
+
+# ページ番号だけを変えて同じキーワード・エリアで繰り返し呼ばれるため、URLエンコード結果をキャッシュする
+@lru_cache(maxsize=256)
+def _encode_query(keyword: str, area: str) -> Tuple[str, str]:
+    """検索キーワードとエリア名をURLエンコード"""
+    return quote(keyword), quote(area)
+
 
 class IndeedScraper(BaseScraper):
     """Indeed Japan用スクレイパー"""
 
+    # scrape_single_pageで使い回すために保持するコンテキスト数の上限（BaseScraper.scrapeの並列数上限に合わせる）
+    MAX_CONTEXTS = 2
+
     def __init__(self):
         super().__init__(site_name="indeed")
+        # scrape_single_pageで使い回すStealthコンテキスト（ブラウザが変わったら作り直す）
+        self._context_pool: List[BrowserContext] = []
+        self._pool_browser: Optional[Browser] = None
 
     def generate_search_url(self, keyword: str, area: str, page: int = 1) -> str:
         """
@@ -46,79 +112,127 @@ class IndeedScraper(BaseScraper):
         offset = (page - 1) * increment
 
         # URLエンコード
-        encoded_keyword = quote(search_keyword)
-        encoded_area = quote(area_name)
+        encoded_keyword, encoded_area = _encode_query(search_keyword, area_name)
 
         url = f"https://jp.indeed.com/jobs?q={encoded_keyword}&l={encoded_area}&start={offset}"
         logger.info(f"Generated Indeed URL: {url}")
 
         return url
 
-    async def _extract_card_data(self, card) -> Optional[Dict[str, Any]]:
+    def _build_job_from_card(self, title: Optional[str], company_name: Optional[str],
+                             card_text: str, href: Optional[str]) -> Optional[Dict[str, Any]]:
         """
-        求人カードからデータを抽出
+        求人カードの読み取り結果（_CARDS_JSの1要素）からデータを作成
         2024年版 - テキスト解析方式
         """
-        try:
-            data = {}
-
-            # タイトル
-            title_elem = await card.query_selector(".jobTitle")
-            if title_elem:
-                data["title"] = (await title_elem.inner_text()).strip()
-
-            # 会社名
-            company_elem = await card.query_selector("[data-testid='company-name']")
-            if company_elem:
-                data["company_name"] = (await company_elem.inner_text()).strip()
-
-            # カード全体のテキストを取得（勤務地・給与の抽出用）
-            card_text = await card.inner_text()
-            lines = card_text.split('\n')
-
-            # 勤務地 - 会社名の次の行から抽出
-            if data.get("company_name"):
-                for j, line in enumerate(lines):
-                    if data["company_name"] in line and j + 1 < len(lines):
-                        location = lines[j + 1].strip()
-                        # 勤務地らしい行かチェック（都道府県名を含む）
-                        if any(pref in location for pref in ["東京", "大阪", "北海道", "京都", "県", "府", "都"]):
-                            data["location"] = location
-                        break
-
-            # 給与 - テキストから正規表現で抽出
-            salary_match = re.search(r'(月給|年収|時給)[\s\d,.万円~～\-−]+', card_text)
-            if salary_match:
-                data["salary"] = salary_match.group(0).strip()
-
-            # 詳細ページURL
-            link_elem = await card.query_selector("a.jcs-JobTitle")
-            if not link_elem:
-                link_elem = await card.query_selector("h2 a")
-            if link_elem:
-                href = await link_elem.get_attribute("href")
-                if href:
-                    if href.startswith("/"):
-                        href = f"https://jp.indeed.com{href}"
-                    data["page_url"] = href
-
-                    # 求人IDを抽出
-                    jk_match = re.search(r'jk=([a-f0-9]+)', href)
-                    if jk_match:
-                        data["job_number"] = jk_match.group(1)
-
-            # サイト名
-            data["site"] = "Indeed"
-
-            # タイトルがあれば返す
-            if data.get("title"):
-                return data
+        data = {}
+
+        # タイトル
+        if title is not None:
+            data["title"] = title
+
+        # 会社名
+        if company_name is not None:
+            data["company_name"] = company_name
+
+        # カード全体のテキスト（勤務地・給与の抽出用）
+        lines = card_text.split('\n')
+
+        # 勤務地 - 会社名の次の行から抽出
+        if data.get("company_name"):
+            company_line = next(
+                (j for j, line in enumerate(lines[:-1]) if data["company_name"] in line), None
+            )
+            if company_line is not None:
+                location = lines[company_line + 1].strip()
+                # 勤務地らしい行かチェック（都道府県名を含む）
+                if _RE_LOCATION_HINT.search(location):
+                    data["location"] = location
+
+        # 給与 - テキストから正規表現で抽出
+        salary_match = _RE_SALARY.search(card_text)
+        if salary_match:
+            data["salary"] = salary_match.group(0).strip()
+
+        # 詳細ページURL
+        if href:
+            if href.startswith("/"):
+                href = f"https://jp.indeed.com{href}"
+            data["page_url"] = href
+
+            # 求人IDを抽出
+            jk_match = _RE_JOB_KEY.search(href)
+            if jk_match:
+                data["job_number"] = jk_match.group(1)
+
+        # サイト名
+        data["site"] = "Indeed"
+
+        # タイトルがあれば返す
+        if data.get("title"):
+            return data
+
+        return None
+
+    async def _read_cards(self, page: Page, card_selector: str) -> List[list]:
+        """検索結果の全カードを1回のevaluateで読み取る（_CARDS_JS）"""
+        return await page.evaluate(_CARDS_JS, card_selector)
+
+    def _build_jobs_from_cards(self, cards: List[list]) -> List[Dict[str, Any]]:
+        """_CARDS_JSで読み取った全カードから求人リストを作成（タイトルのないカードは除外）"""
+        jobs = []
+        for card in cards:
+            try:
+                job_data = self._build_job_from_card(*card)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                logger.error(f"Error extracting job card: {e}")
+        return jobs
 
+    def _build_job_from_provider_record(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """埋め込みJSONの1レコードから求人データを作成（_build_job_from_cardと同じキー）"""
+        title = (record.get("title") or record.get("displayTitle") or "").strip()
+        if not title:
             return None
 
+        data = {"title": title}
+        if record.get("company"):
+            data["company_name"] = record["company"].strip()
+        if record.get("formattedLocation"):
+            data["location"] = record["formattedLocation"].strip()
+        salary = (record.get("salarySnippet") or {}).get("text")
+        if salary:
+            data["salary"] = salary.strip()
+        jobkey = record.get("jobkey")
+        if jobkey:
+            data["page_url"] = f"https://jp.indeed.com/viewjob?jk={jobkey}"
+            data["job_number"] = jobkey
+        data["site"] = "Indeed"
+        return data
+
+    async def _extract_jobs_from_provider_data(self, page: Page) -> List[Dict[str, Any]]:
+        """埋め込みJSONから求人リストを取得
+
+        JSONが見つからない・読めない場合は空リストを返し、呼び出し側でカードのDOM解析に切り替える。
+        """
+        try:
+            records = await page.evaluate(_PROVIDER_RESULTS_JS)
         except Exception as e:
-            logger.error(f"Error extracting card data: {e}")
-            return None
+            logger.debug(f"[Indeed] 埋め込みJSON取得エラー（DOM解析に切り替え）: {e}")
+            return []
+        if not records:
+            return []
+
+        jobs = []
+        for record in records:
+            try:
+                job_data = self._build_job_from_provider_record(record)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                logger.debug(f"[Indeed] 埋め込みJSONレコード解析エラー: {e}")
+        return jobs
 
     async def search_jobs(self, page: Page, keyword: str, area: str, max_pages: int = 5) -> List[Dict[str, Any]]:
         """
@@ -137,9 +251,6 @@ class IndeedScraper(BaseScraper):
                     timeout=30000
                 )
 
-                # ページロード後の待機（JS描画用）
-                await page.wait_for_timeout(3000)
-
                 if response and response.status == 403:
                     logger.error(f"Access blocked (403): {url}")
                     # 403でも既に取得したデータは返す
@@ -148,28 +259,29 @@ class IndeedScraper(BaseScraper):
                 # 求人カードを取得
                 card_selector = self.selectors.get("job_cards", ".job_seen_beacon")
 
-                # カードが描画されるまで待機
+                # カードが描画されるまで待機（固定の待機はしない）
                 try:
                     await page.wait_for_selector(card_selector, timeout=10000)
                 except PlaywrightTimeoutError:
                     logger.warning(f"No job cards found on page {page_num}")
                     break
 
-                job_cards = await page.query_selector_all(card_selector)
+                # 埋め込みJSONがあればカードのDOM解析を省略する
+                provider_jobs = await self._extract_jobs_from_provider_data(page)
+                if provider_jobs:
+                    logger.info(f"Found {len(provider_jobs)} jobs on page {page_num} (embedded JSON)")
+                    all_jobs.extend(provider_jobs)
+                    await page.wait_for_timeout(random.uniform(1000, 2000))
+                    continue
+
+                job_cards = await self._read_cards(page, card_selector)
                 logger.info(f"Found {len(job_cards)} jobs on page {page_num}")
 
                 if len(job_cards) == 0:
                     logger.info(f"No more jobs found at page {page_num}")
                     break
 
-                for card in job_cards:
-                    try:
-                        job_data = await self._extract_card_data(card)
-                        if job_data:
-                            all_jobs.append(job_data)
-                    except Exception as e:
-                        logger.error(f"Error extracting job card: {e}")
-                        continue
+                all_jobs.extend(self._build_jobs_from_cards(job_cards))
 
                 # 次のページへの待機
                 await page.wait_for_timeout(random.uniform(1000, 2000))
@@ -190,12 +302,55 @@ class IndeedScraper(BaseScraper):
     ) -> List[Dict[str, Any]]:
         """
         Indeed用: 1ページを並列用にスクレイピング
+        コンテキストはタスク間で使い回し、ページだけをタスクごとに開閉する
+        （403などでブロック・取得失敗したコンテキストは使い回さずに閉じる）
         """
         # タスク開始前にスタッガード遅延（同時アクセスを避ける）
         stagger_delay = task_idx * 2.0 + random.uniform(1.0, 2.0)
         logger.info(f"[タスク{task_idx+1}] {stagger_delay:.1f}秒後に開始...")
         await asyncio.sleep(stagger_delay)
 
+        context = await self._acquire_context(browser)
+
+        jobs = []
+        reusable = False
+        try:
+            page = await context.new_page()
+            try:
+                await StealthConfig.apply_stealth_scripts(page)
+                if hasattr(context, '_block_resources') and context._block_resources:
+                    await context._setup_route_blocking(page)
+
+                # Indeed用の1ページ取得処理
+                # ブロック・取得失敗したコンテキストは使い回さず閉じる（Cookie・UA・プロキシを替える）
+                jobs, reusable = await self._scrape_search_page(page, keyword, area, page_num)
+
+                self.performance_monitor.record_item(len(jobs))
+            finally:
+                await page.close()
+
+        except Exception as e:
+            logger.error(f"Error scraping page {page_num}: {e}", exc_info=True)
+
+        finally:
+            await self._release_context(browser, context, reusable)
+
+        return jobs
+
+    async def _acquire_context(self, browser: Browser) -> BrowserContext:
+        """scrape_single_page用のコンテキストを取得
+
+        空いているコンテキストがあれば使い回し、なければ新しく作成する。
+        User-Agent・プロキシはコンテキスト作成時にローテーションする。
+        """
+        if self._pool_browser is not browser:
+            # 前回のブラウザのコンテキストはブラウザと一緒に閉じられている
+            self._context_pool = []
+            self._pool_browser = browser
+
+        if self._context_pool:
+            return self._context_pool.pop()
+
         # User-Agentをローテーション
         user_agent = ua_rotator.get_random()
 
@@ -207,29 +362,24 @@ class IndeedScraper(BaseScraper):
                 proxy_config = proxy.to_playwright_format()
 
         # Stealthコンテキスト作成
-        context = await create_stealth_context(
+        return await create_stealth_context(
             browser,
             user_agent=user_agent,
             proxy=proxy_config
         )
 
-        jobs = []
-        try:
-            page = await context.new_page()
-            await StealthConfig.apply_stealth_scripts(page)
-
-            # Indeed用の1ページ取得処理
-            jobs = await self._scrape_single_page_impl(page, keyword, area, page_num)
-
-            self.performance_monitor.record_item(len(jobs))
-
-        except Exception as e:
-            logger.error(f"Error scraping page {page_num}: {e}", exc_info=True)
+    async def _release_context(self, browser: Browser, context: BrowserContext, reusable: bool):
+        """コンテキストを空きに戻す
 
-        finally:
+        エラーになったコンテキストと、上限を超える分は閉じる。
+        """
+        if reusable and self._pool_browser is browser and len(self._context_pool) < self.MAX_CONTEXTS:
+            self._context_pool.append(context)
+            return
+        try:
             await context.close()
-
-        return jobs
+        except Exception as e:
+            logger.debug(f"コンテキストのクローズに失敗: {e}")
 
     async def _check_no_results(self, page: Page) -> bool:
         """
@@ -237,29 +387,24 @@ class IndeedScraper(BaseScraper):
         早期にリターンしてセレクタタイムアウトを避ける
         """
         try:
-            no_results = await page.evaluate("""() => {
-                const body = document.body.innerText;
-                return body.includes('求人が見つかりませんでした') ||
-                       body.includes('に一致する求人はありません') ||
-                       body.includes('検索条件に一致する求人がありません') ||
-                       body.includes('該当する求人がありません') ||
-                       body.includes('No results found') ||
-                       body.includes('0件の求人');
-            }""")
-            return no_results
+            return await page.evaluate(_HAS_PHRASE_JS, list(_NO_RESULTS_PATTERNS))
         except Exception as e:
             logger.debug(f"[Indeed] 0件チェックエラー（続行）: {e}")
             return False
 
-    async def _scrape_single_page_impl(
+    async def _scrape_search_page(
         self,
         page: Page,
         keyword: str,
         area: str,
         page_num: int
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """
         Indeed: 1ページ分の求人を取得する実装
+
+        Returns:
+            (求人リスト, 取得に成功したか)
+            403・ナビゲーションエラー・カードの描画タイムアウトはブロックされた可能性があるためFalse
         """
         jobs = []
         url = self.generate_search_url(keyword, area, page_num)
@@ -272,48 +417,55 @@ class IndeedScraper(BaseScraper):
                 timeout=60000
             )
 
-            # DOMロード後に追加で待機（JSレンダリング用）
-            await page.wait_for_timeout(3000)
-
             if response and response.status == 403:
                 logger.error(f"Access blocked (403): {url}")
-                return jobs
+                return jobs, False
 
             if response and response.status == 404:
                 logger.warning(f"Page not found: {url}")
-                return jobs
+                return jobs, True
+
+            card_selector = self.selectors.get("job_cards", ".job_seen_beacon")
+
+            # 固定の待機ではなく、カードの描画か0件表示のどちらかを待つ
+            try:
+                # 既定のrequestAnimationFrame毎ではなく250ms間隔で判定する（本文を読むため）
+                await page.wait_for_function(
+                    _CARDS_OR_NO_RESULTS_JS, arg=[card_selector, list(_NO_RESULTS_PATTERNS)],
+                    polling=250, timeout=10000
+                )
+            except PlaywrightTimeoutError:
+                logger.debug(f"[Indeed] 描画待機タイムアウト (ページ{page_num})")
 
             # ★ 検索結果0件の早期検出（10秒タイムアウトを避けて次のエリアに進む）
             no_results_detected = await self._check_no_results(page)
             if no_results_detected:
                 logger.info(f"[Indeed] 検索結果0件を検出 - {area} × {keyword} (ページ{page_num})")
-                return jobs  # 空リストを返して次のエリアへ
-
-            card_selector = self.selectors.get("job_cards", ".job_seen_beacon")
+                return jobs, True  # 空リストを返して次のエリアへ
 
             # カードが描画されるまで待機
             try:
                 await page.wait_for_selector(card_selector, timeout=10000)
             except PlaywrightTimeoutError:
                 logger.warning(f"Job cards not found on page {page_num}")
-                return jobs
+                return jobs, False
 
-            job_cards = await page.query_selector_all(card_selector)
+            # 埋め込みJSONがあればカードのDOM解析を省略する
+            provider_jobs = await self._extract_jobs_from_provider_data(page)
+            if provider_jobs:
+                logger.info(f"Found {len(provider_jobs)} jobs on page {page_num} (embedded JSON)")
+                return provider_jobs, True
+
+            job_cards = await self._read_cards(page, card_selector)
             logger.info(f"Found {len(job_cards)} jobs on page {page_num}")
 
-            for card in job_cards:
-                try:
-                    job_data = await self._extract_card_data(card)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    logger.error(f"Error extracting job card: {e}")
-                    continue
+            jobs = self._build_jobs_from_cards(job_cards)
 
         except Exception as e:
             logger.error(f"Error fetching page {page_num}: {e}")
+            return jobs, False
 
-        return jobs
+        return jobs, True
 
     async def extract_detail_info(self, page: Page, url: str) -> Dict[str, Any]:
         """
@@ -322,7 +474,8 @@ class IndeedScraper(BaseScraper):
         detail_data = {}
 
         try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+            # 画像・フォントはページ単位のルートでブロックしているため、networkidleではなくDOM構築完了まで待つ
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             await page.wait_for_timeout(2000)
 
             # 求人説明文
@@ -7,15 +7,70 @@ JSON-LD構造化データを活用したスクレイピング
 import asyncio
 import random
 import re
-import json
-from typing import Dict, Any, List, Optional
-from playwright.async_api import Page, Browser, TimeoutError as PlaywrightTimeoutError
-from .base_scraper import BaseScraper
-from utils.stealth import StealthConfig, create_stealth_context
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+from playwright.async_api import Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
+from .base_scraper import BaseScraper, build_prefecture_lookup
+from utils.stealth import create_stealth_context
+from utils.rate_limit import AdaptiveConcurrency
 import logging
 
+# __NEXT_DATA__・JSON-LDのパースはorjsonがあれば使う（未インストール時は標準json）
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 logger = logging.getLogger(__name__)
 
+# 詳細URLから求人ID（/hh/12345/ の数字部分）を取り出す
+_RE_DETAIL_URL_JOB_ID = re.compile(r'/(\d+)/?(?:[?#]|$)')
+
+# 求人カードのhrefを1回の評価でまとめて取得する（カードごとのget_attributeを避ける）
+_CARD_HREFS_JS = "(links) => links.map(a => a.getAttribute('href'))"
+
+# 検索結果0件の表示（要素のテキスト全体と完全一致で比較する）
+_NO_RESULTS_TEXTS = ("該当する求人がありません", "0件")
+
+# 要素のテキスト全体が0件表示と一致するかを1回のevaluateで判定するJS
+# （text="0件" と同じ完全一致。本文の「検討中 0件」などには反応しない）
+_NO_RESULTS_JS = """(texts) => {
+    const targets = new Set(texts);
+    const maxLength = Math.max(...texts.map(t => t.length));
+    const walker = document.createTreeWalker(document.body || document.documentElement, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        // 目的の文字列の一部になり得るテキストだけを調べる
+        const value = node.nodeValue.trim();
+        if (!value || !texts.some(t => t.includes(value))) continue;
+        // 文字列が分割されている場合に備え、テキストが目的の長さを超えるまで祖先もたどる
+        for (let el = node.parentElement; el; el = el.parentElement) {
+            const text = el.textContent.replace(/\\s+/g, ' ').trim();
+            if (text.length > maxLength) break;
+            if (targets.has(text)) return true;
+        }
+    }
+    return false;
+}"""
+
+# 求人カードが描画されたか、0件ページと判定できるまで待つ条件
+_CARDS_OR_NO_RESULTS_JS = (
+    "([selector, texts]) => document.querySelector(selector) !== null || (" + _NO_RESULTS_JS + ")(texts)"
+)
+
+# 詳細ページのHTMLから__NEXT_DATA__の中身を取り出す（SSRでHTMLに埋め込まれている）
+_RE_NEXT_DATA_SCRIPT = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# 詳細ページの__NEXT_DATA__とJSON-LDを1回のevaluateで取得するJS
+_DETAIL_SOURCES_JS = """() => {
+    const nextData = document.getElementById('__NEXT_DATA__');
+    return {
+        next_data: nextData ? nextData.textContent : null,
+        json_ld: Array.from(document.querySelectorAll('script[type="application/ld+json"]'), s => s.textContent),
+    };
+}"""
+
 
 class JobmedleyScraper(BaseScraper):
     """ジョブメドレー用スクレイパー"""
@@ -32,6 +87,8 @@ class JobmedleyScraper(BaseScraper):
         "徳島": 36, "香川": 37, "愛媛": 38, "高知": 39,
         "福岡": 40, "佐賀": 41, "長崎": 42, "熊本": 43, "大分": 44, "宮崎": 45, "鹿児島": 46, "沖縄": 47,
     }
+    # 「東京」「東京都」「京都府」などの表記ゆれをまとめて引ける表
+    _PREF_LOOKUP = build_prefecture_lookup(PREFECTURE_IDS)
 
     # 職種カテゴリコード
     CATEGORY_CODES = {
@@ -101,9 +158,33 @@ class JobmedleyScraper(BaseScraper):
         # その他は「医療・介護」カテゴリ
     }
 
+    # マッピングは実行中に変更しないため読み取り専用にする
+    PREFECTURE_IDS = MappingProxyType(PREFECTURE_IDS)
+    CATEGORY_CODES = MappingProxyType(CATEGORY_CODES)
+    KEYWORD_TO_CATEGORY = MappingProxyType(KEYWORD_TO_CATEGORY)
+
+    # scrape_with_detailで同時に開く詳細ページ数（初期値と上限）
+    # 取得失敗が出るたびに1つ減らし、成功が続けば上限まで1つずつ増やす
+    DETAIL_CONCURRENCY = 4
+    DETAIL_MAX_CONCURRENCY = 8
+    # 取得に失敗した詳細を再取得するまでの待機（秒、連続失敗回数に応じて倍にする）の上限
+    DETAIL_RETRY_MAX_DELAY = 30
+    # 取得済み詳細を保持する件数と有効期限（秒）
+    DETAIL_CACHE_SIZE = 2048
+    DETAIL_CACHE_TTL = 24 * 60 * 60
+    # scrape_with_detailの呼び出し間で使い回すコンテキスト数と、1つのコンテキストの使用回数上限
+    # （上限に達したら閉じて作り直し、Cookie・キャッシュが溜まり続けないようにする）
+    MAX_CONTEXTS = 2
+    CONTEXT_MAX_USES = 20
+
     def __init__(self):
         super().__init__(site_name="jobmedley")
         self._realtime_callback = None
+        # 求人ID → (取得時刻, 取得済み詳細)（古いものから破棄）
+        self._detail_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # 空いているコンテキストと使用回数（ブラウザが変わったら作り直す）
+        self._context_pool: List[Tuple[BrowserContext, int]] = []
+        self._pool_browser: Optional[Browser] = None
 
     def set_realtime_callback(self, callback):
         """リアルタイム件数コールバックを設定"""
@@ -116,8 +197,7 @@ class JobmedleyScraper(BaseScraper):
 
     def _get_prefecture_id(self, area: str) -> Optional[int]:
         """エリア名から都道府県IDを取得"""
-        area_clean = area.rstrip("都府県")
-        return self.PREFECTURE_IDS.get(area_clean, self.PREFECTURE_IDS.get(area))
+        return self._PREF_LOOKUP.get(area)
 
     def _get_category_code(self, keyword: str) -> str:
         """キーワードから職種カテゴリコードを取得"""
@@ -136,23 +216,24 @@ class JobmedleyScraper(BaseScraper):
         - order=2 は新着順
         - ページ指定: page={page}
         """
+        url = self._page_url(self._build_base_url(keyword, area), page)
+        logger.info(f"[ジョブメドレー] 生成URL: {url}")
+        return url
+
+    def _build_base_url(self, keyword: str, area: str) -> str:
+        """1ページ目の検索URL（新着順）を生成（キーワード・エリアごとに1回だけ組み立てる）"""
         pref_id = self._get_prefecture_id(area)
         if not pref_id:
             logger.warning(f"[ジョブメドレー] 未知の都道府県: {area}")
             pref_id = 13  # デフォルト: 東京
 
         category_code = self._get_category_code(keyword)
+        return f"https://job-medley.com/{category_code}/pref{pref_id}/?order=2"  # order=2 は新着順
 
-        base_url = f"https://job-medley.com/{category_code}/pref{pref_id}/"
-
-        # クエリパラメータ
-        params = ["order=2"]  # 新着順
-        if page > 1:
-            params.append(f"page={page}")
-
-        url = f"{base_url}?{'&'.join(params)}"
-        logger.info(f"[ジョブメドレー] 生成URL: {url}")
-        return url
+    @staticmethod
+    def _page_url(base_url: str, page: int) -> str:
+        """1ページ目のURLにページ番号を付ける"""
+        return base_url if page <= 1 else f"{base_url}&page={page}"
 
     async def search_jobs(
         self,
@@ -175,18 +256,54 @@ class JobmedleyScraper(BaseScraper):
         Returns:
             求人データのリスト
         """
+        jobs, _ = await self._search_pages(page, keyword, area, max_pages, seen_job_ids)
+        return jobs
+
+    async def _search_pages(
+        self,
+        page: Page,
+        keyword: str,
+        area: str,
+        max_pages: int,
+        seen_job_ids: Optional[set]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        search_jobsの実装
+
+        Returns:
+            (求人データのリスト, 取得に成功したか)
+            タイムアウト・エラー・求人カードの描画待機タイムアウトがあればFalse
+        """
         all_jobs = []
+        ok = True
         seen_job_ids = seen_job_ids or set()
         category = self._get_category(keyword)
         category_code = self._get_category_code(keyword)
+        # カード選択子と詳細リンク（/sr/12345/ 形式）のパターンはページ間で共通
+        # 部分一致（*=）ではなく前方一致（^=）にして、他カテゴリへのリンク等を拾わないようにする
+        # （絶対URLで書かれたリンクも対象にする。/sr/ 直下の一覧リンク等は href_pattern で除外）
+        card_selector = f'a[href^="/{category_code}/"], a[href^="https://job-medley.com/{category_code}/"]'
+        href_pattern = re.compile(rf'/{re.escape(category_code)}/(\d+)/?')
+        base_url = self._build_base_url(keyword, area)
 
         for page_num in range(1, max_pages + 1):
             try:
-                url = self.generate_search_url(keyword, area, page_num)
+                url = self._page_url(base_url, page_num)
                 logger.info(f"[ジョブメドレー] ページ {page_num} を取得中: {url}")
 
+                # 固定の2〜4秒待機ではなく、求人カードか0件表示が出るまで待つ
+                # （"commit"だとHTMLの途中で最初のカードが見つかり、残りを取りこぼすためDOM構築完了までは待つ）
                 await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                await page.wait_for_timeout(random.randint(2000, 4000))
+                try:
+                    # 既定のrequestAnimationFrame毎ではなく250ms間隔で判定する（テキストを走査するため）
+                    await page.wait_for_function(
+                        _CARDS_OR_NO_RESULTS_JS, arg=[card_selector, list(_NO_RESULTS_TEXTS)],
+                        polling=250, timeout=10000
+                    )
+                except PlaywrightTimeoutError:
+                    logger.debug(f"[ジョブメドレー] ページ {page_num} 求人カード待機タイムアウト")
+                    ok = False
+                await page.wait_for_timeout(random.randint(300, 800))
 
                 # 検索結果が0件かチェック
                 no_results = await self._check_no_results(page)
@@ -194,60 +311,47 @@ class JobmedleyScraper(BaseScraper):
                     logger.info(f"[ジョブメドレー] 検索結果が0件です")
                     break
 
-                # 求人カードを取得
-                job_cards = await page.query_selector_all('a[href*="/' + category_code + '/"]')
+                # 求人カードのhrefを取得
+                hrefs = await page.eval_on_selector_all(card_selector, _CARD_HREFS_JS)
 
-                if not job_cards:
+                if not hrefs:
                     logger.info(f"[ジョブメドレー] ページ {page_num} に求人がありません")
                     break
 
                 page_jobs = []
-                for card in job_cards:
-                    try:
-                        href = await card.get_attribute("href")
-                        if not href:
-                            continue
-
-                        # 詳細ページへのリンクのみ（/sr/12345/ 形式）
-                        match = re.search(rf'/{category_code}/(\d+)/?', href)
-                        if not match:
-                            continue
-
-                        job_id = match.group(1)
-
-                        # 重複チェック
-                        if job_id in seen_job_ids:
-                            continue
-                        seen_job_ids.add(job_id)
-
-                        # 基本情報を取得
-                        job_data = {
-                            "job_id": f"jobmedley_{job_id}",
-                            "source_job_id": job_id,
-                            "url": f"https://job-medley.com{href}" if href.startswith("/") else href,
-                            "site": "jobmedley",
-                            "keyword": keyword,
-                            "category": category,
-                            "area": area,
-                        }
-
-                        page_jobs.append(job_data)
-
-                    except Exception as e:
-                        logger.debug(f"[ジョブメドレー] カード解析エラー: {e}")
+                for href in hrefs:
+                    if not href:
+                        continue
+
+                    # 詳細ページへのリンクのみ（/sr/12345/ 形式）
+                    match = href_pattern.search(href)
+                    if not match:
                         continue
 
-                # 重複を除去
-                unique_jobs = []
-                seen_in_page = set()
-                for job in page_jobs:
-                    if job["job_id"] not in seen_in_page:
-                        seen_in_page.add(job["job_id"])
-                        unique_jobs.append(job)
+                    job_id = match.group(1)
 
-                all_jobs.extend(unique_jobs)
+                    # 重複チェック
+                    if job_id in seen_job_ids:
+                        continue
+                    seen_job_ids.add(job_id)
+
+                    # 基本情報を取得
+                    job_data = {
+                        "job_id": f"jobmedley_{job_id}",
+                        "source_job_id": job_id,
+                        "url": f"https://job-medley.com{href}" if href.startswith("/") else href,
+                        "site": "jobmedley",
+                        "keyword": keyword,
+                        "category": category,
+                        "area": area,
+                    }
+
+                    page_jobs.append(job_data)
+
+                # seen_job_idsでページ内・ページ間の重複は除去済み
+                all_jobs.extend(page_jobs)
                 self._report_count(len(all_jobs))
-                logger.info(f"[ジョブメドレー] ページ {page_num}: {len(unique_jobs)} 件取得 (累計: {len(all_jobs)} 件)")
+                logger.info(f"[ジョブメドレー] ページ {page_num}: {len(page_jobs)} 件取得 (累計: {len(all_jobs)} 件)")
 
                 # 次のページがあるかチェック
                 has_next = await self._has_next_page(page, page_num)
@@ -260,26 +364,19 @@ class JobmedleyScraper(BaseScraper):
 
             except PlaywrightTimeoutError:
                 logger.warning(f"[ジョブメドレー] ページ {page_num} タイムアウト")
+                ok = False
                 break
             except Exception as e:
                 logger.error(f"[ジョブメドレー] ページ {page_num} エラー: {e}")
+                ok = False
                 break
 
-        return all_jobs
+        return all_jobs, ok
 
     async def _check_no_results(self, page: Page) -> bool:
         """検索結果が0件かチェック"""
         try:
-            # 0件表示のチェック
-            no_result_elem = await page.query_selector('text="該当する求人がありません"')
-            if no_result_elem:
-                return True
-
-            no_result_elem = await page.query_selector('text="0件"')
-            if no_result_elem:
-                return True
-
-            return False
+            return await page.evaluate(_NO_RESULTS_JS, list(_NO_RESULTS_TEXTS))
         except Exception:
             return False
 
@@ -301,15 +398,56 @@ class JobmedleyScraper(BaseScraper):
             return False
 
     async def extract_detail_info(self, page: Page, url: str) -> Dict[str, Any]:
-        """詳細ページから追加情報を取得"""
-        detail_data = {}
+        """
+        詳細ページから追加情報を取得
+
+        同じ求人IDの詳細をDETAIL_CACHE_TTL秒以内に取得済みなら、ページを開かずにそれを返す。
+        （キーワード・エリアの組み合わせが違っても同じ求人が出ることが多いため）
+        """
+        match = _RE_DETAIL_URL_JOB_ID.search(url)
+        cache_key = match.group(1) if match else url
+
+        cached = self._detail_cache.get(cache_key)
+        if cached is not None:
+            fetched_at, cached_detail = cached
+            if time.monotonic() - fetched_at < self.DETAIL_CACHE_TTL:
+                self._detail_cache.move_to_end(cache_key)
+                logger.debug(f"[ジョブメドレー] 詳細取得済み（キャッシュ）: {url}")
+                return dict(cached_detail)
+            del self._detail_cache[cache_key]
+
+        detail_data = await self._fetch_detail_info(page, url)
+
+        # タイトルか施設名が取れた場合のみ保持する（失敗・不完全な結果は次回取り直す）
+        if detail_data.get("title") or detail_data.get("company_name"):
+            self._detail_cache[cache_key] = (time.monotonic(), dict(detail_data))
+            if len(self._detail_cache) > self.DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
+        return detail_data
+
+    async def _fetch_detail_info(self, page: Page, url: str) -> Dict[str, Any]:
+        """
+        詳細ページから情報を取得
+
+        まずHTMLだけを取得して__NEXT_DATA__を読み、取れなかった場合のみページを開く。
+        """
+        detail_data = await self._fetch_next_data_html(page, url)
+        if detail_data:
+            return detail_data
 
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(random.randint(1500, 3000))
+            # 固定待機ではなく__NEXT_DATA__の出現を待つ（無い構成のページはJSON-LD/HTMLにフォールバック）
+            # アクセス間隔の待機は呼び出し側で行う
+            try:
+                await page.wait_for_selector('script#__NEXT_DATA__', state="attached", timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"[ジョブメドレー] __NEXT_DATA__待機タイムアウト: {url}")
+
+            sources = await page.evaluate(_DETAIL_SOURCES_JS)
 
             # __NEXT_DATA__ からJSON取得を試みる
-            next_data = await self._extract_next_data(page)
+            next_data = self._load_next_data(sources["next_data"])
             if next_data:
                 detail_data = self._parse_next_data(next_data)
                 if detail_data:
@@ -317,7 +455,7 @@ class JobmedleyScraper(BaseScraper):
                     return detail_data
 
             # JSON-LDから取得を試みる
-            json_ld_data = await self._extract_json_ld(page)
+            json_ld_data = self._find_job_posting(sources["json_ld"])
             if json_ld_data:
                 detail_data = self._parse_json_ld(json_ld_data)
                 if detail_data:
@@ -332,13 +470,38 @@ class JobmedleyScraper(BaseScraper):
 
         return detail_data
 
-    async def _extract_next_data(self, page: Page) -> Optional[Dict]:
-        """__NEXT_DATA__スクリプトからデータ取得"""
+    async def _fetch_next_data_html(self, page: Page, url: str) -> Dict[str, Any]:
+        """
+        ページを描画せずにHTMLを取得し、__NEXT_DATA__から情報を抽出
+
+        コンテキストのAPIRequestContextを使うので、User-Agent・Cookie・追加ヘッダーは
+        ブラウザでの閲覧と共通になる。
+        """
+        try:
+            response = await page.context.request.get(url, timeout=15000)
+            if not response.ok:
+                logger.debug(f"[ジョブメドレー] HTML取得失敗 ({response.status}): {url}")
+                return {}
+            html = await response.text()
+        except Exception as e:
+            logger.debug(f"[ジョブメドレー] HTML取得エラー {url}: {e}")
+            return {}
+
+        match = _RE_NEXT_DATA_SCRIPT.search(html)
+        next_data = self._load_next_data(match.group(1)) if match else None
+        if not next_data:
+            return {}
+        detail_data = self._parse_next_data(next_data)
+        if detail_data:
+            logger.info("[ジョブメドレー] __NEXT_DATA__から情報取得成功（HTML）")
+        return detail_data
+
+    def _load_next_data(self, content: Optional[str]) -> Optional[Dict]:
+        """__NEXT_DATA__スクリプトの中身をパース"""
+        if not content:
+            return None
         try:
-            script = await page.query_selector('script#__NEXT_DATA__')
-            if script:
-                content = await script.inner_text()
-                return json.loads(content)
+            return _json.loads(content)
         except Exception as e:
             logger.debug(f"[ジョブメドレー] __NEXT_DATA__取得エラー: {e}")
         return None
@@ -358,15 +521,11 @@ class JobmedleyScraper(BaseScraper):
                 # 会社名/施設名
                 result["company_name"] = facility.get("name", "")
 
-                # 住所
-                address_parts = []
-                if facility.get("prefecture"):
-                    address_parts.append(facility.get("prefecture", {}).get("name", ""))
-                if facility.get("city"):
-                    address_parts.append(facility.get("city", ""))
-                if facility.get("address"):
-                    address_parts.append(facility.get("address", ""))
-                result["address"] = "".join(address_parts)
+                # 住所（都道府県・市区町村・番地のうち値があるものをつなぐ）
+                prefecture = (facility.get("prefecture") or {}).get("name")
+                result["address"] = "".join(
+                    part for part in (prefecture, facility.get("city"), facility.get("address")) if part
+                )
 
                 # 給与
                 salaries = job_offer.get("jobOfferSalaries", [])
@@ -411,13 +570,11 @@ class JobmedleyScraper(BaseScraper):
 
         return result
 
-    async def _extract_json_ld(self, page: Page) -> Optional[Dict]:
-        """JSON-LDスクリプトからデータ取得"""
+    def _find_job_posting(self, scripts: List[str]) -> Optional[Dict]:
+        """JSON-LDスクリプトの中身からJobPostingを探す"""
         try:
-            scripts = await page.query_selector_all('script[type="application/ld+json"]')
-            for script in scripts:
-                content = await script.inner_text()
-                data = json.loads(content)
+            for content in scripts:
+                data = _json.loads(content)
                 if data.get("@type") == "JobPosting":
                     return data
         except Exception as e:
@@ -437,12 +594,13 @@ class JobmedleyScraper(BaseScraper):
             # 住所
             location = data.get("jobLocation", {}).get("address", {})
             if location:
-                addr_parts = [
-                    location.get("addressRegion", ""),
-                    location.get("addressLocality", ""),
-                    location.get("streetAddress", "")
-                ]
-                result["address"] = "".join(addr_parts)
+                result["address"] = "".join(
+                    part for part in (
+                        location.get("addressRegion"),
+                        location.get("addressLocality"),
+                        location.get("streetAddress"),
+                    ) if part
+                )
 
             # 給与
             salary = data.get("baseSalary", {})
@@ -508,6 +666,36 @@ class JobmedleyScraper(BaseScraper):
 
         return result
 
+    async def _acquire_context(self, browser: Browser) -> Tuple[BrowserContext, int]:
+        """scrape_with_detail用のコンテキストを取得（空きがあれば使い回す）"""
+        if self._pool_browser is not browser:
+            # 前回のブラウザのコンテキストはブラウザと一緒に閉じられている
+            self._context_pool = []
+            self._pool_browser = browser
+
+        if self._context_pool:
+            return self._context_pool.pop()
+
+        context = await create_stealth_context(browser)
+        # 画像・フォント・広告はコンテキスト単位でブロック（以降に開く詳細ページにも適用される）
+        await self.setup_context(context)
+        return context, 0
+
+    async def _release_context(self, browser: Browser, context: BrowserContext, uses: int, reusable: bool):
+        """
+        コンテキストを空きに戻す
+
+        エラーになったもの、使用回数が上限に達したもの、上限を超える分は閉じる。
+        """
+        if (reusable and self._pool_browser is browser and uses < self.CONTEXT_MAX_USES
+                and len(self._context_pool) < self.MAX_CONTEXTS):
+            self._context_pool.append((context, uses))
+            return
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"[ジョブメドレー] コンテキストのクローズに失敗: {e}")
+
     async def scrape_with_detail(
         self,
         browser: Browser,
@@ -528,40 +716,94 @@ class JobmedleyScraper(BaseScraper):
 
         Returns:
             詳細情報付きの求人データリスト
+
+        Note:
+            詳細取得は同じコンテキストのページプールで並行して行う。同時実行数はDETAIL_CONCURRENCYから始め、
+            取得失敗で減らし、成功が続けばDETAIL_MAX_CONCURRENCYまで増やす。失敗した詳細は1回だけ再取得する。
+            ページごとの待機は残しているので、1ページあたりのアクセス間隔は従来と同じ。
+            コンテキストは検索に成功した場合だけ呼び出し間で使い回す（ブラウザを閉じればまとめて閉じられる）。
         """
         existing_job_ids = existing_job_ids or set()
 
-        # Stealth設定でコンテキスト作成
-        stealth_config = StealthConfig()
-        context = await create_stealth_context(browser, stealth_config)
+        context, uses = await self._acquire_context(browser)
         page = await context.new_page()
+        reusable = False
 
         try:
-            # 検索実行
-            jobs = await self.search_jobs(page, keyword, area, max_pages, existing_job_ids)
+            # 検索実行（タイムアウト・エラーのあったコンテキストは使い回さずに閉じる）
+            jobs, search_ok = await self._search_pages(page, keyword, area, max_pages, existing_job_ids)
             logger.info(f"[ジョブメドレー] 検索完了: {len(jobs)} 件")
 
-            # 詳細情報を取得
-            detailed_jobs = []
-            for i, job in enumerate(jobs):
+            if not jobs:
+                reusable = search_ok
+                return []
+
+            # ページプール（検索用ページも1枚として使用し、同時実行数が増えたときに追加で開く）
+            max_pages = min(self.DETAIL_MAX_CONCURRENCY, len(jobs))
+            limiter = AdaptiveConcurrency(self.DETAIL_CONCURRENCY, maximum=max_pages)
+            extra_pages: List[Page] = []
+            page_pool: asyncio.Queue = asyncio.Queue()
+            page_pool.put_nowait(page)
+
+            opened = 1
+
+            async def get_page() -> Page:
+                nonlocal opened
+                # 使用中のページ数はlimiterで上限以下に抑えられているので、空きがなければ開き足す
+                if page_pool.empty() and opened < max_pages:
+                    new_page = await context.new_page()
+                    opened += 1
+                    extra_pages.append(new_page)
+                    return new_page
+                return await page_pool.get()
+
+            completed = 0
+
+            async def fetch_detail(index: int, job: Dict[str, Any]):
+                nonlocal completed
                 try:
-                    logger.info(f"[ジョブメドレー] 詳細取得 {i+1}/{len(jobs)}: {job['url']}")
-
-                    detail = await self.extract_detail_info(page, job["url"])
-                    job.update(detail)
-                    detailed_jobs.append(job)
+                    for attempt in range(2):
+                        await limiter.acquire()
+                        detail_page = None
+                        detail = {}
+                        try:
+                            detail_page = await get_page()
+                            logger.info(f"[ジョブメドレー] 詳細取得 {index+1}/{len(jobs)}: {job['url']}")
+
+                            detail = await self.extract_detail_info(detail_page, job["url"])
+                            job.update(detail)
+
+                            # 待機
+                            await detail_page.wait_for_timeout(random.randint(1000, 2000))
+
+                        except Exception as e:
+                            logger.error(f"[ジョブメドレー] 詳細取得エラー: {e}")
+                        finally:
+                            # ページを開けなかった場合も実行枠は必ず返す
+                            if detail_page is not None:
+                                page_pool.put_nowait(detail_page)
+                            success = bool(detail.get("title") or detail.get("company_name"))
+                            await limiter.release(success)
+
+                        if success or attempt:
+                            break
+                        # 失敗が続くほど長く待ってから1回だけ再取得する
+                        delay = min(2 ** limiter.failure_streak, self.DETAIL_RETRY_MAX_DELAY)
+                        logger.info(f"[ジョブメドレー] 詳細取得失敗、{delay}秒後に再取得 (同時実行数: {limiter.limit})")
+                        await asyncio.sleep(delay)
+                finally:
+                    completed += 1
+                    self._report_count(completed)
 
-                    self._report_count(len(detailed_jobs))
-
-                    # 待機
-                    await page.wait_for_timeout(random.randint(1000, 2000))
-
-                except Exception as e:
-                    logger.error(f"[ジョブメドレー] 詳細取得エラー: {e}")
-                    detailed_jobs.append(job)
+            try:
+                await asyncio.gather(*[fetch_detail(i, job) for i, job in enumerate(jobs)], return_exceptions=True)
+            finally:
+                for extra_page in extra_pages:
+                    await extra_page.close()
 
-            return detailed_jobs
+            reusable = search_ok
+            return jobs
 
         finally:
             await page.close()
-            await context.close()
+            await self._release_context(browser, context, uses + 1, reusable)
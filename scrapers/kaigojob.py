@@ -8,14 +8,171 @@ import asyncio
 import random
 import re
 import json
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Tuple
 from playwright.async_api import Page, Browser, TimeoutError as PlaywrightTimeoutError
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, build_prefecture_lookup
 from utils.stealth import StealthConfig, create_stealth_context
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 検索結果件数（上から順に優先）
+# 構造化データ（ItemList）の件数はNext.jsデータからも取り出す
+_RE_NUMBER_OF_ITEMS = re.compile(r'"numberOfItems"\s*:\s*(\d+)')
+_RE_RESULT_COUNTS = (
+    re.compile(r'(\d+)\s*件の求人'),
+    re.compile(r'検索結果\s*(\d+)\s*件'),
+    re.compile(r'(\d+)\s*件見つかりました'),
+    _RE_NUMBER_OF_ITEMS,
+)
+
+# 検索結果ページのNext.jsデータを1回のevaluateで取得するJS
+# Pages Routerなら__NEXT_DATA__（JSON全体）、App Routerならself.__next_fに積まれた
+# ストリーミングペイロードを連結して返す（どちらも無ければHTML全体）
+_NEXTJS_PAYLOAD_JS = """() => {
+    const nextData = document.getElementById('__NEXT_DATA__');
+    if (nextData) return {next_data: nextData.textContent, text: null};
+    const flight = (self.__next_f || []).map(e => e[1]).filter(c => typeof c === 'string').join('');
+    return {next_data: null, text: flight || document.documentElement.innerHTML};
+}"""
+
+# ペイロード文字列中の求人配列・構造化データの開始位置（配列自体はJSONデコーダで読む）
+_RE_JOBS_ARRAY_KEY = re.compile(r'"jobs"\s*:\s*(?=\[)')
+_RE_ITEM_LIST_ARRAY_KEY = re.compile(r'"itemListElement"\s*:\s*(?=\[)')
+_JSON_DECODER = json.JSONDecoder()
+
+# 求人詳細URLの求人ID
+_RE_JOB_HREF_ID = re.compile(r'/job/(\d+)')
+
+# HTMLフォールバック時に試す求人カードのセレクタ（上から順に、最初に見つかったものを使う）
+_CARD_SELECTORS = (
+    "a[href*='/job/']",
+    "[class*='JobCard']",
+    "[class*='job-card']",
+    "[class*='searchResult']",
+    "article",
+)
+
+# 求人カードのhrefとテキストを1回のevaluateでまとめて取得するJS
+_CARDS_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const cards = document.querySelectorAll(selector);
+        if (cards.length) {
+            return {selector, rows: Array.from(cards, card => [card.getAttribute('href'), card.innerText])};
+        }
+    }
+    return null;
+}"""
+
+# 詳細ページ本文の電話番号・郵便番号（ラベルなしで数字から始まり、同じ位置で
+# 両方に一致しうるため、先読みの選択肢にはまとめず個別に検索する）
+_RE_PHONE = re.compile(r'(0\d{1,4}-?\d{1,4}-?\d{3,4})')
+_RE_POSTAL_CODE = re.compile(r'〒?\s*(\d{3}-?\d{4})')
+
+# 詳細ページ本文から取り出すラベル付き項目 (出力キー, キャプチャを1つだけ含む正規表現)
+# 同じキーは先に書いたラベルを優先する
+_DETAIL_FIELDS = (
+    ("facility_type", r'施設形態[：:]\s*([^\n]+)'),
+    ("facility_type", r'サービス種別[：:]\s*([^\n]+)'),
+    ("business_content", r'事業内容[：:]\s*([^\n]+)'),
+    ("business_content", r'会社概要[：:]\s*([^\n]+)'),
+    ("job_description", r'仕事内容[：:]\s*([^\n]+(?:\n[^\n]+){0,5})'),
+    ("job_description", r'業務内容[：:]\s*([^\n]+(?:\n[^\n]+){0,5})'),
+    ("working_hours", r'勤務時間[：:]\s*([^\n]+)'),
+    ("working_hours", r'就業時間[：:]\s*([^\n]+)'),
+    ("holidays", r'休日[：:]\s*([^\n]+)'),
+    ("holidays", r'休暇[：:]\s*([^\n]+)'),
+)
+# 全項目を先読みの選択肢にまとめ、本文を1回だけ走査する（文字を消費しないので
+# 仕事内容の複数行に含まれる「勤務時間：」なども個別に検索した場合と同様に拾える）
+# 各選択肢のキャプチャは1つなので、マッチした選択肢は lastindex で分かる
+_RE_DETAIL_FIELDS = re.compile("(?=" + "|".join(pattern for _, pattern in _DETAIL_FIELDS) + ")")
+
+
+def _iter_key_values(data: Any, key: str):
+    """ネストしたdict/listを浅い順にたどり、指定キーの値を順に返す"""
+    queue = deque([data])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            if key in node:
+                yield node[key]
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
+
+
+def _decode_arrays_after(text: str, key_pattern: re.Pattern):
+    """キーの直後にあるJSON配列を順にデコードして返す（ネストした配列も正しく読む）"""
+    for match in key_pattern.finditer(text):
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, match.end())
+        except ValueError:
+            continue
+        yield value
+
+
+def _parse_nextjs_payload(next_data: Optional[str], text: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Next.jsデータから求人リストと検索結果件数を取り出す
+
+    __NEXT_DATA__はJSON全体を1回でパースしてたどる。ストリーミングペイロード・HTMLの場合は
+    "jobs" / "itemListElement" の直後の配列だけをJSONデコーダで読む。
+    """
+    if next_data:
+        data = json.loads(next_data)
+        jobs_candidates = _iter_key_values(data, "jobs")
+        item_lists = _iter_key_values(data, "itemListElement")
+        count = next((v for v in _iter_key_values(data, "numberOfItems") if isinstance(v, int)), None)
+    else:
+        text = text or ""
+        jobs_candidates = _decode_arrays_after(text, _RE_JOBS_ARRAY_KEY)
+        item_lists = _decode_arrays_after(text, _RE_ITEM_LIST_ARRAY_KEY)
+        count_match = _RE_NUMBER_OF_ITEMS.search(text)
+        count = int(count_match.group(1)) if count_match else None
+
+    # 求人オブジェクトの配列（"jobs"）を優先し、無ければ構造化データ（ItemList）を使う
+    for candidate in jobs_candidates:
+        if isinstance(candidate, list) and candidate and all(isinstance(job, dict) for job in candidate):
+            return candidate, count
+    for items in item_lists:
+        if isinstance(items, list):
+            jobs = [item['item'] for item in items if isinstance(item, dict) and isinstance(item.get('item'), dict)]
+            if jobs:
+                return jobs, count
+    return [], count
+
+
+def _scan_detail_fields(body_text: str) -> Dict[str, str]:
+    """
+    詳細ページ本文を1回走査し、出力キー → 値の辞書を作成
+
+    パターンごとに最初の出現位置を採用し、同じキーはラベルの優先順で選ぶ
+    （パターンごとに本文を検索した場合と同じ結果）。
+    """
+    fields: Dict[str, str] = {}
+    for key, pattern in (("phone", _RE_PHONE), ("postal_code", _RE_POSTAL_CODE)):
+        match = pattern.search(body_text)
+        if match:
+            fields[key] = match.group(1).strip()
+
+    first_hits: Dict[int, str] = {}
+    for match in _RE_DETAIL_FIELDS.finditer(body_text):
+        index = match.lastindex - 1
+        if index not in first_hits:
+            first_hits[index] = match.group(match.lastindex).strip()
+            if len(first_hits) == len(_DETAIL_FIELDS):
+                break
+
+    for index, (key, _) in enumerate(_DETAIL_FIELDS):
+        if key not in fields and index in first_hits:
+            fields[key] = first_hits[index]
+    if "job_description" in fields:
+        fields["job_description"] = fields["job_description"][:500]
+    return fields
+
 
 class KaigojobScraper(BaseScraper):
     """カイゴジョブエージェント用スクレイパー"""
@@ -32,6 +189,8 @@ class KaigojobScraper(BaseScraper):
         "徳島": 12000036, "香川": 12000037, "愛媛": 12000038, "高知": 12000039,
         "福岡": 12000040, "佐賀": 12000041, "長崎": 12000042, "熊本": 12000043, "大分": 12000044, "宮崎": 12000045, "鹿児島": 12000046, "沖縄": 12000047,
     }
+    # 「東京」「東京都」「京都府」などの表記ゆれをまとめて引ける表
+    _PREF_LOOKUP = build_prefecture_lookup(PREFECTURE_IDS)
 
     # 職種カテゴリID (occupation_XXXXXXXX)
     # 介護事務・医療事務 → 事務
@@ -71,9 +230,41 @@ class KaigojobScraper(BaseScraper):
         # その他は全て「介護」カテゴリ
     }
 
+    # search_jobsで同時に開く検索結果ページ数
+    SEARCH_CONCURRENCY = 3
+    # 取得済みの検索結果・詳細を保持する件数と有効期限（秒）
+    # 「介護」「ヘルパー」など別キーワードでも同じ検索URLになるため、同じ実行中の再取得を避ける
+    # 検索結果は新着が増えるので短め、詳細は1日
+    CACHE_SIZE = 2048
+    SEARCH_CACHE_TTL = 10 * 60
+    DETAIL_CACHE_TTL = 24 * 60 * 60
+
     def __init__(self):
         super().__init__(site_name="kaigojob")
         self._realtime_callback = None
+        # 検索URL → (取得時刻, (求人データのリスト, 次ページがあるか))
+        self._search_cache: "OrderedDict[str, Tuple[float, Tuple[List[Dict[str, Any]], bool]]]" = OrderedDict()
+        # 求人ID → (取得時刻, 取得済み詳細)
+        self._detail_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _cache_get(self, cache: OrderedDict, key: str, ttl: float) -> Optional[Any]:
+        """有効期限内のキャッシュ値を取得（期限切れは破棄）"""
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        fetched_at, value = cached
+        if time.monotonic() - fetched_at >= ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any):
+        """キャッシュに保存（CACHE_SIZEを超えたら古いものから破棄）"""
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
 
     def set_realtime_callback(self, callback):
         """リアルタイム件数コールバックを設定"""
@@ -86,8 +277,7 @@ class KaigojobScraper(BaseScraper):
 
     def _get_prefecture_id(self, area: str) -> Optional[int]:
         """エリア名から都道府県IDを取得"""
-        area_clean = area.rstrip("都府県")
-        return self.PREFECTURE_IDS.get(area_clean, self.PREFECTURE_IDS.get(area))
+        return self._PREF_LOOKUP.get(area)
 
     def _get_occupation_id(self, keyword: str) -> Optional[str]:
         """キーワードから職種IDを取得"""
@@ -156,54 +346,146 @@ class KaigojobScraper(BaseScraper):
         category = self._get_category(keyword)
         logger.info(f"[カイゴジョブ] 検索開始: {area} × {keyword} (カテゴリ: {category})")
 
-        for page_num in range(1, max_pages + 1):
-            url = self.generate_search_url(keyword, area, page_num)
-            logger.info(f"[カイゴジョブ] ページ{page_num}: {url}")
+        # ページURLは事前に決まるので、タブを最大SEARCH_CONCURRENCY枚開いて並行に取得する
+        # 最終ページ・0件・エラーのページが分かった時点で、それより後のページは開かない
+        concurrency = min(self.SEARCH_CONCURRENCY, max_pages)
+        context = page.context
+        extra_tabs: List[Page] = []
+        tab_pool: asyncio.Queue = asyncio.Queue()
+        tab_pool.put_nowait(page)
 
+        last_page = max_pages
+        page_results: Dict[int, List[Dict[str, Any]]] = {}
+
+        async def fetch_page(page_num: int):
+            nonlocal last_page
+            tab = await tab_pool.get()
             try:
-                response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                if page_num > last_page:
+                    return
+                try:
+                    jobs, has_next = await self._fetch_search_page(tab, keyword, area, category, page_num)
+                except Exception as e:
+                    logger.error(f"[カイゴジョブ] ページ{page_num}でエラー: {e}")
+                    jobs, has_next = [], False
 
-                if response and response.status >= 400:
-                    logger.warning(f"[カイゴジョブ] エラーステータス: {response.status}")
-                    break
+                page_results[page_num] = jobs
+                if not has_next:
+                    last_page = min(last_page, page_num)
+                    return
 
-                # React SPAなのでレンダリングを待つ
-                await page.wait_for_timeout(3000)
+                # 待機（ボット検出対策）
+                await tab.wait_for_timeout(random.randint(1500, 2500))
+            finally:
+                tab_pool.put_nowait(tab)
 
-                # 検索結果件数を取得
-                result_count = await self._get_search_result_count(page)
-                if result_count is not None:
-                    logger.info(f"[カイゴジョブ] 検索結果: {result_count}件")
-                    if result_count == 0:
-                        logger.info(f"[カイゴジョブ] 検索結果0件 - 終了")
-                        break
+        try:
+            # 開いた分だけfinallyで閉じられるよう、1枚ずつリストに追加する
+            for _ in range(concurrency - 1):
+                tab = await context.new_page()
+                extra_tabs.append(tab)
+                if hasattr(context, '_block_resources') and context._block_resources:
+                    await context._setup_route_blocking(tab)
+                tab_pool.put_nowait(tab)
+
+            await asyncio.gather(*[fetch_page(page_num) for page_num in range(1, max_pages + 1)])
+        finally:
+            for tab in extra_tabs:
+                await tab.close()
+
+        # ページ順に結合し、ページ間の重複はここで除く（取得完了順に依存しないように）
+        for page_num in range(1, last_page + 1):
+            jobs = []
+            for job in page_results.get(page_num, []):
+                job_id = job.get('job_id')
+                if job_id and job_id in seen_job_ids:
+                    continue
+                if job_id:
+                    seen_job_ids.add(job_id)
+                jobs.append(job)
 
-                # 求人カードを取得
-                jobs = await self._extract_jobs_from_page(page, keyword, area, category, seen_job_ids)
+            all_jobs.extend(jobs)
+            self._report_count(len(all_jobs))
+            logger.info(f"[カイゴジョブ] ページ{page_num}: {len(jobs)}件取得（累計: {len(all_jobs)}件）")
 
-                if not jobs:
-                    logger.info(f"[カイゴジョブ] ページ{page_num}で求人が見つかりません - 終了")
-                    break
+        logger.info(f"[カイゴジョブ] 検索完了: {len(all_jobs)}件")
+        return all_jobs
 
-                all_jobs.extend(jobs)
-                self._report_count(len(all_jobs))
-                logger.info(f"[カイゴジョブ] ページ{page_num}: {len(jobs)}件取得（累計: {len(all_jobs)}件）")
+    async def _fetch_search_page(
+        self,
+        page: Page,
+        keyword: str,
+        area: str,
+        category: str,
+        page_num: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        検索結果1ページ分を取得
 
-                # 次のページがあるか確認
-                has_next = await self._has_next_page(page)
-                if not has_next:
-                    logger.info(f"[カイゴジョブ] 最終ページに到達")
-                    break
+        SEARCH_CACHE_TTL秒以内に同じURLを取得済みなら、ページを開かずにそれを返す。
 
-                # 待機（ボット検出対策）
-                await page.wait_for_timeout(random.randint(1500, 2500))
+        Returns:
+            (求人データのリスト, 次のページがあるか)
+            ページ内の重複のみ除去する（ページ間の重複は呼び出し側で除去）
+        """
+        url = self.generate_search_url(keyword, area, page_num)
+
+        cached = self._cache_get(self._search_cache, url, self.SEARCH_CACHE_TTL)
+        if cached is not None:
+            cached_jobs, has_next = cached
+            logger.info(f"[カイゴジョブ] ページ{page_num}: 取得済み（キャッシュ）: {url}")
+            # キーワード・エリア・カテゴリは今回の検索条件に付け替える
+            return [
+                dict(job, keyword=keyword, area=area, category=category) for job in cached_jobs
+            ], has_next
+
+        jobs, has_next = await self._load_search_page(page, keyword, area, category, page_num, url)
+        # 取得できたページのみ保持する（エラー・0件は次回取り直す）
+        if jobs:
+            self._cache_put(self._search_cache, url, ([dict(job) for job in jobs], has_next))
+        return jobs, has_next
+
+    async def _load_search_page(
+        self,
+        page: Page,
+        keyword: str,
+        area: str,
+        category: str,
+        page_num: int,
+        url: str
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """検索結果ページを開いて求人データを抽出"""
+        logger.info(f"[カイゴジョブ] ページ{page_num}: {url}")
 
-            except Exception as e:
-                logger.error(f"[カイゴジョブ] ページ{page_num}でエラー: {e}")
-                break
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-        logger.info(f"[カイゴジョブ] 検索完了: {len(all_jobs)}件")
-        return all_jobs
+        if response and response.status >= 400:
+            logger.warning(f"[カイゴジョブ] エラーステータス: {response.status}")
+            return [], False
+
+        # React SPAなのでレンダリングを待つ
+        await page.wait_for_timeout(3000)
+
+        # 求人カードと検索結果件数を取得（件数はNext.jsデータにあればそこから取る）
+        jobs, result_count = await self._extract_jobs_from_page(page, keyword, area, category, set())
+        if result_count is not None:
+            logger.info(f"[カイゴジョブ] 検索結果: {result_count}件")
+
+        if not jobs:
+            # 求人が取れなかったときだけ、本文から件数を読んで0件かどうかを判定する
+            if result_count is None:
+                result_count = await self._get_search_result_count(page)
+            if result_count == 0:
+                logger.info(f"[カイゴジョブ] 検索結果0件 - 終了")
+            else:
+                logger.info(f"[カイゴジョブ] ページ{page_num}で求人が見つかりません - 終了")
+            return [], False
+
+        # 次のページがあるか確認
+        has_next = await self._has_next_page(page)
+        if not has_next:
+            logger.info(f"[カイゴジョブ] 最終ページに到達")
+        return jobs, has_next
 
     async def _get_search_result_count(self, page: Page) -> Optional[int]:
         """検索結果件数を取得"""
@@ -212,15 +494,8 @@ class KaigojobScraper(BaseScraper):
             body_text = await page.inner_text("body")
 
             # パターン: "XX件の求人" or "検索結果 XX件"
-            patterns = [
-                r'(\d+)\s*件の求人',
-                r'検索結果\s*(\d+)\s*件',
-                r'(\d+)\s*件見つかりました',
-                r'"numberOfItems"\s*:\s*(\d+)',
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, body_text)
+            for pattern in _RE_RESULT_COUNTS:
+                match = pattern.search(body_text)
                 if match:
                     return int(match.group(1))
 
@@ -236,13 +511,19 @@ class KaigojobScraper(BaseScraper):
         area: str,
         category: str,
         seen_job_ids: set
-    ) -> List[Dict[str, Any]]:
-        """ページから求人データを抽出"""
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        ページから求人データを抽出
+
+        Returns:
+            (求人データのリスト, 検索結果件数（Next.jsデータに無ければNone）)
+        """
         jobs = []
+        result_count = None
 
         try:
             # Next.jsのJSONデータから求人情報を抽出
-            json_jobs = await self._extract_from_nextjs_data(page)
+            json_jobs, result_count = await self._extract_from_nextjs_data(page)
 
             if json_jobs:
                 for job_data in json_jobs:
@@ -277,72 +558,20 @@ class KaigojobScraper(BaseScraper):
         except Exception as e:
             logger.error(f"[カイゴジョブ] 求人抽出エラー: {e}")
 
-        return jobs
+        return jobs, result_count
 
-    async def _extract_from_nextjs_data(self, page: Page) -> List[Dict[str, Any]]:
-        """Next.jsのJSONデータから求人情報を抽出"""
+    async def _extract_from_nextjs_data(self, page: Page) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Next.jsのJSONデータから求人情報と検索結果件数を抽出"""
         try:
-            # ページ内のスクリプトからJSONデータを抽出
-            script_content = await page.evaluate("""
-                () => {
-                    const scripts = document.querySelectorAll('script');
-                    for (const script of scripts) {
-                        const text = script.textContent || '';
-                        if (text.includes('__NEXT_DATA__') || text.includes('self.__next_f.push')) {
-                            return text;
-                        }
-                    }
-                    // ページ全体のHTMLからデータを探す
-                    const html = document.documentElement.innerHTML;
-                    const match = html.match(/"jobs":\s*(\[[\s\S]*?\])/);
-                    if (match) {
-                        return match[1];
-                    }
-                    return null;
-                }
-            """)
-
-            if not script_content:
-                return []
-
-            # JSONデータを抽出
-            jobs_data = []
-
-            # パターン1: "jobs": [...] 形式
-            jobs_match = re.search(r'"jobs"\s*:\s*(\[[\s\S]*?\])', script_content)
-            if jobs_match:
-                try:
-                    jobs_data = json.loads(jobs_match.group(1))
-                except json.JSONDecodeError:
-                    pass
-
-            # パターン2: ItemListElement形式（構造化データ）
-            if not jobs_data:
-                item_list_match = re.search(r'"itemListElement"\s*:\s*(\[[\s\S]*?\])', script_content)
-                if item_list_match:
-                    try:
-                        items = json.loads(item_list_match.group(1))
-                        for item in items:
-                            if 'item' in item:
-                                jobs_data.append(item['item'])
-                    except json.JSONDecodeError:
-                        pass
-
-            # パターン3: 個別の求人オブジェクトを抽出
-            if not jobs_data:
-                job_pattern = r'\{"id"\s*:\s*(\d+)[^}]*"name"\s*:\s*"([^"]*)"[^}]*\}'
-                for match in re.finditer(job_pattern, script_content):
-                    jobs_data.append({
-                        'id': int(match.group(1)),
-                        'name': match.group(2)
-                    })
+            payload = await page.evaluate(_NEXTJS_PAYLOAD_JS)
+            jobs_data, result_count = _parse_nextjs_payload(payload["next_data"], payload["text"])
 
             logger.info(f"[カイゴジョブ] Next.jsデータから {len(jobs_data)}件の求人を抽出")
-            return jobs_data
+            return jobs_data, result_count
 
         except Exception as e:
             logger.debug(f"[カイゴジョブ] Next.jsデータ抽出エラー: {e}")
-            return []
+            return [], None
 
     async def _extract_from_html(
         self,
@@ -356,82 +585,59 @@ class KaigojobScraper(BaseScraper):
         jobs = []
 
         try:
-            # 求人カードのセレクタを試行
-            card_selectors = [
-                "a[href*='/job/']",
-                "[class*='JobCard']",
-                "[class*='job-card']",
-                "[class*='searchResult']",
-                "article",
-            ]
+            # 求人カードのセレクタを順に試し、見つかったカードのhref・テキストを一括取得
+            cards = await page.evaluate(_CARDS_JS, list(_CARD_SELECTORS))
+            if cards:
+                logger.info(f"[カイゴジョブ] セレクタ {cards['selector']} で {len(cards['rows'])}件のカードを検出")
+
+                for href, text in cards['rows']:
+                    job_data = self._build_job_from_card(href, text)
+                    if not job_data:
+                        continue
+                    job_id = job_data.get('job_id', '')
+                    if job_id and job_id in seen_job_ids:
+                        continue
+                    if job_id:
+                        seen_job_ids.add(job_id)
 
-            for selector in card_selectors:
-                cards = await page.query_selector_all(selector)
-                if cards:
-                    logger.info(f"[カイゴジョブ] セレクタ {selector} で {len(cards)}件のカードを検出")
-
-                    for card in cards:
-                        try:
-                            job_data = await self._extract_card_data(card, page)
-                            if job_data and job_data.get('page_url'):
-                                job_id = job_data.get('job_id', '')
-                                if job_id and job_id in seen_job_ids:
-                                    continue
-                                if job_id:
-                                    seen_job_ids.add(job_id)
-
-                                job_data['keyword'] = keyword
-                                job_data['area'] = area
-                                job_data['category'] = category
-                                jobs.append(job_data)
-                        except Exception as e:
-                            logger.debug(f"[カイゴジョブ] カード抽出エラー: {e}")
-                            continue
-                    break
+                    job_data['keyword'] = keyword
+                    job_data['area'] = area
+                    job_data['category'] = category
+                    jobs.append(job_data)
 
         except Exception as e:
             logger.error(f"[カイゴジョブ] HTML抽出エラー: {e}")
 
         return jobs
 
-    async def _extract_card_data(self, card, page: Page) -> Optional[Dict[str, Any]]:
-        """求人カードからデータを抽出"""
-        try:
-            data = {'site': 'カイゴジョブ'}
-
-            # リンクを取得
-            href = await card.get_attribute('href')
-            if href:
-                if href.startswith('/'):
-                    href = f"https://www.kaigoagent.com{href}"
-                data['page_url'] = href
-
-                # job_idを抽出
-                match = re.search(r'/job/(\d+)', href)
-                if match:
-                    data['job_id'] = match.group(1)
-                    data['job_number'] = match.group(1)
-
-            # テキスト情報を取得
-            text = await card.inner_text()
-            lines = [l.strip() for l in text.split('\n') if l.strip()]
-
-            # 会社名、職種名などを推定
-            for i, line in enumerate(lines):
-                if not data.get('title') and len(line) > 5 and len(line) < 100:
-                    data['title'] = line
-                elif '円' in line or '万' in line:
-                    data['salary'] = line
-                elif any(word in line for word in ['市', '区', '町', '県', '都', '府']):
-                    if not data.get('location'):
-                        data['location'] = line
-
-            return data if data.get('page_url') else None
-
-        except Exception as e:
-            logger.debug(f"[カイゴジョブ] カードデータ抽出エラー: {e}")
+    def _build_job_from_card(self, href: Optional[str], text: Optional[str]) -> Optional[Dict[str, Any]]:
+        """求人カードのhref・テキストから求人データを作成（詳細リンクの無いカードはNone）"""
+        if not href:
             return None
 
+        if href.startswith('/'):
+            href = f"https://www.kaigoagent.com{href}"
+        data = {'site': 'カイゴジョブ', 'page_url': href}
+
+        # job_idを抽出
+        match = _RE_JOB_HREF_ID.search(href)
+        if match:
+            data['job_id'] = match.group(1)
+            data['job_number'] = match.group(1)
+
+        # 会社名、職種名などを推定
+        lines = [l.strip() for l in (text or '').split('\n') if l.strip()]
+        for line in lines:
+            if not data.get('title') and len(line) > 5 and len(line) < 100:
+                data['title'] = line
+            elif '円' in line or '万' in line:
+                data['salary'] = line
+            elif any(word in line for word in ['市', '区', '町', '県', '都', '府']):
+                if not data.get('location'):
+                    data['location'] = line
+
+        return data
+
     async def _has_next_page(self, page: Page) -> bool:
         """次のページがあるか確認"""
         try:
@@ -483,7 +689,27 @@ class KaigojobScraper(BaseScraper):
         return str(facilities) if facilities else ""
 
     async def extract_detail_info(self, page: Page, url: str) -> Dict[str, Any]:
-        """詳細ページから追加情報を取得"""
+        """
+        詳細ページから追加情報を取得
+
+        同じ求人IDの詳細をDETAIL_CACHE_TTL秒以内に取得済みなら、ページを開かずにそれを返す。
+        """
+        match = _RE_JOB_HREF_ID.search(url)
+        cache_key = match.group(1) if match else url
+
+        cached = self._cache_get(self._detail_cache, cache_key, self.DETAIL_CACHE_TTL)
+        if cached is not None:
+            logger.debug(f"[カイゴジョブ] 詳細取得済み（キャッシュ）: {url}")
+            return dict(cached)
+
+        detail_data = await self._fetch_detail_info(page, url)
+        # 何か取れた場合のみ保持する（失敗は次回取り直す）
+        if detail_data:
+            self._cache_put(self._detail_cache, cache_key, dict(detail_data))
+        return detail_data
+
+    async def _fetch_detail_info(self, page: Page, url: str) -> Dict[str, Any]:
+        """詳細ページを開いて情報を取得"""
         detail_data = {}
 
         try:
@@ -498,70 +724,8 @@ class KaigojobScraper(BaseScraper):
             # HTMLから追加情報を取得
             body_text = await page.inner_text("body")
 
-            # 電話番号
-            phone_match = re.search(r'(0\d{1,4}-?\d{1,4}-?\d{3,4})', body_text)
-            if phone_match:
-                detail_data['phone'] = phone_match.group(1)
-
-            # 郵便番号
-            postal_match = re.search(r'〒?\s*(\d{3}-?\d{4})', body_text)
-            if postal_match:
-                detail_data['postal_code'] = postal_match.group(1)
-
-            # 施設形態
-            facility_patterns = [
-                r'施設形態[：:]\s*([^\n]+)',
-                r'サービス種別[：:]\s*([^\n]+)',
-            ]
-            for pattern in facility_patterns:
-                match = re.search(pattern, body_text)
-                if match:
-                    detail_data['facility_type'] = match.group(1).strip()
-                    break
-
-            # 事業内容
-            business_patterns = [
-                r'事業内容[：:]\s*([^\n]+)',
-                r'会社概要[：:]\s*([^\n]+)',
-            ]
-            for pattern in business_patterns:
-                match = re.search(pattern, body_text)
-                if match:
-                    detail_data['business_content'] = match.group(1).strip()
-                    break
-
-            # 仕事内容
-            job_desc_patterns = [
-                r'仕事内容[：:]\s*([^\n]+(?:\n[^\n]+){0,5})',
-                r'業務内容[：:]\s*([^\n]+(?:\n[^\n]+){0,5})',
-            ]
-            for pattern in job_desc_patterns:
-                match = re.search(pattern, body_text)
-                if match:
-                    detail_data['job_description'] = match.group(1).strip()[:500]
-                    break
-
-            # 勤務時間
-            hours_patterns = [
-                r'勤務時間[：:]\s*([^\n]+)',
-                r'就業時間[：:]\s*([^\n]+)',
-            ]
-            for pattern in hours_patterns:
-                match = re.search(pattern, body_text)
-                if match:
-                    detail_data['working_hours'] = match.group(1).strip()
-                    break
-
-            # 休日
-            holiday_patterns = [
-                r'休日[：:]\s*([^\n]+)',
-                r'休暇[：:]\s*([^\n]+)',
-            ]
-            for pattern in holiday_patterns:
-                match = re.search(pattern, body_text)
-                if match:
-                    detail_data['holidays'] = match.group(1).strip()
-                    break
+            # 電話番号・郵便番号・施設形態・事業内容・仕事内容・勤務時間・休日
+            detail_data.update(_scan_detail_fields(body_text))
 
         except Exception as e:
             logger.error(f"[カイゴジョブ] 詳細取得エラー: {e}")
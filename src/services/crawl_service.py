@@ -451,6 +451,8 @@ class CrawlService:
                     context = await create_stealth_context(browser)
                     page = await context.new_page()
                     await StealthConfig.apply_stealth_scripts(page)
+                    if hasattr(context, '_block_resources') and context._block_resources:
+                        await context._setup_route_blocking(page)
 
                     # キーワード×地域の組み合わせでスクレイピング
                     total_combinations = len(keywords) * len(areas)
@@ -481,20 +483,20 @@ class CrawlService:
                                 logger.warning(f"Job cards not found for {keyword} in {area}, trying alternative wait...")
                                 await page.wait_for_timeout(3000)
 
-                            # カードを取得
-                            cards = await page.query_selector_all(".job_seen_beacon")
-                            logger.info(f"Found {len(cards)} job cards for {keyword} in {area}")
-
-                            for card in cards:
-                                try:
-                                    job_data = await scraper._extract_card_data(card)
-                                    if job_data:
-                                        job_data['keyword'] = keyword
-                                        job_data['area'] = area
-                                        all_jobs.append(job_data)
-                                except Exception as e:
-                                    logger.error(f"Error extracting job card: {e}")
-                                    continue
+                            # 埋め込みJSONがあればカードのDOM解析を省略する
+                            page_jobs = await scraper._extract_jobs_from_provider_data(page)
+                            if page_jobs:
+                                logger.info(f"Found {len(page_jobs)} jobs (embedded JSON) for {keyword} in {area}")
+                            else:
+                                # カードを1回のevaluateでまとめて取得
+                                cards = await scraper._read_cards(page, ".job_seen_beacon")
+                                logger.info(f"Found {len(cards)} job cards for {keyword} in {area}")
+                                page_jobs = scraper._build_jobs_from_cards(cards)
+
+                            for job_data in page_jobs:
+                                job_data['keyword'] = keyword
+                                job_data['area'] = area
+                                all_jobs.append(job_data)
 
                             # 403対策：組み合わせ間の待機
                             import random
@@ -1073,13 +1075,19 @@ class CrawlService:
                     # 検索用ページ
                     search_page = await context.new_page()
                     await StealthConfig.apply_stealth_scripts(search_page)
+                    if hasattr(context, '_block_resources') and context._block_resources:
+                        await context._setup_route_blocking(search_page)
 
                     # 詳細取得用の並列ページを作成
                     detail_pages = []
                     for _ in range(parallel_count):
                         detail_page = await context.new_page()
                         await StealthConfig.apply_stealth_scripts(detail_page)
+                        if hasattr(context, '_block_resources') and context._block_resources:
+                            await context._setup_route_blocking(detail_page)
                         detail_pages.append(detail_page)
+                    # ページごとの使用回数（一定回数で作り直してメモリの肥大化を防ぐ）
+                    detail_page_uses = [0] * len(detail_pages)
 
                     total_combinations = len(keywords) * len(areas)
                     current_idx = 0
@@ -1121,7 +1129,6 @@ class CrawlService:
                                     )
 
                                     # 並列で詳細取得
-                                    import random
                                     current_detail = [0]  # 参照渡し用
 
                                     async def fetch_detail(job, page_obj):
@@ -1134,7 +1141,6 @@ class CrawlService:
                                                 # 進捗報告
                                                 current_detail[0] += 1
                                                 self._report_detail_progress(current_detail[0], total_details, len(all_jobs) + len(jobs))
-                                                await page_obj.wait_for_timeout(random.randint(300, 600))
                                             except Exception as e:
                                                 logger.warning(f"詳細取得失敗: {job_id}: {e}")
                                         return job
@@ -1144,8 +1150,16 @@ class CrawlService:
                                         batch = jobs_to_fetch[i:i + parallel_count]
                                         tasks = []
                                         for idx, job in enumerate(batch):
-                                            page_obj = detail_pages[idx % len(detail_pages)]
-                                            tasks.append(fetch_detail(job, page_obj))
+                                            slot = idx % len(detail_pages)
+                                            if detail_page_uses[slot] >= scraper.DETAIL_PAGE_MAX_USES:
+                                                await detail_pages[slot].close()
+                                                detail_pages[slot] = await context.new_page()
+                                                await StealthConfig.apply_stealth_scripts(detail_pages[slot])
+                                                if hasattr(context, '_block_resources') and context._block_resources:
+                                                    await context._setup_route_blocking(detail_pages[slot])
+                                                detail_page_uses[slot] = 0
+                                            detail_page_uses[slot] += 1
+                                            tasks.append(fetch_detail(job, detail_pages[slot]))
 
                                         if tasks:
                                             await asyncio.gather(*tasks, return_exceptions=True)
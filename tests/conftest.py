@@ -40,8 +40,8 @@ def indeed_scraper():
 @pytest.fixture
 def hellowork_scraper():
     """ハローワークスクレイパーのインスタンス"""
-    from scrapers.hellowork import HelloWorkScraper
-    return HelloWorkScraper()
+    from scrapers.hellowork import HelloworkScraper
+    return HelloworkScraper()
 
 
 @pytest.fixture
@@ -51,6 +51,27 @@ def machbaito_scraper():
     return MachbaitoScraper()
 
 
+@pytest.fixture
+def entenshoku_scraper():
+    """エン転職スクレイパーのインスタンス"""
+    from scrapers.entenshoku import EntenshokuScraper
+    return EntenshokuScraper()
+
+
+@pytest.fixture
+def jobmedley_scraper():
+    """ジョブメドレースクレイパーのインスタンス"""
+    from scrapers.jobmedley import JobmedleyScraper
+    return JobmedleyScraper()
+
+
+@pytest.fixture
+def kaigojob_scraper():
+    """カイゴジョブスクレイパーのインスタンス"""
+    from scrapers.kaigojob import KaigojobScraper
+    return KaigojobScraper()
+
+
 # 全47都道府県リスト
 ALL_PREFECTURES = [
     "北海道",
@@ -0,0 +1,103 @@
+"""
+コンテキストプールのテスト
+ブロック・取得失敗したコンテキストが使い回されないことを実ブラウザなしで検証
+"""
+import asyncio
+
+import pytest
+
+from scrapers import indeed, jobmedley
+
+
+class _FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+
+
+class _FakePage:
+    def __init__(self, status: int):
+        self.status = status
+        self.closed = False
+
+    async def goto(self, url, **kwargs):
+        if self.status is None:
+            raise RuntimeError("navigation failed")
+        return _FakeResponse(self.status)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, status: int):
+        self.status = status
+        self.closed = False
+        self._block_resources = False
+
+    async def new_page(self):
+        return _FakePage(self.status)
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class TestIndeedContextPool:
+    """IndeedScraper.scrape_single_pageのコンテキストプールのテスト"""
+
+    @pytest.fixture
+    def run_single_page(self, monkeypatch, indeed_scraper):
+        """指定したステータスを返すページで1ページ分を実行し、使ったコンテキストを返す"""
+        async def no_sleep(seconds):
+            pass
+
+        async def no_stealth(page):
+            pass
+
+        monkeypatch.setattr(indeed.asyncio, "sleep", no_sleep)
+        monkeypatch.setattr(indeed.StealthConfig, "apply_stealth_scripts", staticmethod(no_stealth))
+
+        def run(status: int) -> _FakeContext:
+            context = _FakeContext(status)
+
+            async def fake_create_stealth_context(browser, **kwargs):
+                return context
+
+            monkeypatch.setattr(indeed, "create_stealth_context", fake_create_stealth_context)
+            browser = object()
+            jobs = asyncio.run(indeed_scraper.scrape_single_page(browser, "営業", "東京", 1))
+            assert jobs == []
+            return context
+
+        return run
+
+    def test_blocked_context_is_closed(self, run_single_page, indeed_scraper):
+        """403が返ったコンテキストはプールに戻さず閉じるか"""
+        context = run_single_page(403)
+        assert context.closed
+        assert indeed_scraper._context_pool == []
+
+    def test_healthy_context_is_pooled(self, run_single_page, indeed_scraper):
+        """正常に応答したコンテキスト（404は求人なし扱い）はプールに戻すか"""
+        context = run_single_page(404)
+        assert not context.closed
+        assert indeed_scraper._context_pool == [context]
+
+
+class TestJobmedleyContextPool:
+    """JobmedleyScraper.scrape_with_detailのコンテキストプールのテスト"""
+
+    def test_failed_search_context_is_closed(self, monkeypatch, jobmedley_scraper):
+        """検索でエラーになったコンテキストはプールに戻さず閉じるか"""
+        context = _FakeContext(None)
+
+        async def fake_create_stealth_context(browser, **kwargs):
+            return context
+
+        monkeypatch.setattr(jobmedley, "create_stealth_context", fake_create_stealth_context)
+        jobs = asyncio.run(jobmedley_scraper.scrape_with_detail(object(), "営業", "東京", max_pages=1))
+        assert jobs == []
+        assert context.closed
+        assert jobmedley_scraper._context_pool == []
@@ -109,6 +109,66 @@ class TestHelloworkMappings:
             assert len(code) == 3 or len(code) == 2, f"{keyword}のコード '{code}' が不正"
             assert code.isdigit(), f"{keyword}のコード '{code}' が数字ではない"
 
+    @pytest.mark.parametrize("keyword,expected_code", [
+        ("介護", "050"),  # 完全一致
+        ("訪問介護スタッフ", "051"),  # 「介護」より「訪問介護」を優先
+        ("施工管理技士", "008"),  # 「管理」「施工」より「施工管理」を優先
+        ("ネットワークエンジニア募集", "010"),
+        ("宇宙飛行士", None),
+    ])
+    def test_job_category_code_prefers_longest_keyword(self, hellowork_scraper, keyword, expected_code):
+        """部分一致では最長の登録キーワードが採用されるか"""
+        assert hellowork_scraper._get_job_category_code(keyword) == expected_code
+
+    @pytest.mark.parametrize("area,expected_code", [
+        ("東京都", "13"),
+        ("東京", "13"),
+        ("京都", "26"),  # 「東京都」に含まれるが先頭一致の「京都府」を優先
+        ("鹿児島県鹿児島市", "46"),
+        ("全国", None),
+    ])
+    def test_prefecture_code_partial_match(self, hellowork_scraper, area, expected_code):
+        """エリア名の部分一致で都道府県コードが取得できるか"""
+        assert hellowork_scraper._get_prefecture_code(area) == expected_code
+
+    def test_classify_many(self):
+        """一括分類が1件ずつの判定と同じ結果になるか（該当なしは空文字）"""
+        from scrapers.hellowork import classify_many
+        assert classify_many(["介護", "訪問介護スタッフ", "宇宙飛行士", "介護"]) == ["050", "051", "", "050"]
+
+
+class TestJobmedleyMappings:
+    """ジョブメドレーのマッピングテスト"""
+
+    @pytest.mark.parametrize("area,expected_id", [
+        ("東京", 13),
+        ("東京都", 13),
+        ("京都", 26),
+        ("京都府", 26),
+        ("北海道", 1),
+        ("神奈川県", 14),
+        ("全国", None),
+    ])
+    def test_prefecture_id_with_suffix(self, jobmedley_scraper, area, expected_id):
+        """接尾辞（都・府・県）の有無にかかわらず都道府県IDが取得できるか"""
+        assert jobmedley_scraper._get_prefecture_id(area) == expected_id
+
+
+class TestKaigojobMappings:
+    """カイゴジョブのマッピングテスト"""
+
+    @pytest.mark.parametrize("area,expected_id", [
+        ("東京", 12000026),
+        ("東京都", 12000026),
+        ("京都府", 12000013),
+        ("大阪府", 12000027),
+        ("北海道", 12000001),
+        ("全国", None),
+    ])
+    def test_prefecture_id_with_suffix(self, kaigojob_scraper, area, expected_id):
+        """接尾辞（都・府・県）の有無にかかわらず都道府県IDが取得できるか"""
+        assert kaigojob_scraper._get_prefecture_id(area) == expected_id
+
 
 class TestBaitoruMappings:
     """バイトルのマッピングテスト"""
@@ -0,0 +1,170 @@
+"""
+テキスト解析テスト
+各スクレイパーのブラウザに依存しない解析ヘルパーを検証
+"""
+import pytest
+
+
+class TestEntenshokuParsing:
+    """エン転職の解析テスト"""
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("株式会社サンプル／営業スタッフ", ("株式会社サンプル", "営業スタッフ")),
+        ("医療法人テスト会 ／ 看護師", ("医療法人テスト会", "看護師")),
+        ("営業／未経験歓迎", (None, "営業／未経験歓迎")),
+        ("法人営業スタッフ", (None, "法人営業スタッフ")),
+    ])
+    def test_split_company_title(self, entenshoku_scraper, raw, expected):
+        """「会社名／職種」形式が法人格の有無で分離されるか"""
+        assert entenshoku_scraper._split_company_title(raw) == expected
+
+    @pytest.mark.parametrize("base_salary,expected", [
+        ({"value": {"minValue": 250000, "maxValue": 300000, "unitText": "MONTH"}}, "月給250,000円～300,000円"),
+        ({"value": {"minValue": "4000000", "unitText": "YEAR"}}, "年収4,000,000円～"),
+        ({"value": {"value": 1200, "unitText": "HOUR"}}, "時給1,200円"),
+        ({"value": {"unitText": "MONTH"}}, ""),
+        (None, ""),
+    ])
+    def test_format_base_salary(self, entenshoku_scraper, base_salary, expected):
+        """JSON-LDのbaseSalaryが給与文字列に整形されるか"""
+        assert entenshoku_scraper._format_base_salary(base_salary) == expected
+
+    @pytest.mark.parametrize("card_text,expected", [
+        ("営業スタッフ募集中です\nアルバイト・パート／正社員登用あり", "正社員"),
+        ("営業スタッフ募集中です\nパート\n正社員", "パート"),
+        ("営業スタッフ募集中です\n業務委託・契約社員", "契約社員"),
+    ])
+    def test_parse_card_employment_type(self, entenshoku_scraper, card_text, expected):
+        """雇用形態は最初に該当する行から、行内は正社員→契約社員→…の優先順で選ばれるか"""
+        data = entenshoku_scraper._parse_card_data("123", "/desc_123/", card_text)
+        assert data["employment_type"] == expected
+
+    def test_scan_detail_sections(self):
+        """仕事内容の途中にある給与・雇用形態・休日も各項目として拾えるか"""
+        from scrapers.entenshoku import _scan_detail_sections
+        body_text = (
+            "仕事内容：法人営業\n"
+            "給与：月給25万円\n"
+            "雇用形態：正社員\n"
+            "休日：土日祝\n"
+            "福利厚生：社会保険完備\n"
+            "応募資格：普通免許\n"
+            "募集要項"
+        )
+        sections = _scan_detail_sections(body_text)
+        assert sections["job_description"].startswith("法人営業\n給与：月給25万円")
+        assert sections["salary"] == "月給25万円"
+        assert sections["employment_type"] == "正社員"
+        assert sections["holidays"] == "土日祝"
+        assert sections["qualifications"] == "普通免許"
+
+
+class TestIndeedParsing:
+    """Indeedの解析テスト"""
+
+    def test_build_job_from_provider_record(self, indeed_scraper):
+        """埋め込みJSONのレコードがカード解析と同じキーの辞書になるか"""
+        record = {
+            "jobkey": "0123abcd4567ef89",
+            "title": "介護スタッフ ",
+            "company": "株式会社サンプル",
+            "formattedLocation": "東京都 新宿区",
+            "salarySnippet": {"text": "月給 25万円 ~ 30万円"},
+        }
+        assert indeed_scraper._build_job_from_provider_record(record) == {
+            "title": "介護スタッフ",
+            "company_name": "株式会社サンプル",
+            "location": "東京都 新宿区",
+            "salary": "月給 25万円 ~ 30万円",
+            "page_url": "https://jp.indeed.com/viewjob?jk=0123abcd4567ef89",
+            "job_number": "0123abcd4567ef89",
+            "site": "Indeed",
+        }
+
+    def test_build_job_from_provider_record_without_title(self, indeed_scraper):
+        """タイトルのないレコードは除外されるか"""
+        assert indeed_scraper._build_job_from_provider_record({"jobkey": "abc"}) is None
+
+    def test_build_job_from_card(self, indeed_scraper):
+        """カードのテキストから勤務地・給与・求人IDが抽出されるか"""
+        card_text = "介護スタッフ\n株式会社サンプル\n東京都 新宿区\n月給 25万円 ~ 30万円"
+        job = indeed_scraper._build_job_from_card(
+            "介護スタッフ", "株式会社サンプル", card_text, "/rc/clk?jk=0123abcd&from=serp"
+        )
+        assert job["location"] == "東京都 新宿区"
+        assert job["salary"] == "月給 25万円 ~ 30万円"
+        assert job["page_url"] == "https://jp.indeed.com/rc/clk?jk=0123abcd&from=serp"
+        assert job["job_number"] == "0123abcd"
+
+
+class TestJobmedleyParsing:
+    """ジョブメドレーの__NEXT_DATA__ / JSON-LD解析テスト"""
+
+    def test_parse_next_data_address_skips_missing_parts(self, jobmedley_scraper):
+        """住所は値のある部分だけをつなぐか"""
+        data = {"props": {"pageProps": {
+            "jobOffer": {"title": "介護職"},
+            "facility": {"name": "施設A", "prefecture": {"name": "東京都"}, "city": None, "address": "新宿1-1"},
+        }}}
+        result = jobmedley_scraper._parse_next_data(data)
+        assert result["company_name"] == "施設A"
+        assert result["address"] == "東京都新宿1-1"
+
+    def test_parse_json_ld_address_skips_missing_parts(self, jobmedley_scraper):
+        """JSON-LDの住所も欠けた項目を飛ばしてつなぐか"""
+        data = {"jobLocation": {"address": {"addressRegion": "大阪府", "addressLocality": None, "streetAddress": "北区1-1"}}}
+        assert jobmedley_scraper._parse_json_ld(data)["address"] == "大阪府北区1-1"
+
+
+class TestKaigojobParsing:
+    """カイゴジョブの詳細ページ解析テスト"""
+
+    def test_scan_detail_fields(self):
+        """1回の走査で各項目が取れ、同じ項目はラベルの優先順で選ばれるか"""
+        from scrapers.kaigojob import _scan_detail_fields
+        body_text = (
+            "〒160-0023 東京都新宿区西新宿1-1\n"
+            "TEL 03-1234-5678\n"
+            "サービス種別：特養\n"
+            "施設形態：有料老人ホーム\n"
+            "仕事内容：入浴介助\n"
+            "勤務時間：9:00〜18:00\n"
+            "休日：土日祝\n"
+        )
+        fields = _scan_detail_fields(body_text)
+        assert fields["postal_code"] == "160-0023"
+        assert fields["phone"] == "03-1234-5678"
+        assert fields["facility_type"] == "有料老人ホーム"
+        assert fields["job_description"].startswith("入浴介助\n勤務時間：9:00〜18:00")
+        assert fields["working_hours"] == "9:00〜18:00"
+        assert fields["holidays"] == "土日祝"
+        assert "business_content" not in fields
+
+    def test_scan_detail_fields_postal_before_phone(self):
+        """郵便番号と電話番号が同じ位置から一致しうる場合も郵便番号を取りこぼさないか"""
+        from scrapers.kaigojob import _scan_detail_fields
+        fields = _scan_detail_fields("郵便番号:060-0001\nTEL:03-1234-5678")
+        assert fields["postal_code"] == "060-0001"
+
+    def test_parse_nextjs_payload_next_data(self):
+        """__NEXT_DATA__からネストした求人配列と件数が取れるか"""
+        import json
+        from scrapers.kaigojob import _parse_nextjs_payload
+        next_data = json.dumps({"props": {"pageProps": {
+            "search": {"numberOfItems": 2, "jobs": [
+                {"id": 1, "name": "介護職", "employment_types": ["正社員", "パート"]},
+                {"id": 2, "name": "ケアドライバー", "qualifications": []},
+            ]},
+        }}})
+        jobs, count = _parse_nextjs_payload(next_data, None)
+        assert [job["id"] for job in jobs] == [1, 2]
+        assert jobs[0]["employment_types"] == ["正社員", "パート"]
+        assert count == 2
+
+    def test_parse_nextjs_payload_streamed(self):
+        """ストリーミングペイロードでも配列の終わりを正しく判定できるか"""
+        from scrapers.kaigojob import _parse_nextjs_payload
+        text = '3:["$","div",null,{"jobs":[{"id":5,"facilities":["特養"]},{"id":6,"facilities":[]}],"page":1}]'
+        jobs, count = _parse_nextjs_payload(None, text)
+        assert [job["id"] for job in jobs] == [5, 6]
+        assert count is None
@@ -0,0 +1,131 @@
+"""
+レート制限テスト
+utils.rate_limit のリミッターを実ブラウザなしで検証
+"""
+import asyncio
+
+import pytest
+
+from utils import rate_limit
+from utils.rate_limit import AdaptiveConcurrency, TokenBucket
+
+
+class _FakeClock:
+    """time.monotonic / asyncio.sleep の代わりに使う進めるだけの時計"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        self.now += seconds
+
+
+async def _run(limiter: AdaptiveConcurrency, results):
+    """結果の並びどおりに実行枠の取得・返却を繰り返す"""
+    for success in results:
+        await limiter.acquire()
+        await limiter.release(success)
+
+
+class TestTokenBucket:
+    """TokenBucketのテスト"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = _FakeClock()
+        monkeypatch.setattr(rate_limit, "time", clock)
+        monkeypatch.setattr(rate_limit.asyncio, "sleep", clock.sleep)
+        return clock
+
+    @staticmethod
+    def _acquire_times(bucket: TokenBucket, clock: _FakeClock, count: int):
+        async def scenario():
+            times = []
+            for _ in range(count):
+                await bucket.acquire()
+                times.append(clock.now)
+            return times
+        return asyncio.run(scenario())
+
+    def test_limits_to_rate(self, clock):
+        """rate件/秒の間隔でしかトークンを取得できないか"""
+        bucket = TokenBucket(rate=2.0)
+        assert self._acquire_times(bucket, clock, 4) == pytest.approx([0.0, 0.5, 1.0, 1.5])
+
+    def test_burst(self, clock):
+        """burst件までは待たずに取得でき、その後はrateで補充されるか"""
+        bucket = TokenBucket(rate=1.0, burst=3)
+        assert self._acquire_times(bucket, clock, 4) == pytest.approx([0.0, 0.0, 0.0, 1.0])
+
+    def test_refills_while_idle(self, clock):
+        """空いている間に補充されたトークンは待たずに使えるか"""
+        bucket = TokenBucket(rate=1.0)
+        self._acquire_times(bucket, clock, 1)
+        clock.now += 5.0
+        assert self._acquire_times(bucket, clock, 2) == pytest.approx([5.0, 6.0])
+
+    @pytest.mark.parametrize("rate,burst", [(0, 1), (-1.0, 1), (1.0, 0)])
+    def test_invalid_arguments(self, rate, burst):
+        """rate<=0・burst<1は作成時にエラーになるか"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, burst=burst)
+
+
+class TestAdaptiveConcurrency:
+    """AdaptiveConcurrencyのテスト"""
+
+    def test_initial_is_clamped(self):
+        """初期値がminimum〜maximumの範囲に収まるか"""
+        assert AdaptiveConcurrency(20, minimum=1, maximum=8).limit == 8
+        assert AdaptiveConcurrency(0, minimum=2, maximum=8).limit == 2
+
+    def test_shrinks_on_failure(self):
+        """失敗のたびに上限が1つ減り、連続失敗回数が増えるか"""
+        limiter = AdaptiveConcurrency(4, minimum=1, maximum=8)
+        asyncio.run(_run(limiter, [False, False]))
+        assert limiter.limit == 2
+        assert limiter.failure_streak == 2
+
+    def test_does_not_shrink_below_minimum(self):
+        """失敗が続いても上限がminimumを下回らないか"""
+        limiter = AdaptiveConcurrency(3, minimum=2, maximum=8)
+        asyncio.run(_run(limiter, [False] * 5))
+        assert limiter.limit == 2
+
+    def test_grows_after_success_streak(self):
+        """成功がgrow_after回続いたら上限が1つ増え、失敗で連続回数がリセットされるか"""
+        limiter = AdaptiveConcurrency(2, maximum=8, grow_after=3)
+        asyncio.run(_run(limiter, [True, True, False, True, True]))
+        assert limiter.limit == 1
+        assert limiter.failure_streak == 0
+        asyncio.run(_run(limiter, [True]))
+        assert limiter.limit == 2
+
+    def test_does_not_grow_above_maximum(self):
+        """成功が続いても上限がmaximumを超えないか"""
+        limiter = AdaptiveConcurrency(2, maximum=3, grow_after=2)
+        asyncio.run(_run(limiter, [True] * 10))
+        assert limiter.limit == 3
+
+    def test_acquire_waits_at_limit(self):
+        """上限に達している間は次の取得が待たされるか"""
+        async def scenario():
+            limiter = AdaptiveConcurrency(1, maximum=1)
+            await limiter.acquire()
+            waiter = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0)
+            blocked = not waiter.done()
+            await limiter.release(True)
+            await asyncio.wait_for(waiter, timeout=1)
+            return blocked
+
+        assert asyncio.run(scenario())
+
+    def test_release_before_acquire(self):
+        """acquire前のreleaseは分かりやすいエラーになるか"""
+        limiter = AdaptiveConcurrency(2)
+        with pytest.raises(RuntimeError):
+            asyncio.run(limiter.release(True))
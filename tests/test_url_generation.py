@@ -225,6 +225,32 @@ class TestMachbaitoUrlGeneration:
         assert "prefectures13" in url2
 
 
+class TestEntenshokuUrlGeneration:
+    """エン転職URL生成テスト"""
+
+    def test_category_search(self, entenshoku_scraper):
+        """職種コードがある場合occupationが含まれるか"""
+        url = entenshoku_scraper.generate_search_url("営業", "北海道", 1)
+        params = parse_qs(urlparse(url).query)
+        assert params["areaid"] == ["11"]
+        assert "occupation" in params
+        assert params["pagenum"] == ["1"]
+
+    def test_area_only_fallback(self, entenshoku_scraper):
+        """未知のキーワードはエリアのみで検索されるか"""
+        url = entenshoku_scraper.generate_search_url("特殊なキーワード123", "北海道", 1)
+        assert "occupation" not in url
+        assert "areaid=11" in url
+
+    def test_pagination_reuses_base(self, entenshoku_scraper):
+        """同じ条件のページ違いはpagenumだけが変わるか"""
+        url_page1 = entenshoku_scraper.generate_search_url("営業", "北海道", 1)
+        url_page3 = entenshoku_scraper.generate_search_url("営業", "北海道", 3)
+        assert url_page1.endswith("pagenum=1")
+        assert url_page3 == url_page1[:-1] + "3"
+        assert entenshoku_scraper._current_search_area == "北海道"
+
+
 class TestAllScrapersUrlValidity:
     """全スクレイパーのURL有効性テスト"""
 
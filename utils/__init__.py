@@ -5,6 +5,7 @@ from .proxy import ProxyRotator, ProxyConfig, proxy_rotator, load_proxies_from_f
 from .performance import PerformanceMonitor, PerformanceMetrics, Benchmark
 from .stealth import StealthConfig, create_stealth_context
 from .page_utils import PageUtils
+from .rate_limit import TokenBucket, AdaptiveConcurrency
 
 __all__ = [
     'async_retry',
@@ -23,4 +24,6 @@ __all__ = [
     'StealthConfig',
     'create_stealth_context',
     'PageUtils',
+    'TokenBucket',
+    'AdaptiveConcurrency',
 ]
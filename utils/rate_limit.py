@@ -0,0 +1,100 @@
+"""
+リクエスト間隔・同時実行数の制御（トークンバケット・適応的リミッター）
+"""
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    非同期用トークンバケット
+
+    並列のワーカー間で共有し、全体のリクエスト数を rate 件/秒 に抑える。
+    ワーカーごとの固定スリープと違い、空いている間は待たずに進める。
+
+    使用例:
+    bucket = TokenBucket(rate=2.0)
+    await bucket.acquire()
+    await page.goto(url)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1: {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # Python 3.9ではLockが作成時のイベントループに紐づくため、初回のacquireで作成する
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self):
+        """トークンを1つ取得（足りなければ補充されるまで待機）"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AdaptiveConcurrency:
+    """
+    非同期用の同時実行数リミッター（失敗で縮小・成功が続けば拡大）
+
+    失敗（タイムアウト・取得失敗）のたびに同時実行数の上限を1つ減らし、
+    成功が grow_after 回続いたら1つ増やす。上限は minimum〜maximum の範囲に収める。
+    サイト側が詰まり始めたときにタイムアウトが連鎖するのを防ぐ。
+
+    使用例:
+    limiter = AdaptiveConcurrency(initial=4, maximum=8)
+    await limiter.acquire()
+    ok = await fetch()
+    await limiter.release(ok)
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 16, grow_after: int = 10):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.grow_after = grow_after
+        self.limit = max(minimum, min(initial, maximum))
+        # 連続失敗回数（呼び出し側のバックオフ時間の計算に使う）
+        self.failure_streak = 0
+        self._success_streak = 0
+        self._active = 0
+        # TokenBucketと同じく、初回のacquireで作成する
+        self._condition: Optional[asyncio.Condition] = None
+
+    async def acquire(self):
+        """実行枠を1つ取得（上限に達していれば空くまで待機）"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self, success: bool):
+        """実行枠を返し、結果に応じて上限を調整"""
+        if self._condition is None:
+            raise RuntimeError("release() called before acquire()")
+        async with self._condition:
+            self._active -= 1
+            if success:
+                self.failure_streak = 0
+                self._success_streak += 1
+                if self._success_streak >= self.grow_after and self.limit < self.maximum:
+                    self.limit += 1
+                    self._success_streak = 0
+            else:
+                self.failure_streak += 1
+                self._success_streak = 0
+                self.limit = max(self.minimum, self.limit - 1)
+            self._condition.notify_all()
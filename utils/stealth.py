@@ -18,6 +18,51 @@ REAL_USER_AGENTS = [
 ]
 
 
+# 不要リソースとしてブロックするリソースタイプ・拡張子・広告/トラッキングURL
+# stylesheetはブロックしない（CSSクラス名のセレクタに必要）
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+BLOCKED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico',
+                      '.mp4', '.webm', '.avi', '.mov', '.mp3', '.wav',
+                      '.woff', '.woff2', '.ttf', '.otf', '.eot')
+BLOCKED_DOMAINS = ('google-analytics.com', 'googletagmanager.com',
+                   'doubleclick.net', 'facebook.net', 'twitter.com/i/')
+
+
+async def block_resources_handler(route):
+    """不要なリソースのリクエストを中断するルートハンドラ"""
+    request = route.request
+    url = request.url.lower()
+
+    # リソースタイプでブロック
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+
+    # 拡張子でブロック
+    for ext in BLOCKED_EXTENSIONS:
+        if url.endswith(ext) or f'{ext}?' in url:
+            await route.abort()
+            return
+
+    # 広告・トラッキングURLをブロック
+    for domain in BLOCKED_DOMAINS:
+        if domain in url:
+            await route.abort()
+            return
+
+    await route.continue_()
+
+
+async def setup_route_blocking(target):
+    """
+    不要なリソースをブロックするルートを設定
+
+    targetはPageでもBrowserContextでもよい。Pageのルートはコンテキストのルートより
+    優先されるため、同じページに両方を設定する必要はない。
+    """
+    await target.route('**/*', block_resources_handler)
+
+
 class StealthConfig:
     """Stealth設定マネージャー"""
 
@@ -158,42 +203,6 @@ async def create_stealth_context(browser, user_agent: str = None, proxy: Dict =
 
     # 画像・動画・フォント等のリソースをブロック（軽量化）
     if block_resources:
-        async def setup_route_blocking(page: Page):
-            """不要なリソースをブロックするルートを設定"""
-            # stylesheetはブロックしない（CSSクラス名のセレクタに必要）
-            blocked_types = {'image', 'media', 'font'}
-            blocked_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico',
-                                  '.mp4', '.webm', '.avi', '.mov', '.mp3', '.wav',
-                                  '.woff', '.woff2', '.ttf', '.otf', '.eot'}
-
-            async def block_resources_handler(route):
-                request = route.request
-                resource_type = request.resource_type
-                url = request.url.lower()
-
-                # リソースタイプでブロック
-                if resource_type in blocked_types:
-                    await route.abort()
-                    return
-
-                # 拡張子でブロック
-                for ext in blocked_extensions:
-                    if url.endswith(ext) or f'{ext}?' in url:
-                        await route.abort()
-                        return
-
-                # 広告・トラッキングURLをブロック
-                blocked_domains = ['google-analytics.com', 'googletagmanager.com',
-                                   'doubleclick.net', 'facebook.net', 'twitter.com/i/']
-                for domain in blocked_domains:
-                    if domain in url:
-                        await route.abort()
-                        return
-
-                await route.continue_()
-
-            await page.route('**/*', block_resources_handler)
-
         # 新しいページが作成されたときにルートを設定
         async def on_page_created(page: Page):
             await setup_route_blocking(page)